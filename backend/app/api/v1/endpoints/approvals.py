@@ -3,37 +3,94 @@ MedTech Data Platform - Approval API Endpoints
 API-Endpunkte für Zulassungen und Registrierungen
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
+from enum import Enum
 import logging
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.validation import DataValidator, ValidationLevel, BatchValidator
+from app.core.validation_cache import get_validation_cache
+from app.core.source_rules import source_rule_registry
+from app.core.pagination import CountStrategy, approval_counts
+from app.core.http_cache import cached_response
 from app.models.approval import Approval, ApprovalType, ApprovalStatus, DeviceClass, Priority
 from app.models.data_source import DataSource
 from app.schemas.approval import (
     ApprovalCreate, 
     ApprovalUpdate, 
     ApprovalResponse, 
-    ApprovalListResponse,
     ApprovalSearchRequest,
     ApprovalStatistics
 )
+from app.schemas.approval_pagination import ApprovalPageResponse
+from app.schemas.approval_bulk import ApprovalBulkUpdateRequest, ApprovalBulkUpdateResponse
+from app.schemas.approval_search import ApprovalNameMatch, ApprovalNameMatchResponse
+from app.schemas.approval_fields import DEFAULT_LIST_FIELDS, resolve_fields, serialize_item, serialize_page
+from app.schemas.approval_relations import RELATION_SCHEMAS
 from app.services.approval_service import ApprovalService
+from app.services.approval_bulk_service import ApprovalBulkService
+from app.services.approval_statistics_service import ApprovalStatisticsService
+from app.services.approval_export_service import ApprovalExportService, gzip_chunks
+from app.services.approval_task_queue import ApprovalTaskQueue, TASK_POST_CREATE, TASK_POST_UPDATE
+from app.services.approval_score import persist_score
+from app.services.approval_query_service import (
+    ApprovalQueryService,
+    SearchMode,
+    NAME_SIMILAR_FILTER,
+    NAME_SIMILARITY_FIELDS,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    EXPIRES_BEFORE_FILTER,
+    EXPIRES_WITHIN_DAYS_FILTER
+)
 from app.core.auth import get_current_user
 from app.models.user import User
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+def _page_response(
+    request: Optional[Request],
+    approvals: List[Approval],
+    projection: Optional[Tuple[str, ...]],
+    **page: Any
+) -> Response:
+    """
+    Seitenantwort; mit Feldauswahl nur die gewählten Felder je Eintrag,
+    direkt aus den Ergebniszeilen serialisiert (ohne from_orm und Validierung).
+    Mit request bedingt (ETag aus dem serialisierten Körper, ggf. 304)
+    """
+    if projection is None:
+        body = ApprovalPageResponse(
+            items=[ApprovalResponse.from_orm(approval) for approval in approvals],
+            **page
+        ).model_dump_json().encode("utf-8")
+    else:
+        body = serialize_page(projection, approvals, **page)
+    
+    if request is None:
+        return Response(content=body, media_type="application/json")
+    return cached_response(request, body)
+
+async def _page_relations(query_service: ApprovalQueryService, approvals: List[Any]) -> Dict[str, Any]:
+    """Mit include= angeforderte Beziehungen der Seite als Antwortmodelle"""
+    relations = await query_service.get_relations(approvals)
+    return {
+        name: {
+            approval_id: [RELATION_SCHEMAS[name].model_validate(item) for item in items]
+            for approval_id, items in grouped.items()
+        }
+        for name, grouped in relations.items()
+    }
+
 @router.post("/", response_model=ApprovalResponse, status_code=status.HTTP_201_CREATED)
 async def create_approval(
     approval_data: ApprovalCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -47,8 +104,13 @@ async def create_approval(
     - **authority**: Zulassungsbehörde
     """
     try:
-        # Datenvalidierung
-        validator = DataValidator(ValidationLevel.STRICT)
+        # Datenvalidierung mit den Regeln der Datenquelle
+        source_plans = await source_rule_registry.load_plans(db, [approval_data.source_id], ValidationLevel.STRICT)
+        validator = DataValidator(
+            ValidationLevel.STRICT,
+            cache=get_validation_cache(),
+            approval_plan=source_plans.get(str(approval_data.source_id))
+        )
         validation_result = await validator.validate_approval(approval_data.dict())
         
         if not validation_result.is_valid:
@@ -61,21 +123,23 @@ async def create_approval(
                 }
             )
         
+        # Nachgelagerte Aufgaben über die Warteschlange (separate Worker-Prozesse),
+        # eingestellt im Flush der Anlage und mit ihr committet
+        ApprovalTaskQueue(db).enqueue_on_create(TASK_POST_CREATE, validation_result.model_dump(mode="json"))
+        
+        # Score als Basis späterer Teilvalidierungen mit der Anlage speichern
+        persist_score(db, validation_result.score)
+        
         # Service aufrufen
         approval_service = ApprovalService(db)
         approval = await approval_service.create_approval(approval_data, current_user.id)
-        
-        # Background-Tasks
-        background_tasks.add_task(
-            approval_service.post_create_tasks,
-            approval.id,
-            validation_result
-        )
+        approval_counts.invalidate()
         
         logger.info(f"Created approval {approval.id} by user {current_user.id}")
         
-        return ApprovalResponse.from_orm(approval)
-        
+        # Neu laden, damit die Antwort die zurückgestellten Anzahlen enthält
+        return ApprovalResponse.from_orm(await ApprovalQueryService(db).get_approval(approval.id))
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -85,61 +149,139 @@ async def create_approval(
             detail="Failed to create approval"
         )
 
-@router.get("/", response_model=ApprovalListResponse)
+@router.get("/", response_model=ApprovalPageResponse)
 async def get_approvals(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from next_cursor (replaces skip)"),
     approval_type: Optional[ApprovalType] = Query(None, description="Filter by approval type"),
-    status: Optional[ApprovalStatus] = Query(None, description="Filter by status"),
+    status_filter: Optional[ApprovalStatus] = Query(None, alias="status", description="Filter by status"),
     region: Optional[str] = Query(None, description="Filter by region"),
     authority: Optional[str] = Query(None, description="Filter by authority"),
     device_class: Optional[DeviceClass] = Query(None, description="Filter by device class"),
     priority: Optional[Priority] = Query(None, description="Filter by priority"),
+    name_similar: Optional[str] = Query(None, min_length=3, description="Fuzzy match on applicant or manufacturer name"),
+    expires_before: Optional[date] = Query(None, description="Only approvals with expiry_date before this date"),
+    expires_within_days: Optional[int] = Query(None, ge=0, description="Only approvals expiring between today and today + n days"),
     search: Optional[str] = Query(None, description="Search in title and description"),
+    search_mode: SearchMode = Query(SearchMode.SIMPLE, description="simple (substring) or fulltext (ranked web search syntax)"),
+    highlight: bool = Query(False, description="Return highlighted snippets for full-text matches"),
     sort_by: str = Query("created_at", description="Field to sort by"),
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
+    count: CountStrategy = Query(CountStrategy.EXACT, description="How to compute total: exact, estimated or cached"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, '*' for all (default omits full_text and other large columns)"),
+    include: Optional[str] = Query(None, description="Comma-separated relations to embed per page: related_documents, compliance_checks"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Ruft eine Liste von Zulassungen ab
     
-    Unterstützt Filterung, Suche und Sortierung
+    Unterstützt Filterung, Suche und Sortierung. Für die Sortierfelder
+    created_at, updated_at, title, region und authority wird next_cursor
+    geliefert; Folgeseiten über cursor kosten unabhängig von der Tiefe O(limit).
+    total wird je nach count exakt, geschätzt oder aus dem Cache ermittelt.
+    Mit search_mode=fulltext wird nach Relevanz sortiert (Titel vor
+    Zusammenfassung vor Volltext); sort_by und cursor entfallen dann.
+    Bei unveränderter Antwort liefert If-None-Match eine leere 304-Antwort.
+    Ohne fields werden große Text-/JSON-Spalten (z.B. full_text) weder geladen
+    noch ausgeliefert; include lädt Beziehungen mit einer Abfrage je Beziehung.
+    expires_before/expires_within_days filtern per Index auf expiry_date, z.B.
+    mit sort_by=expiry_date&sort_order=asc für bald ablaufende Zulassungen
     """
     try:
-        approval_service = ApprovalService(db)
+        try:
+            projection = resolve_fields(fields, DEFAULT_LIST_FIELDS)
+            relations = ApprovalQueryService.resolve_include(include)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        query_service = ApprovalQueryService(db, search_mode=search_mode, fields=projection, include=relations)
         
         # Filter-Parameter
         filters = {
             "approval_type": approval_type,
-            "status": status,
+            "status": status_filter,
             "region": region,
             "authority": authority,
             "device_class": device_class,
-            "priority": priority
+            "priority": priority,
+            NAME_SIMILAR_FILTER: name_similar,
+            EXPIRES_BEFORE_FILTER: expires_before,
+            EXPIRES_WITHIN_DAYS_FILTER: expires_within_days
         }
         
         # Leere Filter entfernen
         filters = {k: v for k, v in filters.items() if v is not None}
         
-        # Zulassungen abrufen
-        approvals, total = await approval_service.get_approvals(
-            skip=skip,
-            limit=limit,
-            filters=filters,
-            search=search,
-            sort_by=sort_by,
-            sort_order=sort_order
-        )
+        try:
+            if search and query_service.fulltext:
+                # Relevanzsortierung hat keine stabile Keyset-Position
+                if cursor:
+                    raise ValueError("Cursor pagination is not supported for full-text search")
+                approvals, has_more = await query_service.get_ranked_page(
+                    skip=skip,
+                    limit=limit,
+                    filters=filters,
+                    search=search
+                )
+                next_cursor = None
+            # Keyset-Pagination: Folgeseiten per Cursor und erste Seite (gleiche Reihenfolge)
+            elif cursor or (skip == 0 and query_service.supports_keyset(sort_by)):
+                approvals, has_more, next_cursor = await query_service.get_page(
+                    limit=limit,
+                    filters=filters,
+                    search=search,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    cursor=cursor
+                )
+                skip = 0
+            else:
+                approvals, has_more = await query_service.get_offset_page(
+                    skip=skip,
+                    limit=limit,
+                    filters=filters,
+                    search=search,
+                    sort_by=sort_by,
+                    sort_order=sort_order
+                )
+                next_cursor = None
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
         
-        return ApprovalListResponse(
-            items=[ApprovalResponse.from_orm(approval) for approval in approvals],
+        total, used_strategy = await query_service.count(filters, search, count)
+        if used_strategy != CountStrategy.EXACT:
+            # Schätzungen/Cache-Werte nicht unter die sichtbare Seite fallen lassen
+            total = max(total, skip + len(approvals) + (1 if has_more else 0))
+        
+        highlights = None
+        if highlight and search:
+            highlights = await query_service.get_highlights([approval.id for approval in approvals], search)
+        
+        return _page_response(
+            request,
+            approvals,
+            projection,
             total=total,
             skip=skip,
             limit=limit,
-            has_more=skip + limit < total
+            has_more=has_more,
+            next_cursor=next_cursor,
+            count_strategy=used_strategy,
+            highlights=highlights,
+            **await _page_relations(query_service, approvals)
         )
-        
+    
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting approvals: {e}")
         raise HTTPException(
@@ -149,16 +291,28 @@ async def get_approvals(
 
 @router.get("/{approval_id}", response_model=ApprovalResponse)
 async def get_approval(
+    request: Request,
     approval_id: str = Path(..., description="Approval ID"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (default: all)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Ruft eine spezifische Zulassung ab
+    
+    ETag aus dem serialisierten Körper; bei passendem If-None-Match wird
+    eine leere 304-Antwort geliefert
     """
     try:
-        approval_service = ApprovalService(db)
-        approval = await approval_service.get_approval_by_id(approval_id)
+        try:
+            projection = resolve_fields(fields, None)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        # Vollständige Objekte mit den Anzahlen zugehöriger Einträge (select_approvals)
+        approval = await ApprovalQueryService(db, fields=projection).get_approval(approval_id)
         
         if not approval:
             raise HTTPException(
@@ -166,8 +320,10 @@ async def get_approval(
                 detail="Approval not found"
             )
         
-        return ApprovalResponse.from_orm(approval)
-        
+        if projection is not None:
+            return cached_response(request, serialize_item(projection, approval))
+        return cached_response(request, ApprovalResponse.from_orm(approval).model_dump_json().encode("utf-8"))
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -181,7 +337,6 @@ async def get_approval(
 async def update_approval(
     approval_id: str = Path(..., description="Approval ID"),
     approval_data: ApprovalUpdate = None,
-    background_tasks: BackgroundTasks = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -199,10 +354,17 @@ async def update_approval(
                 detail="Approval not found"
             )
         
-        # Datenvalidierung
+        # Datenvalidierung: nur von den Änderungen betroffene Prüfungen,
+        # gegen den gespeicherten Datensatz (z.B. Datumsreihenfolge)
         update_data = approval_data.dict(exclude_unset=True)
-        validator = DataValidator(ValidationLevel.STRICT)
-        validation_result = await validator.validate_approval(update_data)
+        source_id = update_data.get("source_id") or existing_approval.source_id
+        source_plans = await source_rule_registry.load_plans(db, [source_id], ValidationLevel.STRICT)
+        validator = DataValidator(ValidationLevel.STRICT, approval_plan=source_plans.get(str(source_id)))
+        validation_result = validator.revalidate_approval(
+            existing_approval.to_primitive_dict(),
+            update_data,
+            existing_approval.confidence_score
+        )
         
         if not validation_result.is_valid:
             raise HTTPException(
@@ -214,25 +376,26 @@ async def update_approval(
                 }
             )
         
+        # Nachgelagerte Aufgaben über die Warteschlange (separate Worker-Prozesse),
+        # in der Transaktion der Änderung: der Service committet beides gemeinsam
+        await ApprovalTaskQueue(db).enqueue(TASK_POST_UPDATE, [approval_id], validation_result.model_dump(mode="json"))
+        
+        # Neu berechneten Score mit der Änderung speichern
+        persist_score(db, validation_result.score, existing_approval)
+        
         # Zulassung aktualisieren
-        updated_approval = await approval_service.update_approval(
+        await approval_service.update_approval(
             approval_id, 
             approval_data, 
             current_user.id
         )
-        
-        # Background-Tasks
-        if background_tasks:
-            background_tasks.add_task(
-                approval_service.post_update_tasks,
-                approval_id,
-                validation_result
-            )
+        approval_counts.invalidate()
         
         logger.info(f"Updated approval {approval_id} by user {current_user.id}")
         
-        return ApprovalResponse.from_orm(updated_approval)
-        
+        # Neu laden, damit die Antwort die zurückgestellten Anzahlen enthält
+        return ApprovalResponse.from_orm(await ApprovalQueryService(db).get_approval(approval_id))
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -256,6 +419,7 @@ async def delete_approval(
         
         # Zulassung löschen
         success = await approval_service.delete_approval(approval_id, current_user.id)
+        approval_counts.invalidate()
         
         if not success:
             raise HTTPException(
@@ -264,7 +428,7 @@ async def delete_approval(
             )
         
         logger.info(f"Deleted approval {approval_id} by user {current_user.id}")
-        
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -274,30 +438,76 @@ async def delete_approval(
             detail="Failed to delete approval"
         )
 
-@router.post("/search", response_model=ApprovalListResponse)
+@router.post("/search", response_model=ApprovalPageResponse)
 async def search_approvals(
     search_request: ApprovalSearchRequest,
+    count: CountStrategy = Query(CountStrategy.EXACT, description="How to compute total: exact, estimated or cached"),
+    search_mode: SearchMode = Query(SearchMode.SIMPLE, description="simple (substring) or fulltext (ranked web search syntax)"),
+    highlight: bool = Query(False, description="Return highlighted snippets for full-text matches"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, '*' for all (default omits full_text and other large columns)"),
+    include: Optional[str] = Query(None, description="Comma-separated relations to embed per page: related_documents, compliance_checks"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Erweiterte Suche nach Zulassungen
     
-    Unterstützt komplexe Suchanfragen mit mehreren Kriterien
+    Unterstützt komplexe Suchanfragen mit mehreren Kriterien;
+    mit search_mode=fulltext nach Relevanz sortiert. Feldauswahl und include wie bei der Liste
     """
     try:
-        approval_service = ApprovalService(db)
+        try:
+            projection = resolve_fields(fields, DEFAULT_LIST_FIELDS)
+            query_service = ApprovalQueryService(
+                db,
+                search_mode=search_mode,
+                fields=projection,
+                include=ApprovalQueryService.resolve_include(include)
+            )
+            filters = query_service.normalize_filters(search_request.filters or {})
+            if search_request.query and query_service.fulltext:
+                approvals, has_more = await query_service.get_ranked_page(
+                    skip=search_request.skip,
+                    limit=search_request.limit,
+                    filters=filters,
+                    search=search_request.query
+                )
+            else:
+                approvals, has_more = await query_service.get_offset_page(
+                    skip=search_request.skip,
+                    limit=search_request.limit,
+                    filters=filters,
+                    search=search_request.query
+                )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
         
-        approvals, total = await approval_service.search_approvals(search_request)
+        total, used_strategy = await query_service.count(filters, search_request.query, count)
+        if used_strategy != CountStrategy.EXACT:
+            total = max(total, search_request.skip + len(approvals) + (1 if has_more else 0))
         
-        return ApprovalListResponse(
-            items=[ApprovalResponse.from_orm(approval) for approval in approvals],
+        highlights = None
+        if highlight and search_request.query:
+            highlights = await query_service.get_highlights([approval.id for approval in approvals], search_request.query)
+        
+        return _page_response(
+            None,
+            approvals,
+            projection,
             total=total,
             skip=search_request.skip,
             limit=search_request.limit,
-            has_more=search_request.skip + search_request.limit < total
+            has_more=has_more,
+            count_strategy=used_strategy,
+            highlights=highlights,
+            **await _page_relations(query_service, approvals)
         )
-        
+    
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error searching approvals: {e}")
         raise HTTPException(
@@ -307,6 +517,7 @@ async def search_approvals(
 
 @router.get("/statistics/overview", response_model=ApprovalStatistics)
 async def get_approval_statistics(
+    request: Request,
     region: Optional[str] = Query(None, description="Filter by region"),
     authority: Optional[str] = Query(None, description="Filter by authority"),
     db: AsyncSession = Depends(get_db),
@@ -314,9 +525,11 @@ async def get_approval_statistics(
 ):
     """
     Ruft Statistiken über Zulassungen ab
+    
+    Summiert die fortgeschriebene Rollup-Tabelle statt alle Zulassungen zu aggregieren
     """
     try:
-        approval_service = ApprovalService(db)
+        statistics_service = ApprovalStatisticsService(db)
         
         filters = {}
         if region:
@@ -324,10 +537,10 @@ async def get_approval_statistics(
         if authority:
             filters["authority"] = authority
         
-        statistics = await approval_service.get_approval_statistics(filters)
-        
-        return ApprovalStatistics(**statistics)
+        statistics = await statistics_service.get_overview(filters)
         
+        return cached_response(request, ApprovalStatistics(**statistics).model_dump_json().encode("utf-8"))
+    
     except Exception as e:
         logger.error(f"Error getting approval statistics: {e}")
         raise HTTPException(
@@ -335,46 +548,122 @@ async def get_approval_statistics(
             detail="Failed to retrieve statistics"
         )
 
+@router.get("/names/similar", response_model=ApprovalNameMatchResponse)
+async def find_similar_names(
+    name: str = Query(..., min_length=3, description="Company name, may be misspelled"),
+    field: str = Query("any", regex="^(applicant|manufacturer|any)$", description="Name field to match"),
+    threshold: float = Query(DEFAULT_SIMILARITY_THRESHOLD, ge=0.1, le=1.0, description="Minimum trigram similarity"),
+    limit: int = Query(10, ge=1, le=100, description="Number of best matches to return"),
+    region: Optional[str] = Query(None, description="Filter by region"),
+    authority: Optional[str] = Query(None, description="Filter by authority"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ähnlichkeitssuche nach Antragsteller- und Herstellernamen
+    
+    Findet auch falsch geschriebene Namen (z.B. "Medtronik") über die
+    Trigramm-Indizes und liefert die besten limit Treffer mit Ähnlichkeit
+    """
+    try:
+        query_service = ApprovalQueryService(db)
+        fields = NAME_SIMILARITY_FIELDS if field == "any" else (f"{field}_name",)
+        
+        try:
+            filters = query_service.normalize_filters({"region": region, "authority": authority})
+            matches = await query_service.find_similar_names(
+                name,
+                fields=fields,
+                threshold=threshold,
+                limit=limit,
+                filters=filters
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        return ApprovalNameMatchResponse(
+            query=name,
+            threshold=threshold,
+            items=[
+                ApprovalNameMatch(approval=ApprovalResponse.from_orm(approval), similarity=similarity)
+                for approval, similarity in matches
+            ]
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in similar name search: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search names"
+        )
+
+@router.get("/validation/cache", response_model=Dict[str, Any])
+async def get_validation_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ruft Treffer-/Fehlzähler des Validierungs-Caches ab
+    """
+    return get_validation_cache().get_stats()
+
+@router.get("/tasks/stats", response_model=Dict[str, Any])
+async def get_task_queue_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ruft offene und endgültig fehlgeschlagene nachgelagerte Aufgaben je Typ ab
+    """
+    return await ApprovalTaskQueue(db, max_attempts=settings.TASK_MAX_ATTEMPTS).get_stats()
+
 @router.post("/batch", response_model=Dict[str, Any])
 async def create_approvals_batch(
     approvals_data: List[ApprovalCreate],
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Erstellt mehrere Zulassungen in einem Batch
     
-    Optimiert für große Datenmengen mit Validierung und Fehlerbehandlung
+    Optimiert für große Datenmengen mit Validierung und Fehlerbehandlung;
+    nachgelagerte Aufgaben werden mit dem Import eingestellt
     """
     try:
-        approval_service = ApprovalService(db)
-        validator = DataValidator(ValidationLevel.STRICT)
-        batch_validator = BatchValidator(validator)
+        validator = DataValidator(ValidationLevel.STRICT, cache=get_validation_cache())
+        batch_validator = BatchValidator(
+            validator,
+            columnar_threshold=settings.VALIDATION_COLUMNAR_THRESHOLD,
+            parallel_threshold=settings.VALIDATION_PARALLEL_THRESHOLD,
+            chunk_size=settings.VALIDATION_CHUNK_SIZE,
+            max_workers=settings.VALIDATION_WORKERS
+        )
         
-        # Batch-Validierung
-        validation_results = await batch_validator.validate_batch(
-            [approval.dict() for approval in approvals_data]
+        # Batch-Validierung, gruppiert nach Datenquelle
+        data_list = [approval.dict() for approval in approvals_data]
+        source_plans = await source_rule_registry.load_plans(
+            db, {data.get("source_id") for data in data_list}, ValidationLevel.STRICT
         )
+        validation_results = await batch_validator.validate_batch_per_plan(data_list, source_plans)
         
         # Statistiken
         batch_stats = await batch_validator.get_batch_statistics(validation_results)
         
-        # Erfolgreiche Zulassungen erstellen
-        created_approvals = []
+        # Gültige Zulassungen in einer Transaktion per Massen-INSERT anlegen
         failed_approvals = []
+        valid_indices = []
+        valid_records = []
         
         for i, (approval_data, validation_result) in enumerate(zip(approvals_data, validation_results.values())):
             if validation_result.is_valid:
-                try:
-                    approval = await approval_service.create_approval(approval_data, current_user.id)
-                    created_approvals.append(approval.id)
-                except Exception as e:
-                    failed_approvals.append({
-                        "index": i,
-                        "error": str(e),
-                        "data": approval_data.dict()
-                    })
+                record = approval_data.dict(exclude_none=True)
+                record["confidence_score"] = validation_result.score
+                valid_indices.append(i)
+                valid_records.append(record)
             else:
                 failed_approvals.append({
                     "index": i,
@@ -383,13 +672,20 @@ async def create_approvals_batch(
                     "data": approval_data.dict()
                 })
         
-        # Background-Tasks für erfolgreiche Zulassungen
-        for approval_id in created_approvals:
-            background_tasks.add_task(
-                approval_service.post_create_tasks,
-                approval_id,
-                None
-            )
+        bulk_service = ApprovalBulkService(db, chunk_size=settings.BULK_INSERT_CHUNK_SIZE)
+        bulk_result = await bulk_service.bulk_create(valid_records, current_user.id)
+        if bulk_result.created_ids:
+            approval_counts.invalidate()
+        
+        created_approvals = bulk_result.created_ids
+        for failure in bulk_result.failures:
+            i = valid_indices[failure["index"]]
+            failed_approvals.append({
+                "index": i,
+                "error": failure["error"],
+                "data": approvals_data[i].dict()
+            })
+        failed_approvals.sort(key=lambda failure: failure["index"])
         
         logger.info(f"Batch created {len(created_approvals)} approvals, {len(failed_approvals)} failed")
         
@@ -401,7 +697,7 @@ async def create_approvals_batch(
             "failed_approvals": failed_approvals,
             "batch_statistics": batch_stats
         }
-        
+    
     except Exception as e:
         logger.error(f"Error in batch creation: {e}")
         raise HTTPException(
@@ -409,38 +705,130 @@ async def create_approvals_batch(
             detail="Failed to create approvals batch"
         )
 
-@router.get("/export/csv")
-async def export_approvals_csv(
-    approval_type: Optional[ApprovalType] = Query(None, description="Filter by approval type"),
-    status: Optional[ApprovalStatus] = Query(None, description="Filter by status"),
-    region: Optional[str] = Query(None, description="Filter by region"),
+@router.patch("/bulk", response_model=ApprovalBulkUpdateResponse)
+async def bulk_update_approvals(
+    bulk_request: ApprovalBulkUpdateRequest,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Exportiert Zulassungen als CSV-Datei
+    Ändert Status, Priorität oder Tags vieler Zulassungen auf einmal
+    
+    Auswahl über ids oder filter (Felder wie beim Listenabruf). Die Änderung
+    wird je Regelstand der betroffenen Quellen einmal validiert und per
+    UPDATE ... RETURNING id in Chunks geschrieben; es gibt einen Audit-Eintrag
+    je Anfrage, nachgelagerte Aufgaben werden in derselben Transaktion eingestellt
     """
     try:
-        approval_service = ApprovalService(db)
-        
-        filters = {}
-        if approval_type:
-            filters["approval_type"] = approval_type
-        if status:
-            filters["status"] = status
-        if region:
-            filters["region"] = region
-        
-        csv_data = await approval_service.export_approvals_csv(filters)
+        bulk_service = ApprovalBulkService(db, chunk_size=settings.BULK_UPDATE_CHUNK_SIZE)
+        
+        try:
+            if (bulk_request.ids is None) == (bulk_request.filter is None):
+                raise ValueError("Either ids or filter must be given")
+            changes = bulk_service.prepare_changes(bulk_request.patch.dict(exclude_unset=True))
+            selection = bulk_request.filter.dict(exclude_none=True) if bulk_request.filter else {}
+            search = selection.pop("search", None)
+            search_mode = selection.pop("search_mode", SearchMode.SIMPLE)
+            condition = bulk_service.target_condition(selection, search, search_mode)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
         
-        return JSONResponse(
-            content={"csv_data": csv_data},
-            headers={"Content-Type": "application/json"}
+        # Validierung der Änderung einmal je Regelstand (Standard- bzw. Quellregeln)
+        source_ids = await bulk_service.affected_sources(condition, bulk_request.ids)
+        source_plans = await source_rule_registry.load_plans(db, source_ids, ValidationLevel.STRICT)
+        plans = list({plan.key: plan for plan in source_plans.values()}.values()) or [None]
+        primitive_changes = {
+            key: value.value if isinstance(value, Enum) else value for key, value in changes.items()
+        }
+        for plan in plans:
+            validation_result = DataValidator(ValidationLevel.STRICT, approval_plan=plan).validate_changes(primitive_changes)
+            if not validation_result.is_valid:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail={
+                        "message": "Validation failed",
+                        "errors": validation_result.errors,
+                        "warnings": validation_result.warnings
+                    }
+                )
+        
+        result = await bulk_service.bulk_update(changes, condition, bulk_request.ids, validation_result.model_dump(mode="json"))
+        if result.ids:
+            approval_counts.invalidate()
+        
+        logger.info(
+            f"Bulk updated {len(result.ids)} approvals by user {current_user.id}: "
+            f"changes={primitive_changes}, "
+            f"selection={'ids' if bulk_request.ids is not None else bulk_request.filter.dict(exclude_none=True)}"
         )
         
+        return ApprovalBulkUpdateResponse(
+            updated_count=len(result.ids),
+            updated_ids=result.ids,
+            not_found=result.not_found
+        )
+    
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error exporting approvals: {e}")
+        logger.error(f"Error in bulk update: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to export approvals"
+            detail="Failed to update approvals"
+        )
+
+@router.get("/export/csv")
+async def export_approvals_csv(
+    approval_type: Optional[ApprovalType] = Query(None, description="Filter by approval type"),
+    status_filter: Optional[ApprovalStatus] = Query(None, alias="status", description="Filter by status"),
+    region: Optional[str] = Query(None, description="Filter by region"),
+    columns: Optional[str] = Query(None, description="Comma-separated list of columns to export"),
+    compress: bool = Query(False, alias="gzip", description="Export as gzip-compressed file"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Exportiert Zulassungen als CSV-Datei
+    
+    Die Datei wird über einen serverseitigen Cursor gestreamt, der
+    Speicherbedarf hängt nicht von der Anzahl der Zeilen ab
+    """
+    export_service = ApprovalExportService(db, chunk_rows=settings.EXPORT_CHUNK_ROWS)
+    
+    try:
+        export_columns = export_service.resolve_columns(columns)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
+    
+    filters = {}
+    if approval_type:
+        filters["approval_type"] = approval_type
+    if status_filter:
+        filters["status"] = status_filter
+    if region:
+        filters["region"] = region
+    
+    async def content():
+        try:
+            chunks = export_service.iter_csv(filters, export_columns)
+            if compress:
+                chunks = gzip_chunks(chunks)
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            # Status und Header sind bereits gesendet; Export abbrechen
+            logger.error(f"Error exporting approvals: {e}")
+            raise
+    
+    filename = "approvals.csv.gz" if compress else "approvals.csv"
+    return StreamingResponse(
+        content(),
+        media_type="application/gzip" if compress else "text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
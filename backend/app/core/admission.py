@@ -0,0 +1,209 @@
+"""
+MedTech Data Platform - Admission Control
+Nebenläufigkeitsgrenzen je Routenklasse mit Lastabwurf nach Wartezeit
+"""
+
+from typing import Optional, Dict, Any, Deque, Tuple, Callable
+from collections import deque
+from urllib.parse import parse_qs
+from starlette.responses import JSONResponse
+import asyncio
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+# Routenklassen mit eigenem Kontingent
+ROUTE_CLASSES = ("read", "search", "write", "batch", "export")
+
+# Nie begrenzt (Health-Checks, Dokumentation)
+EXEMPT_PATH_PREFIXES = ("/health", "/docs", "/redoc", "/openapi.json")
+
+# Gewichtung neuer Messwerte in den gleitenden Mittelwerten
+EWMA_WEIGHT = 0.1
+
+def classify_request(method: str, path: str, query_string: bytes = b"") -> Optional[str]:
+    """Routenklasse einer Anfrage; None = nicht begrenzt"""
+    if method == "OPTIONS" or path == "/" or path.startswith(EXEMPT_PATH_PREFIXES):
+        return None
+    if "/export/" in path:
+        return "export"
+    if path.endswith(("/batch", "/bulk")):
+        return "batch"
+    if path.endswith(("/search", "/names/similar")):
+        return "search"
+    if method in ("GET", "HEAD"):
+        if query_string and (b"search=" in query_string or b"name_similar=" in query_string):
+            params = parse_qs(query_string.decode("latin-1"))
+            if params.get("search") or params.get("name_similar"):
+                return "search"
+        return "read"
+    return "write"
+
+class AdmissionPool:
+    """
+    Begrenzung gleichzeitiger Anfragen einer Routenklasse
+    Wartende werden in FIFO-Reihenfolge zugelassen. Wartet die älteste Anfrage
+    bereits länger als das Budget, wird sofort abgelehnt, statt die
+    Warteschlange weiter zu verlängern; sonst wird höchstens das Budget gewartet
+    """
+    
+    def __init__(self, name: str, limit: int, queue_budget: float, max_queue: Optional[int] = None):
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_budget = queue_budget  # Sekunden
+        self.max_queue = max_queue if max_queue is not None else self.limit * 4
+        self.in_flight = 0
+        self._waiters: Deque[Tuple[float, "asyncio.Future[None]"]] = deque()
+        self.admitted = 0
+        self.shed = 0
+        self.avg_queue_wait = 0.0  # Sekunden (gleitender Mittelwert)
+        self.avg_service_time: Optional[float] = None
+    
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, future in self._waiters if not future.done())
+    
+    def _oldest_wait(self, now: float) -> float:
+        for started, future in self._waiters:
+            if not future.done():
+                return now - started
+        return 0.0
+    
+    def _admit(self, queue_wait: float) -> None:
+        self.admitted += 1
+        self.avg_queue_wait += EWMA_WEIGHT * (queue_wait - self.avg_queue_wait)
+    
+    async def acquire(self) -> bool:
+        """Belegt einen Platz; False = Anfrage abweisen"""
+        if self.in_flight < self.limit and not self.queued:
+            self.in_flight += 1
+            self._admit(0.0)
+            return True
+        
+        now = time.monotonic()
+        if self.queued >= self.max_queue or self._oldest_wait(now) > self.queue_budget:
+            self.shed += 1
+            return False
+        
+        entry = (now, asyncio.get_running_loop().create_future())
+        future = entry[1]
+        self._waiters.append(entry)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_budget)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # Client getrennt: bereits übergebenen Platz zurückgeben
+            if future.done() and not future.cancelled():
+                self.release()
+            future.cancel()
+            raise
+        finally:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+        
+        if future.done() and not future.cancelled():
+            self._admit(time.monotonic() - now)
+            return True
+        future.cancel()
+        self.shed += 1
+        return False
+    
+    def release(self, service_time: Optional[float] = None) -> None:
+        """Gibt einen Platz frei; er geht direkt an die älteste wartende Anfrage"""
+        if service_time is not None:
+            if self.avg_service_time is None:
+                self.avg_service_time = service_time
+            else:
+                self.avg_service_time += EWMA_WEIGHT * (service_time - self.avg_service_time)
+        while self._waiters:
+            _, future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+    
+    def retry_after(self) -> int:
+        """Geschätzte Sekunden, bis die aktuelle Warteschlange abgearbeitet ist"""
+        per_request = self.avg_service_time if self.avg_service_time is not None else self.queue_budget
+        return max(1, math.ceil((self.queued + 1) * per_request / self.limit))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Auslastung des Kontingents"""
+        queued = self.queued
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": queued,
+            "saturation": round((self.in_flight + queued) / self.limit, 3),
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "queue_budget_ms": round(self.queue_budget * 1000),
+            "avg_queue_wait_ms": round(self.avg_queue_wait * 1000, 1),
+            "avg_service_time_ms": round(self.avg_service_time * 1000, 1) if self.avg_service_time is not None else None
+        }
+
+class AdmissionController:
+    """Kontingente aller Routenklassen eines Worker-Prozesses"""
+    
+    def __init__(self, pools: Dict[str, AdmissionPool]):
+        self.pools = pools
+    
+    @classmethod
+    def from_limits(cls, limits: Dict[str, int], queue_budgets_ms: Dict[str, int]) -> "AdmissionController":
+        """Kontingente aus Grenzen und Warte-Budgets (Millisekunden) je Routenklasse"""
+        unknown = set(limits) - set(ROUTE_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown route classes: {', '.join(sorted(unknown))}")
+        return cls({
+            name: AdmissionPool(name, limit, queue_budgets_ms.get(name, 1000) / 1000)
+            for name, limit in limits.items()
+        })
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: pool.get_stats() for name, pool in self.pools.items()}
+
+class AdmissionControlMiddleware:
+    """
+    ASGI-Middleware: Anfragen belegen einen Platz im Kontingent ihrer Routenklasse
+    bis die Antwort (auch gestreamt) vollständig gesendet ist; abgewiesene
+    Anfragen erhalten sofort 503 mit Retry-After
+    """
+    
+    def __init__(
+        self,
+        app,
+        controller: AdmissionController,
+        classify: Callable[[str, str, bytes], Optional[str]] = classify_request
+    ):
+        self.app = app
+        self.controller = controller
+        self.classify = classify
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        pool = self.controller.pools.get(self.classify(scope["method"], scope["path"], scope.get("query_string", b"")))
+        if pool is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if not await pool.acquire():
+            logger.debug(f"Shed {scope['method']} {scope['path']} (pool {pool.name})")
+            response = JSONResponse(
+                {"detail": "Server is busy, please retry later", "pool": pool.name},
+                status_code=503,
+                headers={"Retry-After": str(pool.retry_after())}
+            )
+            await response(scope, receive, send)
+            return
+        
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            pool.release(time.monotonic() - started)
@@ -0,0 +1,39 @@
+"""
+MedTech Data Platform - Advisory Locks
+Prozessübergreifender Ausschluss periodischer Wartungsjobs über PostgreSQL-Advisory-Locks
+"""
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+# Sperrschlüssel je Wartungsjob (bigint, projektweit eindeutig)
+STATISTICS_RECONCILE_LOCK = 0x4D54_0001
+SOURCE_RECOUNT_LOCK = 0x4D54_0002
+EXPIRY_SWEEP_LOCK = 0x4D54_0003
+
+@asynccontextmanager
+async def exclusive_session(engine: AsyncEngine, key: int) -> AsyncIterator[Optional[AsyncSession]]:
+    """
+    Session auf einer fest zugeordneten Verbindung, die den Advisory-Lock hält
+    None, wenn ein anderer Prozess den Job gerade ausführt. Die Sperre gilt auf
+    Sitzungsebene und damit über alle Transaktionen des Jobs; außerhalb von
+    PostgreSQL (Tests mit SQLite) wird ohne Sperre ausgeführt
+    """
+    async with engine.connect() as connection:
+        locking = connection.dialect.name == "postgresql"
+        if locking:
+            acquired = (await connection.execute(select(func.pg_try_advisory_lock(key)))).scalar()
+            await connection.commit()  # Sperre überdauert die Transaktion
+            if not acquired:
+                yield None
+                return
+        
+        try:
+            async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+                yield session
+        finally:
+            if locking:
+                await connection.execute(select(func.pg_advisory_unlock(key)))
+                await connection.commit()
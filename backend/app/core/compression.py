@@ -0,0 +1,325 @@
+"""
+MedTech Data Platform - Response Compression
+Ausgehandelte Kompression (br, zstd, gzip) als ASGI-Middleware
+"""
+
+from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from starlette.datastructures import Headers, MutableHeaders
+import hashlib
+import logging
+import threading
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional: ohne brotli wird br nicht angeboten
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: ohne zstandard wird zstd nicht angeboten
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Komprimierbare Inhaltstypen (Präfixvergleich)
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/"
+)
+
+# Gestreamte Ereignisse nie puffern oder komprimieren
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+# Bevorzugte Reihenfolge bei gleicher Gewichtung durch den Client
+ENCODING_PREFERENCE = ("br", "zstd", "gzip")
+
+# Stufen für dynamische Antworten (Verhältnis von Rate zu CPU-Zeit)
+DEFAULT_LEVELS = {"br": 4, "zstd": 3, "gzip": 6}
+
+class _Encoder:
+    """Fortlaufender Kompressor; flush() liefert alles bisher Dekodierbare"""
+    
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+    
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.flush()
+        if self.encoding == "zstd":
+            return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+def available_encodings() -> Tuple[str, ...]:
+    """Unterstützte Kodierungen in Server-Präferenz (abhängig von installierten Paketen)"""
+    installed = {"br": brotli is not None, "zstd": zstandard is not None, "gzip": True}
+    return tuple(encoding for encoding in ENCODING_PREFERENCE if installed[encoding])
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: Tuple[str, ...]) -> Optional[str]:
+    """
+    Wählt die Kodierung nach Accept-Encoding (RFC 9110)
+    Höchste Gewichtung gewinnt, bei Gleichstand die Server-Präferenz;
+    None = unkomprimiert ausliefern
+    """
+    if not accept_encoding:
+        return None
+    
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+    
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Inhaltstyp steht auf der Positivliste"""
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES) and not content_type.startswith(EXCLUDED_CONTENT_TYPES)
+
+def _weak_etag(etag: str) -> str:
+    # Die komprimierte Darstellung ist nicht bytegleich; If-None-Match vergleicht schwach
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+class CompressedResponseCache:
+    """
+    LRU-Cache komprimierter Antwortkörper
+    Schlüssel sind ein Hash des unkomprimierten Körpers und die Kodierung:
+    ein unveränderter Körper wird je Kodierung nur einmal komprimiert
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: "OrderedDict[Tuple[bytes, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Tuple[bytes, str]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+    
+    def set(self, key: Tuple[bytes, str], body: bytes) -> None:
+        if len(body) > self.max_bytes // 16:
+            return  # einzelne große Antworten nicht cachen
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= len(previous)
+            self._entries[key] = body
+            self.size_bytes += len(body)
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Leert den Cache und setzt die Zähler zurück"""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Treffer-/Fehlzähler und Füllstand"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups > 0 else 0
+            }
+
+class CompressionMiddleware:
+    """
+    ASGI-Middleware für ausgehandelte Antwortkompression
+    - Vollständige Antworten ab minimum_size werden am Stück komprimiert,
+      über den CompressedResponseCache (Hash des Körpers)
+    - Gestreamte Antworten (StreamingResponse) werden chunkweise komprimiert
+      und nach jedem Chunk geflusht, ohne den Körper zu puffern
+    """
+    
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        encodings: Optional[Tuple[str, ...]] = None,
+        levels: Optional[Dict[str, int]] = None,
+        cache: Optional[CompressedResponseCache] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = encodings if encodings is not None else available_encodings()
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.cache = cache
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        
+        # Auch ohne passende Kodierung: komprimierbare Antworten tragen Vary
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+class _CompressionResponder:
+    """Zustand einer einzelnen Antwort"""
+    
+    def __init__(self, middleware: CompressionMiddleware, scope, send, encoding: Optional[str]):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start_message: Optional[Dict[str, Any]] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+    
+    async def send(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            if message["status"] == 304:
+                # Gleiche Validatoren wie die 200-Antwort dieser Kodierung
+                self.passthrough = True
+                self._mark_encoded(MutableHeaders(raw=message["headers"]), set_encoding=False)
+            elif (
+                message["status"] not in (200, 203)
+                or "content-encoding" in headers
+                or "content-range" in headers
+                or "no-transform" in headers.get("cache-control", "").lower()
+                or not is_compressible(headers.get("content-type"))
+            ):
+                self.passthrough = True
+            else:
+                # Darstellung hängt von Accept-Encoding ab, auch wenn sie
+                # unkomprimiert (zu klein, identity) ausgeliefert wird
+                _add_vary(MutableHeaders(raw=message["headers"]))
+                self.passthrough = self.encoding is None
+            return
+        
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        
+        if self.passthrough:
+            if self.start_message is not None:
+                await self._send(self.start_message)
+                self.start_message = None
+            await self._send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self.encoder is None and not more_body:
+            await self._send_complete(body)
+            return
+        
+        if self.encoder is None:
+            # Gestreamte Antwort: Länge unbekannt, daher ohne Content-Length
+            self.encoder = _Encoder(self.encoding, self.middleware.levels[self.encoding])
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            self._mark_encoded(headers)
+            del headers["content-length"]
+            await self._send(self.start_message)
+            self.start_message = None
+        
+        if more_body:
+            data = self.encoder.compress(body) + self.encoder.flush() if body else b""
+        else:
+            data = self.encoder.compress(body) + self.encoder.finish()
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+    
+    async def _send_complete(self, body: bytes) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        if len(body) < self.middleware.minimum_size:
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+        
+        cache = self.middleware.cache
+        key = None
+        compressed = None
+        if cache is not None:
+            key = (hashlib.blake2b(body, digest_size=16).digest(), self.encoding)
+            compressed = cache.get(key)
+        if compressed is None:
+            encoder = _Encoder(self.encoding, self.middleware.levels[self.encoding])
+            compressed = encoder.compress(body) + encoder.finish()
+            if key is not None:
+                cache.set(key, compressed)
+        
+        self._mark_encoded(headers)
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": compressed})
+    
+    def _mark_encoded(self, headers: MutableHeaders, set_encoding: bool = True) -> None:
+        _add_vary(headers)
+        if self.encoding is None:
+            return
+        if set_encoding:
+            headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag:
+            headers["ETag"] = _weak_etag(etag)
@@ -5,7 +5,7 @@ Zentrale Konfiguration für alle Umgebungseinstellungen
 
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 import os
 from pathlib import Path
 
@@ -61,6 +61,17 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     RATE_LIMIT_WINDOW: int = Field(default=60, env="RATE_LIMIT_WINDOW")  # 1 minute
     
+    # Admission Control (je Worker-Prozess)
+    ADMISSION_CONTROL_ENABLED: bool = Field(default=True, env="ADMISSION_CONTROL_ENABLED")
+    ADMISSION_LIMITS: Dict[str, int] = Field(
+        default={"read": 64, "search": 16, "write": 16, "batch": 2, "export": 2},
+        env="ADMISSION_LIMITS"
+    )  # gleichzeitige Anfragen je Routenklasse
+    ADMISSION_QUEUE_BUDGETS_MS: Dict[str, int] = Field(
+        default={"read": 100, "search": 500, "write": 500, "batch": 2000, "export": 2000},
+        env="ADMISSION_QUEUE_BUDGETS_MS"
+    )  # maximale Wartezeit vor 503
+    
     # Logging
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
     LOG_FORMAT: str = Field(default="json", env="LOG_FORMAT")
@@ -85,9 +96,42 @@ class Settings(BaseSettings):
     # Data Validation
     VALIDATION_STRICT: bool = Field(default=True, env="VALIDATION_STRICT")
     VALIDATION_RETRIES: int = Field(default=3, env="VALIDATION_RETRIES")
+    VALIDATION_COLUMNAR_THRESHOLD: int = Field(default=1000, env="VALIDATION_COLUMNAR_THRESHOLD")  # Einträge
+    VALIDATION_PARALLEL_THRESHOLD: int = Field(default=20000, env="VALIDATION_PARALLEL_THRESHOLD")  # Einträge
+    VALIDATION_CHUNK_SIZE: int = Field(default=5000, env="VALIDATION_CHUNK_SIZE")
+    VALIDATION_WORKERS: Optional[int] = Field(default=None, env="VALIDATION_WORKERS")  # None = Anzahl CPU-Kerne
+    VALIDATION_CACHE_SIZE: int = Field(default=100000, env="VALIDATION_CACHE_SIZE")  # Einträge
+    VALIDATION_CACHE_TTL: int = Field(default=3600, env="VALIDATION_CACHE_TTL")  # 1 hour
+    
+    # Bulk-Import/-Export
+    BULK_INSERT_CHUNK_SIZE: int = Field(default=1000, env="BULK_INSERT_CHUNK_SIZE")  # Zeilen pro INSERT
+    BULK_UPDATE_CHUNK_SIZE: int = Field(default=1000, env="BULK_UPDATE_CHUNK_SIZE")  # Zeilen pro UPDATE
+    EXPORT_CHUNK_ROWS: int = Field(default=1000, env="EXPORT_CHUNK_ROWS")  # Zeilen pro Cursor-Abruf
+    
+    # Start & Bereitschaft
+    ALEMBIC_CONFIG: str = Field(default="alembic.ini", env="ALEMBIC_CONFIG")  # Schema-Versionsprüfung gegen die Heads
+    SCHEMA_CREATE_ON_STARTUP: bool = Field(default=False, env="SCHEMA_CREATE_ON_STARTUP")  # nur Entwicklung: create_all statt Prüfung
+    STARTUP_TIMEOUT: float = Field(default=30.0, env="STARTUP_TIMEOUT")  # Sekunden je kritischem Schritt
+    WARMUP_TIMEOUT: float = Field(default=120.0, env="WARMUP_TIMEOUT")  # Sekunden je Warm-up-Schritt (Hintergrund)
+    
+    # Statistiken
+    STATISTICS_RECONCILE_INTERVAL: int = Field(default=3600, env="STATISTICS_RECONCILE_INTERVAL")  # Sekunden, 0 = deaktiviert
+    SOURCE_RECOUNT_INTERVAL: int = Field(default=3600, env="SOURCE_RECOUNT_INTERVAL")  # Sekunden, 0 = deaktiviert
+    
+    # Ablauf von Zulassungen
+    EXPIRY_SWEEP_INTERVAL: int = Field(default=3600, env="EXPIRY_SWEEP_INTERVAL")  # Sekunden, 0 = deaktiviert
+    
+    # Aufgaben-Warteschlange (python -m app.workers.approval_tasks)
+    TASK_BATCH_SIZE: int = Field(default=500, env="TASK_BATCH_SIZE")  # Aufgaben pro Batch
+    TASK_POLL_INTERVAL: float = Field(default=1.0, env="TASK_POLL_INTERVAL")  # Sekunden bei leerer Warteschlange
+    TASK_LEASE_SECONDS: int = Field(default=300, env="TASK_LEASE_SECONDS")  # Sperrfrist beanspruchter Aufgaben
+    TASK_MAX_ATTEMPTS: int = Field(default=5, env="TASK_MAX_ATTEMPTS")
+    TASK_WORKER_PROCESSES: int = Field(default=2, env="TASK_WORKER_PROCESSES")
     
     # Performance
     ENABLE_COMPRESSION: bool = Field(default=True, env="ENABLE_COMPRESSION")
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, env="COMPRESSION_MINIMUM_SIZE")  # Bytes
+    COMPRESSION_CACHE_SIZE: int = Field(default=64 * 1024 * 1024, env="COMPRESSION_CACHE_SIZE")  # Bytes komprimierter Antworten
     ENABLE_CACHING: bool = Field(default=True, env="ENABLE_CACHING")
     
     # Testing
@@ -0,0 +1,42 @@
+"""
+MedTech Data Platform - HTTP Caching
+Inhaltsbasierte ETags und bedingte GET-Anfragen (If-None-Match / 304)
+"""
+
+from fastapi import Request, Response, status
+from typing import Optional
+import hashlib
+
+# Clients dürfen speichern, müssen aber vor jeder Wiederverwendung revalidieren
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+
+def content_etag(body: bytes) -> str:
+    """Starkes ETag aus dem serialisierten Antwortkörper"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Schwacher Vergleich nach RFC 9110 für If-None-Match"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def cached_response(
+    request: Request,
+    body: bytes,
+    media_type: str = "application/json",
+    cache_control: str = CACHE_CONTROL_REVALIDATE
+) -> Response:
+    """
+    Antwort mit inhaltsbasiertem ETag; leere 304-Antwort, wenn der Client
+    diesen Inhalt bereits hat. Das ETag folgt so jeder Änderung der Antwort
+    (auch über include=, Zähler und datumsabhängige Felder)
+    """
+    etag = content_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
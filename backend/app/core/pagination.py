@@ -0,0 +1,87 @@
+"""
+MedTech Data Platform - Pagination
+Opake Cursor für Keyset-Pagination und Strategien für Gesamtanzahlen
+"""
+
+from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+import base64
+import binascii
+import json
+import threading
+import time
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """Kodiert die Position eines Datensatzes als URL-sicheren Cursor"""
+    raw = json.dumps(payload, separators=(",", ":"), default=_json_default).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Dekodiert einen Cursor; ValueError bei ungültigem Cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+class CountStrategy(str, Enum):
+    """Ermittlung der Gesamtanzahl in Listenantworten"""
+    EXACT = "exact"          # COUNT(*) über die gefilterte Menge
+    ESTIMATED = "estimated"  # Schätzung des Planers bzw. pg_class.reltuples
+    CACHED = "cached"        # COUNT(*) pro Filterkombination gecacht (kurze TTL, lokal bei Schreibzugriffen verworfen)
+
+class CountCache:
+    """
+    Cache für Gesamtanzahlen pro Filterkombination
+    invalidate() wirkt nur im eigenen Worker-Prozess; Schreibzugriffe anderer
+    Prozesse werden erst nach Ablauf der (kurzen) TTL sichtbar
+    """
+    
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = 30):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stabiler Schlüssel für Filter und Suchbegriffe"""
+        return json.dumps(parts, sort_keys=True, separators=(",", ":"), default=_json_default)
+    
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: str, count: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self) -> None:
+        """Verwirft alle gecachten Anzahlen (nach Schreibzugriffen)"""
+        with self._lock:
+            self._entries.clear()
+
+# Gesamtanzahlen der Zulassungslisten
+approval_counts = CountCache()
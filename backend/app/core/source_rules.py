@@ -0,0 +1,195 @@
+"""
+MedTech Data Platform - Source Validation Rules
+Quellspezifische Validierungsregeln aus DataSource.validation_rules
+"""
+
+from typing import Optional, Dict, Any, Iterable, TYPE_CHECKING
+from datetime import datetime
+import json
+import logging
+import re
+import threading
+
+from app.core.validation import ValidationLevel, ValidationPlan, ValidationPlanRegistry, validation_plans
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Abschnitte, deren Einträge pro Schlüssel überschrieben werden (None entfernt den Schlüssel)
+MAPPING_SECTIONS = ("field_patterns", "field_lengths", "enums", "region_authorities")
+# Abschnitte, die um die Einträge der Quelle ergänzt werden
+LIST_SECTIONS = ("required_fields", "date_fields", "json_fields")
+
+def merge_source_rules(base_rules: Dict[str, Any], source_rules: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Kombiniert die Standardregeln für Zulassungen mit den Regeln einer Quelle
+    "optional_fields" nimmt Felder aus den Pflichtfeldern heraus
+    """
+    merged = dict(base_rules)
+    
+    for section in MAPPING_SECTIONS:
+        overrides = source_rules.get(section)
+        if not overrides:
+            continue
+        values = dict(merged.get(section, {}))
+        for key, value in overrides.items():
+            if value is None:
+                values.pop(key, None)
+            else:
+                values[key] = value
+        merged[section] = values
+    
+    for section in LIST_SECTIONS:
+        additions = source_rules.get(section)
+        if not additions:
+            continue
+        values = list(merged.get(section, ()))
+        values.extend(field for field in additions if field not in values)
+        merged[section] = values
+    
+    optional_fields = source_rules.get("optional_fields")
+    if optional_fields:
+        merged["required_fields"] = [
+            field for field in merged.get("required_fields", ()) if field not in optional_fields
+        ]
+    
+    return merged
+
+class _SourceEntry:
+    """Kompilierter Regelstand einer Datenquelle"""
+    __slots__ = ("updated_at", "source_rules", "base_version", "merged_rules", "plans")
+    
+    def __init__(self, updated_at: Optional[datetime], source_rules: Optional[Dict[str, Any]]):
+        self.updated_at = updated_at
+        self.source_rules = source_rules
+        self.base_version: Optional[int] = None
+        self.merged_rules: Optional[Dict[str, Any]] = None
+        self.plans: Dict[ValidationLevel, ValidationPlan] = {}
+
+class SourceRuleRegistry:
+    """
+    Cache kompilierter Validierungspläne pro Datenquelle
+    Das JSON einer Quelle wird einmal pro (Quell-ID, updated_at) gelesen und
+    kompiliert; Quellen ohne eigene Regeln verwenden den Standardplan
+    """
+    
+    def __init__(self, plans: Optional[ValidationPlanRegistry] = None):
+        self.plans = plans or validation_plans
+        self._entries: Dict[str, _SourceEntry] = {}
+        self._lock = threading.Lock()
+    
+    def is_current(self, source_id: str, updated_at: Optional[datetime]) -> bool:
+        """Prüft, ob der Regelstand der Quelle bereits kompiliert vorliegt"""
+        entry = self._entries.get(str(source_id))
+        return entry is not None and entry.updated_at == updated_at
+    
+    def register(self, source_id: str, updated_at: Optional[datetime], validation_rules: Any) -> None:
+        """Übernimmt die Regeln einer Quelle (JSON-Text oder bereits geparst)"""
+        source_rules = None
+        try:
+            if isinstance(validation_rules, (str, bytes)):
+                validation_rules = json.loads(validation_rules)
+            if isinstance(validation_rules, dict):
+                # Regeln dürfen direkt oder unter "approval" hinterlegt sein
+                source_rules = validation_rules.get("approval", validation_rules) or None
+            elif validation_rules:
+                raise ValueError("validation_rules must be an object")
+        except ValueError as e:
+            logger.warning(f"Invalid validation rules for data source {source_id}: {e}")
+        
+        with self._lock:
+            self._entries[str(source_id)] = _SourceEntry(updated_at, source_rules)
+    
+    def get_plan(self, source_id: Optional[str], level: ValidationLevel) -> ValidationPlan:
+        """Kompilierter Plan der Quelle; Standardplan für unbekannte Quellen"""
+        base_plan = self.plans.get_plan("approval", level)
+        entry = self._entries.get(str(source_id)) if source_id is not None else None
+        if entry is None or entry.source_rules is None:
+            return base_plan
+        
+        level = ValidationLevel(level)
+        plan = entry.plans.get(level) if entry.base_version == base_plan.version else None
+        if plan is not None:
+            return plan
+        
+        with self._lock:
+            if entry.base_version != base_plan.version:
+                # Standardregeln geändert: neu kombinieren, ohne das JSON erneut zu lesen
+                entry.base_version = base_plan.version
+                entry.merged_rules = None
+                entry.plans = {}
+            plan = entry.plans.get(level)
+            if plan is None:
+                plan = self._compile(source_id, entry, base_plan, level)
+                entry.plans[level] = plan
+        return plan
+    
+    def _compile(self, source_id: str, entry: _SourceEntry, base_plan: ValidationPlan, level: ValidationLevel) -> ValidationPlan:
+        try:
+            if entry.merged_rules is None:
+                entry.merged_rules = merge_source_rules(base_plan.rules, entry.source_rules)
+            stamp = entry.updated_at.isoformat() if entry.updated_at else "-"
+            return ValidationPlan(
+                "approval", level, entry.merged_rules, base_plan.version,
+                key=f"{base_plan.key}|source:{source_id}:{stamp}"
+            )
+        except (re.error, TypeError, ValueError, AttributeError) as e:
+            # Fehlerhafte Quellregeln nicht bei jedem Datensatz erneut versuchen
+            logger.warning(f"Could not compile validation rules for data source {source_id}: {e}")
+            entry.source_rules = None
+            return base_plan
+    
+    async def load_plans(
+        self,
+        db: "AsyncSession",
+        source_ids: Iterable[Optional[str]],
+        level: ValidationLevel
+    ) -> Dict[str, ValidationPlan]:
+        """
+        Liefert die Pläne der angegebenen Quellen
+        Abgefragt werden nur updated_at; validation_rules wird ausschließlich
+        für neue oder geänderte Quellen geladen
+        """
+        from sqlalchemy import select
+        from app.models.data_source import DataSource
+        
+        ids = {str(source_id) for source_id in source_ids if source_id is not None}
+        if not ids:
+            return {}
+        
+        result = await db.execute(
+            select(DataSource.id, DataSource.updated_at).where(DataSource.id.in_(ids))
+        )
+        versions: Dict[str, Optional[datetime]] = {row.id: row.updated_at for row in result}
+        
+        stale = [source_id for source_id, updated_at in versions.items() if not self.is_current(source_id, updated_at)]
+        if stale:
+            result = await db.execute(
+                select(DataSource.id, DataSource.updated_at, DataSource.validation_rules).where(DataSource.id.in_(stale))
+            )
+            for row in result:
+                self.register(row.id, row.updated_at, row.validation_rules)
+        
+        return {source_id: self.get_plan(source_id, level) for source_id in versions}
+    
+    def invalidate(self, source_id: Optional[str] = None) -> None:
+        """Verwirft den Regelstand einer Quelle oder aller Quellen"""
+        with self._lock:
+            if source_id is None:
+                self._entries = {}
+            else:
+                self._entries.pop(str(source_id), None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Anzahl der Quellen und kompilierten Pläne"""
+        with self._lock:
+            return {
+                "sources": len(self._entries),
+                "sources_with_rules": sum(1 for entry in self._entries.values() if entry.source_rules is not None),
+                "compiled_plans": sum(len(entry.plans) for entry in self._entries.values())
+            }
+
+# Globale Registry für quellspezifische Regeln
+source_rule_registry = SourceRuleRegistry()
@@ -0,0 +1,140 @@
+"""
+MedTech Data Platform - Startup & Readiness
+Schema-Versionsprüfung und nebenläufige Warm-up-Schritte mit Zeitlimits
+"""
+
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.exc import DBAPIError
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Set
+from datetime import datetime, timezone
+from pathlib import Path
+from functools import lru_cache
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class SchemaVersionError(RuntimeError):
+    """Datenbankschema entspricht nicht dem erwarteten Stand"""
+
+@lru_cache(maxsize=None)
+def alembic_heads(config_path: str) -> Optional[frozenset]:
+    """Head-Revisionen der Alembic-Migrationen; None, wenn keine Konfiguration vorhanden ist"""
+    if not Path(config_path).is_file():
+        return None
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    return frozenset(ScriptDirectory.from_config(Config(config_path)).get_heads())
+
+def _current_revisions(connection) -> Set[str]:
+    try:
+        with connection.begin_nested():
+            return {row[0] for row in connection.execute(text("SELECT version_num FROM alembic_version"))}
+    except DBAPIError:
+        return set()  # Tabelle fehlt: Datenbank nie migriert
+
+def check_schema_version(connection, metadata: MetaData, alembic_config: str) -> None:
+    """
+    Prüft den Schemastand mit einer Abfrage statt create_all
+    - Mit Alembic-Konfiguration: alembic_version muss den Heads entsprechen
+    - Ohne (Schema aus init.sql): alle Tabellen der Modelle müssen existieren
+    """
+    heads = alembic_heads(alembic_config)
+    if heads is not None:
+        current = _current_revisions(connection)
+        if current != heads:
+            raise SchemaVersionError(
+                f"Database schema at revision {', '.join(sorted(current)) or 'none'}, "
+                f"expected {', '.join(sorted(heads))}; run 'alembic upgrade head'"
+            )
+        return
+    
+    missing = set(metadata.tables) - set(inspect(connection).get_table_names())
+    if missing:
+        raise SchemaVersionError(f"Database schema is missing tables: {', '.join(sorted(missing))}")
+
+class StartupStep:
+    """Einzelner Start- oder Warm-up-Schritt"""
+    
+    def __init__(self, name: str, func: Callable[[], Awaitable[Any]], timeout: float, critical: bool = True):
+        self.name = name
+        self.func = func
+        self.timeout = timeout
+        self.critical = critical  # kritisch: muss vor "ready" erfolgreich sein
+
+class StartupState:
+    """
+    Start- und Bereitschaftszustand eines Worker-Prozesses
+    Kritische Schritte laufen nebenläufig und werden abgewartet (Fehler brechen
+    den Start ab); nicht-kritische laufen im Hintergrund weiter, während der
+    Worker bereits bereit meldet
+    """
+    
+    def __init__(self):
+        self.ready = False
+        self.started_at = datetime.now(timezone.utc)
+        self.ready_at: Optional[datetime] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.warmup: Optional[asyncio.Task] = None
+    
+    async def _run_step(self, step: StartupStep) -> None:
+        self.steps[step.name] = {"status": "running", "critical": step.critical}
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(step.func(), step.timeout)
+        except asyncio.TimeoutError:
+            self.steps[step.name].update(status="timeout", error=f"Timed out after {step.timeout}s")
+            raise
+        except Exception as e:
+            self.steps[step.name].update(status="failed", error=str(e))
+            raise
+        else:
+            self.steps[step.name]["status"] = "ok"
+        finally:
+            self.steps[step.name]["duration_ms"] = round((time.monotonic() - started) * 1000, 1)
+    
+    async def _run_warmup(self, steps: List[StartupStep]) -> None:
+        results = await asyncio.gather(*(self._run_step(step) for step in steps), return_exceptions=True)
+        for step, result in zip(steps, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Warm-up step '{step.name}' failed: {self.steps[step.name].get('error')}")
+            else:
+                logger.info(f"✅ Warm-up step '{step.name}' finished in {self.steps[step.name]['duration_ms']}ms")
+    
+    async def start(self, steps: List[StartupStep]) -> None:
+        """Führt kritische Schritte aus und startet die übrigen im Hintergrund"""
+        critical = [step for step in steps if step.critical]
+        background = [step for step in steps if not step.critical]
+        for step in background:
+            self.steps[step.name] = {"status": "pending", "critical": False}
+        
+        results = await asyncio.gather(*(self._run_step(step) for step in critical), return_exceptions=True)
+        failed = [step.name for step, result in zip(critical, results) if isinstance(result, BaseException)]
+        if failed:
+            raise RuntimeError(", ".join(f"{name}: {self.steps[name].get('error')}" for name in failed))
+        
+        if background:
+            self.warmup = asyncio.create_task(self._run_warmup(background))
+        self.ready = True
+        self.ready_at = datetime.now(timezone.utc)
+    
+    async def stop(self) -> None:
+        """Meldet nicht mehr bereit und bricht laufendes Warm-up ab"""
+        self.ready = False
+        if self.warmup is not None and not self.warmup.done():
+            self.warmup.cancel()
+            try:
+                await self.warmup
+            except asyncio.CancelledError:
+                pass
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Bereitschaft und Zustand aller Schritte"""
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at.isoformat(),
+            "ready_at": self.ready_at.isoformat() if self.ready_at else None,
+            "warmup_complete": all(step["status"] not in ("pending", "running") for step in self.steps.values()),
+            "steps": self.steps
+        }
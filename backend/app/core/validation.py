@@ -3,13 +3,22 @@ MedTech Data Platform - Data Validation
 Mehrfache Datenvalidierung und Integritätsprüfungen
 """
 
-from pydantic import BaseModel, Field, validator, root_validator
-from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Callable, FrozenSet, Tuple, AsyncIterator, AsyncIterable, Iterable, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, deque
+from functools import partial
 from datetime import date, datetime
 from enum import Enum
+import asyncio
 import re
 import json
-from decimal import Decimal
+import os
+import threading
+import uuid
+
+if TYPE_CHECKING:
+    from app.core.validation_cache import ValidationResultCache
 
 class ValidationLevel(str, Enum):
     """Validierungsstufen"""
@@ -25,79 +34,538 @@ class ValidationResult(BaseModel):
     score: float = Field(ge=0.0, le=1.0, default=1.0)
     validated_fields: Dict[str, Any] = {}
 
+URL_PATTERN = r"^https?://[^\s/$.?#].[^\s]*$"
+
+def default_validation_rules() -> Dict[str, Any]:
+    """Standard-Validierungsregeln"""
+    return {
+        "approval": {
+            "required_fields": ["title", "approval_type", "status", "region", "authority"],
+            "field_patterns": {
+                "reference_number": r"^[A-Z0-9\-_]{3,50}$",
+                "url": URL_PATTERN
+            },
+            "field_lengths": {
+                "title": {"min": 10, "max": 500},
+                "description": {"min": 0, "max": 10000},
+                "summary": {"min": 0, "max": 2000}
+            },
+            "date_fields": ["submitted_date", "decision_date", "expiry_date"],
+            "enums": {
+                "approval_type": ["fda_510k", "fda_pma", "ce_mark", "mdr", "ivdr", "iso_13485", "tga_artg", "pmda_approval", "mhra_license", "anvisa_registration", "hsa_registration", "health_canada_license", "custom"],
+                "status": ["approved", "pending", "submitted", "rejected", "withdrawn", "suspended", "expired", "under_review"],
+                "device_class": ["class_i", "class_ii", "class_iia", "class_iib", "class_iii", "ivd", "ivd_a", "ivd_b", "ivd_c", "ivd_d"],
+                "priority": ["low", "medium", "high", "critical"]
+            },
+            "region_authorities": {
+                "US": ["FDA"],
+                "EU": ["EMA", "BfArM"],
+                "Germany": ["BfArM"],
+                "UK": ["MHRA"],
+                "Canada": ["Health Canada"],
+                "Australia": ["TGA"],
+                "Japan": ["PMDA"],
+                "Brazil": ["ANVISA"],
+                "Singapore": ["HSA"]
+            },
+            "json_fields": ["tags", "keywords", "document_urls", "attachments", "detailed_analysis", "compliance_requirements"]
+        },
+        "data_source": {
+            "required_fields": ["name", "source_type", "url"],
+            "field_patterns": {
+                "url": URL_PATTERN,
+                "name": r"^[A-Za-z0-9\s\-_\.]{3,255}$"
+            },
+            "json_fields": ["authentication_config", "parsing_config", "validation_rules", "mapping_config"]
+        }
+    }
+
+def parse_date(date_value: Any) -> Optional[date]:
+    """Hilfsfunktion zum Parsen von Datumsangaben"""
+    try:
+        if isinstance(date_value, str):
+            return datetime.fromisoformat(date_value.replace('Z', '+00:00')).date()
+        elif isinstance(date_value, date):
+            return date_value
+        elif isinstance(date_value, datetime):
+            return date_value.date()
+    except:
+        pass
+    return None
+
+class ValidationCheck:
+    """
+    Einzelne Prüfung eines Validierungsplans
+    kind und params beschreiben die Prüfung deklarativ, damit alternative
+    Ausführungswege (z.B. spaltenweise) sie ohne run() nachbilden können
+    """
+    __slots__ = ("name", "fields", "run", "kind", "params")
+    
+    def __init__(
+        self,
+        name: str,
+        fields: FrozenSet[str],
+        run: Callable[[Dict[str, Any], ValidationResult], None],
+        kind: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.fields = fields
+        self.run = run
+        self.kind = kind
+        self.params = params or {}
+    
+    def __repr__(self) -> str:
+        return f"<ValidationCheck(name={self.name})>"
+
+class ValidationPlan:
+    """
+    Kompilierter Validierungsplan für einen Entitätstyp und eine Validierungsstufe
+    Regex-Muster sind vorkompiliert, Enumerationen als frozenset hinterlegt
+    und alle Prüfungen in einer flachen, geordneten Liste zusammengefasst
+    """
+    
+    IMPORTANT_FIELDS = ("title", "description", "summary", "reference_number", "applicant_name", "source_url")
+    
+    def __init__(
+        self,
+        entity_type: str,
+        level: ValidationLevel,
+        rules: Dict[str, Any],
+        version: int,
+        key: Optional[str] = None
+    ):
+        self.entity_type = entity_type
+        self.level = level
+        self.rules = rules
+        self.version = version
+        # Eindeutiger Schlüssel des Regelstands (Cache, Worker-Prozesse)
+        self.key = key or f"{entity_type}:{level.value}:{version}"
+        
+        self.required_fields: Tuple[str, ...] = tuple(rules.get("required_fields", ()))
+        self.field_patterns: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+            (field, re.compile(pattern)) for field, pattern in rules.get("field_patterns", {}).items()
+        )
+        self.field_lengths: Tuple[Tuple[str, Optional[int], Optional[int]], ...] = tuple(
+            (field, constraints.get("min"), constraints.get("max"))
+            for field, constraints in rules.get("field_lengths", {}).items()
+        )
+        self.date_fields: Tuple[str, ...] = tuple(rules.get("date_fields", ()))
+        self.enums: Dict[str, FrozenSet[str]] = {
+            field: frozenset(values) for field, values in rules.get("enums", {}).items()
+        }
+        self.region_authorities: Dict[str, FrozenSet[str]] = {
+            region: frozenset(authorities) for region, authorities in rules.get("region_authorities", {}).items()
+        }
+        self.json_fields: Tuple[str, ...] = tuple(rules.get("json_fields", ()))
+        self.url_pattern = re.compile(URL_PATTERN)
+        
+        if entity_type == "data_source":
+            self.min_score = 0.0
+            self.checks: Tuple[ValidationCheck, ...] = tuple(self._build_data_source_checks())
+        else:
+            self.min_score = 0.8 if level == ValidationLevel.STRICT else 0.6
+            self.checks = tuple(self._build_approval_checks())
+    
+    def __reduce__(self):
+        # Prüfungen sind Closures; für Worker-Prozesse wird aus den Regeln neu kompiliert
+        return (ValidationPlan, (self.entity_type, self.level, self.rules, self.version, self.key))
+    
+    def __repr__(self) -> str:
+        return f"<ValidationPlan(entity_type={self.entity_type}, level={self.level}, checks={len(self.checks)})>"
+    
+    def _build_approval_checks(self) -> List[ValidationCheck]:
+        # Reihenfolge entspricht den Validierungsschritten 1-5
+        checks = [self._required_check(field) for field in self.required_fields]
+        checks += [self._pattern_check(field, pattern) for field, pattern in self.field_patterns]
+        checks += [self._length_check(field, min_len, max_len) for field, min_len, max_len in self.field_lengths]
+        checks += [self._date_format_check(field) for field in self.date_fields]
+        checks.append(ValidationCheck(
+            "date_order", frozenset({"submitted_date", "decision_date"}), self._check_date_order, kind="date_order"
+        ))
+        checks += [self._enum_check(field, values) for field, values in self.enums.items()]
+        checks.append(ValidationCheck(
+            "approved_decision_date", frozenset({"status", "decision_date"}), self._check_approved_decision_date,
+            kind="approved_decision_date"
+        ))
+        checks.append(ValidationCheck(
+            "region_authority", frozenset({"region", "authority"}), self._check_region_authority,
+            kind="region_authority", params={"region_authorities": self.region_authorities}
+        ))
+        checks.append(self._url_check("source_url", "Invalid URL format"))
+        checks += [self._json_check(field, f"Invalid JSON format for field '{field}'") for field in self.json_fields]
+        return checks
+    
+    def _build_data_source_checks(self) -> List[ValidationCheck]:
+        checks = [self._required_check(field) for field in self.required_fields]
+        checks += [self._pattern_check(field, pattern) for field, pattern in self.field_patterns]
+        checks.append(self._url_check("url", "Invalid URL format"))
+        checks += [self._json_check(field, f"Invalid JSON configuration for field '{field}'") for field in self.json_fields]
+        return checks
+    
+    @staticmethod
+    def _required_check(field: str) -> ValidationCheck:
+        message = f"Required field '{field}' is missing or empty"
+        
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if value is None or value == "":
+                result.errors.append(message)
+        
+        return ValidationCheck(
+            f"required:{field}", frozenset({field}), run, kind="required", params={"field": field, "message": message}
+        )
+    
+    @staticmethod
+    def _pattern_check(field: str, pattern: "re.Pattern[str]") -> ValidationCheck:
+        message = f"Field '{field}' does not match required pattern"
+        match = pattern.match
+        
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if value and not match(str(value)):
+                result.errors.append(message)
+        
+        return ValidationCheck(
+            f"pattern:{field}", frozenset({field}), run,
+            kind="pattern", params={"field": field, "pattern": pattern, "message": message}
+        )
+    
+    @staticmethod
+    def _length_check(field: str, min_len: Optional[int], max_len: Optional[int]) -> ValidationCheck:
+        too_short = f"Field '{field}' is too short (minimum: {min_len})"
+        too_long = f"Field '{field}' is too long (maximum: {max_len})"
+        
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if value:
+                value_len = len(str(value))
+                if min_len is not None and value_len < min_len:
+                    result.errors.append(too_short)
+                if max_len is not None and value_len > max_len:
+                    result.errors.append(too_long)
+        
+        return ValidationCheck(
+            f"length:{field}", frozenset({field}), run, kind="length",
+            params={"field": field, "min": min_len, "max": max_len, "too_short": too_short, "too_long": too_long}
+        )
+    
+    @staticmethod
+    def _date_format_check(field: str) -> ValidationCheck:
+        message = f"Invalid date format for '{field}'"
+        
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if not value:
+                return
+            try:
+                if isinstance(value, str):
+                    datetime.fromisoformat(value.replace('Z', '+00:00'))
+                elif not isinstance(value, date):
+                    result.errors.append(message)
+            except ValueError:
+                result.errors.append(message)
+        
+        return ValidationCheck(
+            f"date:{field}", frozenset({field}), run, kind="date", params={"field": field, "message": message}
+        )
+    
+    @staticmethod
+    def _check_date_order(data: Dict[str, Any], result: ValidationResult) -> None:
+        if data.get("submitted_date") and data.get("decision_date"):
+            submitted = parse_date(data["submitted_date"])
+            decision = parse_date(data["decision_date"])
+            if submitted and decision and submitted > decision:
+                result.warnings.append("Submitted date is after decision date")
+    
+    @staticmethod
+    def _enum_check(field: str, valid_values: FrozenSet[str]) -> ValidationCheck:
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if value:
+                try:
+                    is_known = value in valid_values
+                except TypeError:
+                    is_known = False
+                if not is_known:
+                    result.errors.append(f"Invalid value for '{field}': {value}")
+        
+        return ValidationCheck(
+            f"enum:{field}", frozenset({field}), run, kind="enum", params={"field": field, "values": valid_values}
+        )
+    
+    @staticmethod
+    def _check_approved_decision_date(data: Dict[str, Any], result: ValidationResult) -> None:
+        if data.get("status") == "approved" and not data.get("decision_date"):
+            result.warnings.append("Approved approval should have a decision date")
+    
+    def _check_region_authority(self, data: Dict[str, Any], result: ValidationResult) -> None:
+        region = data.get("region")
+        authority = data.get("authority")
+        if region and authority:
+            valid_authorities = self.region_authorities.get(region)
+            if valid_authorities and authority not in valid_authorities:
+                result.warnings.append(f"Authority '{authority}' may not be valid for region '{region}'")
+    
+    def _url_check(self, field: str, message: str) -> ValidationCheck:
+        match = self.url_pattern.match
+        
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if value and not match(value):
+                result.errors.append(message)
+        
+        return ValidationCheck(
+            f"url:{field}", frozenset({field}), run,
+            kind="url", params={"field": field, "pattern": self.url_pattern, "message": message}
+        )
+    
+    @staticmethod
+    def _json_check(field: str, message: str) -> ValidationCheck:
+        def run(data: Dict[str, Any], result: ValidationResult) -> None:
+            value = data.get(field)
+            if value and isinstance(value, str):
+                try:
+                    json.loads(value)
+                except json.JSONDecodeError:
+                    result.errors.append(message)
+        
+        return ValidationCheck(
+            f"json:{field}", frozenset({field}), run, kind="json", params={"field": field, "message": message}
+        )
+    
+    def calculate_score(self, data: Dict[str, Any], result: ValidationResult) -> float:
+        """Berechnet Qualitätsscore basierend auf Validierungsergebnissen"""
+        base_score = 1.0
+        
+        # Abzüge für Fehler und Warnungen
+        base_score -= len(result.errors) * 0.2
+        base_score -= len(result.warnings) * 0.05
+        
+        # Bonuspunkte für vollständige Daten
+        base_score += self.completeness_bonus(data)
+        
+        return max(0.0, min(1.0, base_score))
+    
+    def completeness_bonus(self, data: Dict[str, Any]) -> float:
+        """Bonus für ausgefüllte wichtige Felder"""
+        completeness_bonus = 0
+        for field in self.IMPORTANT_FIELDS:
+            if data.get(field):
+                completeness_bonus += 0.02
+        return completeness_bonus
+    
+    def affected_checks(self, fields: Iterable[str]) -> List[ValidationCheck]:
+        """Prüfungen (in Planreihenfolge), die von mindestens einem der Felder abhängen"""
+        fields = frozenset(fields)
+        return [check for check in self.checks if not check.fields.isdisjoint(fields)]
+    
+    def run(self, data: Dict[str, Any], result: ValidationResult) -> ValidationResult:
+        """Führt alle Prüfungen des Plans aus und bewertet das Ergebnis"""
+        for check in self.checks:
+            check.run(data, result)
+        result.score = self.calculate_score(data, result)
+        result.is_valid = len(result.errors) == 0 and result.score >= self.min_score
+        return result
+
+class ValidationPlanRegistry:
+    """
+    Prozessweiter Cache kompilierter Validierungspläne
+    Pläne werden einmal pro (Entitätstyp, ValidationLevel) gebaut und nur
+    bei geänderten Regeln verworfen
+    """
+    
+    def __init__(self, rules_loader: Callable[[], Dict[str, Any]] = default_validation_rules):
+        self._rules_loader = rules_loader
+        self._rules: Optional[Dict[str, Any]] = None
+        self._plans: Dict[Tuple[str, ValidationLevel], ValidationPlan] = {}
+        self._version = 0
+        self._token = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+    
+    @property
+    def version(self) -> int:
+        """Version der aktuell gültigen Regeln"""
+        return self._version
+    
+    @property
+    def rules(self) -> Dict[str, Any]:
+        """Aktuell gültige Validierungsregeln"""
+        if self._rules is None:
+            with self._lock:
+                if self._rules is None:
+                    self._rules = self._rules_loader()
+        return self._rules
+    
+    def get_plan(self, entity_type: str, level: ValidationLevel) -> ValidationPlan:
+        """Liefert den kompilierten Plan, baut ihn bei Bedarf"""
+        key = (entity_type, ValidationLevel(level))
+        plan = self._plans.get(key)
+        if plan is None:
+            rules = self.rules
+            with self._lock:
+                plan = self._plans.get(key)
+                if plan is None:
+                    plan = ValidationPlan(
+                        entity_type, key[1], rules[entity_type], self._version,
+                        key=f"{self._token}:{self._version}:{entity_type}:{key[1].value}"
+                    )
+                    self._plans[key] = plan
+        return plan
+    
+    def set_rules(self, rules: Dict[str, Any], version: Optional[int] = None) -> None:
+        """Ersetzt die Validierungsregeln und verwirft alle kompilierten Pläne"""
+        with self._lock:
+            self._rules = rules
+            self._plans = {}
+            self._version = self._version + 1 if version is None else version
+    
+    def invalidate(self) -> None:
+        """Lädt die Regeln beim nächsten Zugriff neu"""
+        with self._lock:
+            self._rules = None
+            self._plans = {}
+            self._version += 1
+
+# Globale Plan-Registry
+validation_plans = ValidationPlanRegistry()
+
 class DataValidator:
     """
     Hauptklasse für Datenvalidierung
     Implementiert mehrfache Validierungsschritte
     """
     
-    def __init__(self, level: ValidationLevel = ValidationLevel.STRICT):
+    def __init__(
+        self,
+        level: ValidationLevel = ValidationLevel.STRICT,
+        plans: Optional[ValidationPlanRegistry] = None,
+        cache: Optional["ValidationResultCache"] = None,
+        approval_plan: Optional[ValidationPlan] = None
+    ):
         self.level = level
+        self.plans = plans or validation_plans
+        self.cache = cache
+        # Optionaler Plan für Zulassungen (z.B. quellspezifische Regeln)
+        self.approval_plan = approval_plan
         self.validation_rules = self._load_validation_rules()
     
     def _load_validation_rules(self) -> Dict[str, Any]:
-        """Lädt Validierungsregeln aus Konfiguration"""
-        return {
-            "approval": {
-                "required_fields": ["title", "approval_type", "status", "region", "authority"],
-                "field_patterns": {
-                    "reference_number": r"^[A-Z0-9\-_]{3,50}$",
-                    "url": r"^https?://[^\s/$.?#].[^\s]*$"
-                },
-                "field_lengths": {
-                    "title": {"min": 10, "max": 500},
-                    "description": {"min": 0, "max": 10000},
-                    "summary": {"min": 0, "max": 2000}
-                }
-            },
-            "data_source": {
-                "required_fields": ["name", "source_type", "url"],
-                "field_patterns": {
-                    "url": r"^https?://[^\s/$.?#].[^\s]*$",
-                    "name": r"^[A-Za-z0-9\s\-_\.]{3,255}$"
-                }
-            }
-        }
+        """Lädt Validierungsregeln aus der gemeinsamen Plan-Registry"""
+        return self.plans.rules
+    
+    def get_plan(self, entity_type: str = "approval") -> ValidationPlan:
+        """Kompilierter Validierungsplan für diese Validierungsstufe"""
+        if entity_type == "approval" and self.approval_plan is not None:
+            return self.approval_plan
+        return self.plans.get_plan(entity_type, self.level)
+    
+    def validate_approval_sync(self, data: Dict[str, Any], use_cache: bool = True) -> ValidationResult:
+        """
+        Synchroner Kern von validate_approval (keine I/O)
+        Unveränderte Datensätze werden aus dem Cache beantwortet, falls gesetzt
+        """
+        cache_key = None
+        if use_cache and self.cache is not None:
+            cache_key = self.cache.make_key(data, self.get_plan("approval"))
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return cached
+        
+        result = ValidationResult(is_valid=True)
+        
+        try:
+            # 1.-5. Feld-, Datums-, Enumerations-, Geschäftslogik- und Integritätsprüfungen
+            # 6. Qualitätsbewertung, 7. Gesamtbewertung
+            self.get_plan("approval").run(data, result)
+        
+        except Exception as e:
+            result.is_valid = False
+            result.errors.append(f"Validation error: {str(e)}")
+        
+        if cache_key:
+            self.cache.set(cache_key, result)
+        
+        return result
     
     async def validate_approval(self, data: Dict[str, Any]) -> ValidationResult:
         """
         Validiert eine Zulassung mit mehrfachen Prüfungen
         """
-        result = ValidationResult(is_valid=True)
+        return self.validate_approval_sync(data)
+    
+    def revalidate_approval(
+        self,
+        stored: Dict[str, Any],
+        changes: Dict[str, Any],
+        stored_score: Optional[float] = None
+    ) -> ValidationResult:
+        """
+        Validiert eine Teilaktualisierung gegen den gespeicherten Datensatz
+        Nur Prüfungen, die von geänderten Feldern abhängen, laufen auf dem
+        zusammengeführten Datensatz; der Anteil der übrigen Prüfungen wird aus
+        dem gespeicherten Score übernommen. Ist dieser nicht eindeutig
+        rekonstruierbar (fehlend oder an einer Grenze abgeschnitten, ohne dass
+        das Ergebnis feststeht), wird der zusammengeführte Datensatz voll validiert.
+        """
+        merged = {**stored, **changes}
+        if stored_score is None:
+            return self.validate_approval_sync(merged)
+        
+        changed = {field for field, value in changes.items() if field not in stored or stored[field] != value}
+        result = ValidationResult(is_valid=True, score=stored_score)
+        previous = ValidationResult(is_valid=True)
         
         try:
-            # 1. Grundlegende Feldvalidierung
-            await self._validate_required_fields(data, "approval", result)
-            await self._validate_field_patterns(data, "approval", result)
-            await self._validate_field_lengths(data, "approval", result)
-            
-            # 2. Datumsvalidierung
-            await self._validate_dates(data, result)
-            
-            # 3. Enumerationsvalidierung
-            await self._validate_enums(data, result)
+            plan = self.get_plan("approval")
+            for check in plan.affected_checks(changed):
+                check.run(stored, previous)
+                check.run(merged, result)
             
-            # 4. Geschäftslogik-Validierung
-            await self._validate_business_logic(data, result)
+            # Gewichte wie ValidationPlan.calculate_score
+            affected_before = len(previous.errors) * 0.2 + len(previous.warnings) * 0.05
+            affected_after = len(result.errors) * 0.2 + len(result.warnings) * 0.05
+            bonus_before = plan.completeness_bonus(stored)
+            bonus_after = plan.completeness_bonus(merged)
             
-            # 5. Datenintegrität
-            await self._validate_data_integrity(data, result)
-            
-            # 6. Qualitätsbewertung
-            result.score = await self._calculate_quality_score(data, result)
-            
-            # 7. Gesamtbewertung
-            result.is_valid = (
-                len(result.errors) == 0 and 
-                result.score >= (0.8 if self.level == ValidationLevel.STRICT else 0.6)
-            )
+            if 0.0 < stored_score < 1.0:
+                # Abzüge der nicht betroffenen Prüfungen exakt rekonstruierbar
+                unaffected = 1.0 + bonus_before - stored_score - affected_before
+                score = 1.0 - unaffected - affected_after + bonus_after
+            elif stored_score >= 1.0 and 1.0 + bonus_after - bonus_before + affected_before - affected_after >= 1.0 - 1e-9:
+                # Auch bei größtmöglichen übrigen Abzügen bleibt der Score bei 1.0
+                score = 1.0
+            else:
+                return self.validate_approval_sync(merged)
             
+            result.score = max(0.0, min(1.0, score))
+            result.is_valid = len(result.errors) == 0 and result.score >= plan.min_score
+        
         except Exception as e:
             result.is_valid = False
             result.errors.append(f"Validation error: {str(e)}")
         
         return result
     
+    def validate_changes(self, changes: Dict[str, Any]) -> ValidationResult:
+        """
+        Validiert eine Änderung ohne den gespeicherten Datensatz (Massenänderungen)
+        Es laufen nur Prüfungen, deren Felder vollständig in der Änderung liegen;
+        der Score bleibt unverändert (1.0)
+        """
+        result = ValidationResult(is_valid=True)
+        
+        try:
+            for check in self.get_plan("approval").affected_checks(changes):
+                if check.fields.issubset(changes):
+                    check.run(changes, result)
+        
+        except Exception as e:
+            result.errors.append(f"Validation error: {str(e)}")
+        
+        result.is_valid = len(result.errors) == 0
+        return result
+    
     async def validate_data_source(self, data: Dict[str, Any]) -> ValidationResult:
         """
         Validiert eine Datenquelle
@@ -105,187 +573,117 @@ class DataValidator:
         result = ValidationResult(is_valid=True)
         
         try:
-            # Grundlegende Validierung
-            await self._validate_required_fields(data, "data_source", result)
-            await self._validate_field_patterns(data, "data_source", result)
-            
-            # URL-Validierung
-            await self._validate_url(data.get("url"), result)
-            
-            # Konfigurationsvalidierung
-            await self._validate_config(data, result)
-            
-            result.score = await self._calculate_quality_score(data, result)
-            result.is_valid = len(result.errors) == 0
-            
+            self.get_plan("data_source").run(data, result)
+        
         except Exception as e:
             result.is_valid = False
             result.errors.append(f"Data source validation error: {str(e)}")
         
         return result
     
-    async def _validate_required_fields(self, data: Dict[str, Any], entity_type: str, result: ValidationResult):
-        """Validiert Pflichtfelder"""
-        required_fields = self.validation_rules[entity_type]["required_fields"]
-        
-        for field in required_fields:
-            if field not in data or data[field] is None or data[field] == "":
-                result.errors.append(f"Required field '{field}' is missing or empty")
-    
-    async def _validate_field_patterns(self, data: Dict[str, Any], entity_type: str, result: ValidationResult):
-        """Validiert Feldmuster"""
-        patterns = self.validation_rules[entity_type].get("field_patterns", {})
-        
-        for field, pattern in patterns.items():
-            if field in data and data[field]:
-                if not re.match(pattern, str(data[field])):
-                    result.errors.append(f"Field '{field}' does not match required pattern")
-    
-    async def _validate_field_lengths(self, data: Dict[str, Any], entity_type: str, result: ValidationResult):
-        """Validiert Feldlängen"""
-        lengths = self.validation_rules[entity_type].get("field_lengths", {})
-        
-        for field, constraints in lengths.items():
-            if field in data and data[field]:
-                value_len = len(str(data[field]))
-                if "min" in constraints and value_len < constraints["min"]:
-                    result.errors.append(f"Field '{field}' is too short (minimum: {constraints['min']})")
-                if "max" in constraints and value_len > constraints["max"]:
-                    result.errors.append(f"Field '{field}' is too long (maximum: {constraints['max']})")
-    
-    async def _validate_dates(self, data: Dict[str, Any], result: ValidationResult):
-        """Validiert Datumsfelder"""
-        date_fields = ["submitted_date", "decision_date", "expiry_date"]
-        
-        for field in date_fields:
-            if field in data and data[field]:
-                try:
-                    if isinstance(data[field], str):
-                        datetime.fromisoformat(data[field].replace('Z', '+00:00'))
-                    elif isinstance(data[field], date):
-                        pass  # Already a date
-                    else:
-                        result.errors.append(f"Invalid date format for '{field}'")
-                except ValueError:
-                    result.errors.append(f"Invalid date format for '{field}'")
-        
-        # Datumslogik-Validierung
-        if "submitted_date" in data and "decision_date" in data:
-            if data["submitted_date"] and data["decision_date"]:
-                submitted = self._parse_date(data["submitted_date"])
-                decision = self._parse_date(data["decision_date"])
-                if submitted and decision and submitted > decision:
-                    result.warnings.append("Submitted date is after decision date")
-    
-    async def _validate_enums(self, data: Dict[str, Any], result: ValidationResult):
-        """Validiert Enumerationswerte"""
-        enum_validations = {
-            "approval_type": ["fda_510k", "fda_pma", "ce_mark", "mdr", "ivdr", "iso_13485", "tga_artg", "pmda_approval", "mhra_license", "anvisa_registration", "hsa_registration", "health_canada_license", "custom"],
-            "status": ["approved", "pending", "submitted", "rejected", "withdrawn", "suspended", "expired", "under_review"],
-            "device_class": ["class_i", "class_ii", "class_iia", "class_iib", "class_iii", "ivd", "ivd_a", "ivd_b", "ivd_c", "ivd_d"],
-            "priority": ["low", "medium", "high", "critical"]
-        }
-        
-        for field, valid_values in enum_validations.items():
-            if field in data and data[field]:
-                if data[field] not in valid_values:
-                    result.errors.append(f"Invalid value for '{field}': {data[field]}")
-    
-    async def _validate_business_logic(self, data: Dict[str, Any], result: ValidationResult):
-        """Validiert Geschäftslogik"""
-        # Status-spezifische Validierungen
-        if data.get("status") == "approved":
-            if not data.get("decision_date"):
-                result.warnings.append("Approved approval should have a decision date")
-        
-        # Region-Authority-Konsistenz
-        region_authority_map = {
-            "US": ["FDA"],
-            "EU": ["EMA", "BfArM"],
-            "Germany": ["BfArM"],
-            "UK": ["MHRA"],
-            "Canada": ["Health Canada"],
-            "Australia": ["TGA"],
-            "Japan": ["PMDA"],
-            "Brazil": ["ANVISA"],
-            "Singapore": ["HSA"]
-        }
-        
-        region = data.get("region")
-        authority = data.get("authority")
-        if region and authority:
-            valid_authorities = region_authority_map.get(region, [])
-            if valid_authorities and authority not in valid_authorities:
-                result.warnings.append(f"Authority '{authority}' may not be valid for region '{region}'")
-    
-    async def _validate_data_integrity(self, data: Dict[str, Any], result: ValidationResult):
-        """Validiert Datenintegrität"""
-        # URL-Validierung
-        if "source_url" in data and data["source_url"]:
-            await self._validate_url(data["source_url"], result)
-        
-        # JSON-Feld-Validierung
-        json_fields = ["tags", "keywords", "document_urls", "attachments", "detailed_analysis", "compliance_requirements"]
-        for field in json_fields:
-            if field in data and data[field]:
-                try:
-                    if isinstance(data[field], str):
-                        json.loads(data[field])
-                except json.JSONDecodeError:
-                    result.errors.append(f"Invalid JSON format for field '{field}'")
+    def _parse_date(self, date_value: Any) -> Optional[date]:
+        """Hilfsfunktion zum Parsen von Datumsangaben"""
+        return parse_date(date_value)
+
+class BatchStatistics:
+    """
+    Laufende Statistik einer Batch-Validierung
+    Wird pro Ergebnis inkrementell aktualisiert, ohne die Ergebnisse zu halten
+    """
     
-    async def _validate_url(self, url: str, result: ValidationResult):
-        """Validiert URL-Format"""
-        if url:
-            url_pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-            if not re.match(url_pattern, url):
-                result.errors.append("Invalid URL format")
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self.total = 0
+        self.valid = 0
+        self.score_sum = 0.0
+        self.error_counts: Counter = Counter()
+        self.warning_counts: Counter = Counter()
     
-    async def _validate_config(self, data: Dict[str, Any], result: ValidationResult):
-        """Validiert Konfigurationsfelder"""
-        config_fields = ["authentication_config", "parsing_config", "validation_rules", "mapping_config"]
-        
-        for field in config_fields:
-            if field in data and data[field]:
-                try:
-                    if isinstance(data[field], str):
-                        json.loads(data[field])
-                except json.JSONDecodeError:
-                    result.errors.append(f"Invalid JSON configuration for field '{field}'")
+    def add(self, result: ValidationResult) -> None:
+        """Erfasst ein einzelnes Validierungsergebnis"""
+        self.total += 1
+        if result.is_valid:
+            self.valid += 1
+        self.score_sum += result.score
+        self.error_counts.update(result.errors)
+        self.warning_counts.update(result.warnings)
     
-    async def _calculate_quality_score(self, data: Dict[str, Any], result: ValidationResult) -> float:
-        """Berechnet Qualitätsscore basierend auf Validierungsergebnissen"""
-        base_score = 1.0
-        
-        # Abzüge für Fehler
-        base_score -= len(result.errors) * 0.2
-        
-        # Abzüge für Warnungen
-        base_score -= len(result.warnings) * 0.05
-        
-        # Bonuspunkte für vollständige Daten
-        completeness_bonus = 0
-        important_fields = ["title", "description", "summary", "reference_number", "applicant_name", "source_url"]
-        for field in important_fields:
-            if field in data and data[field]:
-                completeness_bonus += 0.02
+    def to_dict(self) -> Dict[str, Any]:
+        """Aktueller Stand im Format von BatchValidator.get_batch_statistics"""
+        total = self.total
+        return {
+            "total_items": total,
+            "valid_items": self.valid,
+            "invalid_items": total - self.valid,
+            "success_rate": self.valid / total if total > 0 else 0,
+            "average_quality_score": self.score_sum / total if total > 0 else 0,
+            "common_errors": self.error_counts.most_common(self.top_n),
+            "common_warnings": self.warning_counts.most_common(self.top_n)
+        }
+
+# Prozesspool für parallele Batch-Validierung (lazy, prozessweit geteilt)
+_validation_pool: Optional[ProcessPoolExecutor] = None
+_validation_pool_workers = 0
+_validation_pool_lock = threading.Lock()
+
+def get_validation_pool(max_workers: Optional[int] = None) -> Tuple[ProcessPoolExecutor, int]:
+    """Liefert den gemeinsamen Validierungs-Prozesspool und seine Worker-Anzahl"""
+    global _validation_pool, _validation_pool_workers
+    with _validation_pool_lock:
+        if _validation_pool is None:
+            _validation_pool_workers = max_workers or os.cpu_count() or 1
+            _validation_pool = ProcessPoolExecutor(max_workers=_validation_pool_workers)
+        return _validation_pool, _validation_pool_workers
+
+def shutdown_validation_pool() -> None:
+    """Beendet den Validierungs-Prozesspool"""
+    global _validation_pool
+    with _validation_pool_lock:
+        if _validation_pool is not None:
+            _validation_pool.shutdown(wait=False, cancel_futures=True)
+            _validation_pool = None
+
+def _validate_rows(validator: DataValidator, data_list: List[Dict[str, Any]], columnar: bool) -> List[ValidationResult]:
+    """Validiert Datensätze zeilenweise oder spaltenweise (synchron)"""
+    if columnar:
+        from app.core.validation_columnar import ColumnarValidator
         
-        base_score += completeness_bonus
+        cache = validator.cache
+        if cache is None:
+            return ColumnarValidator(validator).validate(data_list)
         
-        return max(0.0, min(1.0, base_score))
+        # Nur nicht gecachte Datensätze spaltenweise validieren
+        plan = validator.get_plan("approval")
+        keys = [cache.make_key(data, plan) for data in data_list]
+        results = [cache.get(key) if key else None for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            fresh = ColumnarValidator(validator).validate([data_list[i] for i in missing])
+            for i, result in zip(missing, fresh):
+                results[i] = result
+                if keys[i]:
+                    cache.set(keys[i], result)
+        return results
     
-    def _parse_date(self, date_value: Any) -> Optional[date]:
-        """Hilfsfunktion zum Parsen von Datumsangaben"""
+    results = []
+    for data in data_list:
         try:
-            if isinstance(date_value, str):
-                return datetime.fromisoformat(date_value.replace('Z', '+00:00')).date()
-            elif isinstance(date_value, date):
-                return date_value
-            elif isinstance(date_value, datetime):
-                return date_value.date()
-        except:
-            pass
-        return None
+            results.append(validator.validate_approval_sync(data))
+        except Exception as e:
+            results.append(ValidationResult(
+                is_valid=False,
+                errors=[f"Batch validation error: {str(e)}"]
+            ))
+    return results
+
+def _validate_chunk(
+    level: ValidationLevel,
+    plan: ValidationPlan,
+    data_list: List[Dict[str, Any]],
+    columnar: bool
+) -> List[ValidationResult]:
+    """Einstiegspunkt im Worker-Prozess: validiert mit dem Plan des Aufrufers"""
+    return _validate_rows(DataValidator(level, approval_plan=plan), data_list, columnar)
 
 class BatchValidator:
     """
@@ -293,52 +691,196 @@ class BatchValidator:
     Optimiert für große Datenmengen
     """
     
-    def __init__(self, validator: DataValidator):
+    def __init__(
+        self,
+        validator: DataValidator,
+        columnar_threshold: Optional[int] = None,
+        parallel_threshold: Optional[int] = None,
+        chunk_size: int = 5000,
+        max_workers: Optional[int] = None
+    ):
         self.validator = validator
+        self.columnar_threshold = columnar_threshold
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+    
+    def _use_columnar(self, size: int) -> bool:
+        return self.columnar_threshold is not None and size >= self.columnar_threshold
     
-    async def validate_batch(self, data_list: List[Dict[str, Any]]) -> Dict[str, ValidationResult]:
+    async def validate_batch(self, data_list: List[Dict[str, Any]], columnar: Optional[bool] = None) -> Dict[str, ValidationResult]:
         """
         Validiert eine Batch von Daten
+        Ab columnar_threshold Einträgen (oder mit columnar=True) spaltenweise,
+        ab parallel_threshold Einträgen verteilt auf den Prozesspool
         """
-        results = {}
+        if self.parallel_threshold is not None and len(data_list) >= self.parallel_threshold:
+            return {f"item_{i}": result async for i, result in self.iter_batch_parallel(data_list, columnar)}
         
-        for i, data in enumerate(data_list):
-            try:
-                result = await self.validator.validate_approval(data)
-                results[f"item_{i}"] = result
-            except Exception as e:
-                results[f"item_{i}"] = ValidationResult(
-                    is_valid=False,
-                    errors=[f"Batch validation error: {str(e)}"]
-                )
+        if columnar is None:
+            columnar = self._use_columnar(len(data_list))
+        if columnar:
+            return self.validate_batch_columnar(data_list)
         
-        return results
+        results = _validate_rows(self.validator, data_list, columnar=False)
+        return {f"item_{i}": result for i, result in enumerate(results)}
     
-    async def get_batch_statistics(self, results: Dict[str, ValidationResult]) -> Dict[str, Any]:
+    async def iter_batch_parallel(
+        self,
+        data_list: List[Dict[str, Any]],
+        columnar: Optional[bool] = None
+    ) -> AsyncIterator[Tuple[int, ValidationResult]]:
         """
-        Berechnet Statistiken für Batch-Validierung
+        Validiert eine Batch in Chunks über den Prozesspool
+        Liefert (Index, Ergebnis) in Eingabereihenfolge, sobald der jeweilige
+        Chunk fertig ist; die Event-Loop bleibt währenddessen frei
         """
-        total = len(results)
-        valid = sum(1 for r in results.values() if r.is_valid)
-        invalid = total - valid
+        async def chunks() -> AsyncIterator[List[Dict[str, Any]]]:
+            for start in range(0, len(data_list), self.chunk_size):
+                yield data_list[start:start + self.chunk_size]
         
-        error_counts = {}
-        warning_counts = {}
+        async for item in self._iter_chunks_parallel(chunks(), columnar):
+            yield item
+    
+    async def validate_stream(
+        self,
+        source: AsyncIterable[Dict[str, Any]],
+        columnar: Optional[bool] = None,
+        parallel: bool = False,
+        statistics: Optional["BatchStatistics"] = None
+    ) -> AsyncIterator[Tuple[int, ValidationResult]]:
+        """
+        Validiert Datensätze aus einem asynchronen Iterator (z.B. NDJSON/CSV)
+        Es werden nur chunk_size Datensätze gleichzeitig gehalten; Ergebnisse
+        werden als (Index, Ergebnis) geliefert und optional in statistics erfasst
+        """
+        chunks = self._chunk_stream(source)
+        if parallel:
+            results = self._iter_chunks_parallel(chunks, columnar)
+        else:
+            results = self._iter_chunks_inline(chunks, columnar)
         
-        for result in results.values():
-            for error in result.errors:
-                error_counts[error] = error_counts.get(error, 0) + 1
-            for warning in result.warnings:
-                warning_counts[warning] = warning_counts.get(warning, 0) + 1
+        async for index, result in results:
+            if statistics is not None:
+                statistics.add(result)
+            yield index, result
+    
+    async def _chunk_stream(self, source: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        chunk = []
+        async for data in source:
+            chunk.append(data)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    async def _iter_chunks_inline(
+        self,
+        chunks: AsyncIterator[List[Dict[str, Any]]],
+        columnar: Optional[bool]
+    ) -> AsyncIterator[Tuple[int, ValidationResult]]:
+        start = 0
+        async for chunk in chunks:
+            chunk_columnar = self._use_columnar(len(chunk)) if columnar is None else columnar
+            for item in enumerate(_validate_rows(self.validator, chunk, chunk_columnar), start):
+                yield item
+            start += len(chunk)
+            # Andere Tasks zwischen zwei Chunks zum Zug kommen lassen
+            await asyncio.sleep(0)
+    
+    async def _iter_chunks_parallel(
+        self,
+        chunks: AsyncIterator[List[Dict[str, Any]]],
+        columnar: Optional[bool]
+    ) -> AsyncIterator[Tuple[int, ValidationResult]]:
+        loop = asyncio.get_running_loop()
+        pool, workers = get_validation_pool(self.max_workers)
+        plan = self.validator.get_plan("approval")
+        # Höchstens zwei Chunks pro Worker gleichzeitig in Arbeit
+        max_in_flight = 2 * workers
+        in_flight = deque()
+        start = 0
         
-        avg_score = sum(r.score for r in results.values()) / total if total > 0 else 0
+        async for chunk in chunks:
+            chunk_columnar = self._use_columnar(len(chunk)) if columnar is None else columnar
+            future = loop.run_in_executor(
+                pool,
+                partial(_validate_chunk, self.validator.level, plan, chunk, chunk_columnar)
+            )
+            in_flight.append((start, len(chunk), future))
+            start += len(chunk)
+            
+            if len(in_flight) >= max_in_flight:
+                for item in await self._collect_chunk(*in_flight.popleft()):
+                    yield item
         
-        return {
-            "total_items": total,
-            "valid_items": valid,
-            "invalid_items": invalid,
-            "success_rate": valid / total if total > 0 else 0,
-            "average_quality_score": avg_score,
-            "common_errors": sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:10],
-            "common_warnings": sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        }
+        while in_flight:
+            for item in await self._collect_chunk(*in_flight.popleft()):
+                yield item
+    
+    async def _collect_chunk(self, start: int, size: int, future: "asyncio.Future[List[ValidationResult]]") -> List[Tuple[int, ValidationResult]]:
+        try:
+            results = await future
+        except Exception as e:
+            results = [
+                ValidationResult(is_valid=False, errors=[f"Batch validation error: {str(e)}"])
+                for _ in range(size)
+            ]
+        return list(enumerate(results, start))
+    
+    def validate_batch_columnar(self, data_list: List[Dict[str, Any]]) -> Dict[str, ValidationResult]:
+        """
+        Validiert eine Batch vektorisiert über pandas/NumPy
+        Liefert dieselben Ergebnisse wie die zeilenweise Validierung
+        """
+        results = _validate_rows(self.validator, data_list, columnar=True)
+        return {f"item_{i}": result for i, result in enumerate(results)}
+    
+    async def validate_batch_per_plan(
+        self,
+        data_list: List[Dict[str, Any]],
+        plans: Dict[str, ValidationPlan],
+        key_field: str = "source_id",
+        columnar: Optional[bool] = None
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validiert eine Batch gruppiert nach key_field (z.B. Datenquelle)
+        Jede Gruppe wird mit ihrem Plan aus plans validiert, Datensätze ohne
+        eigenen Plan mit dem Standardplan; die Reihenfolge bleibt erhalten
+        """
+        groups: Dict[Optional[str], List[int]] = {}
+        for i, data in enumerate(data_list):
+            key = data.get(key_field) if isinstance(data, dict) else None
+            groups.setdefault(str(key) if key is not None else None, []).append(i)
+        
+        results: List[Optional[ValidationResult]] = [None] * len(data_list)
+        for key, indices in groups.items():
+            validator = DataValidator(
+                self.validator.level,
+                plans=self.validator.plans,
+                cache=self.validator.cache,
+                approval_plan=plans.get(key) or self.validator.approval_plan
+            )
+            group_validator = BatchValidator(
+                validator,
+                columnar_threshold=self.columnar_threshold,
+                parallel_threshold=self.parallel_threshold,
+                chunk_size=self.chunk_size,
+                max_workers=self.max_workers
+            )
+            group_results = await group_validator.validate_batch([data_list[i] for i in indices], columnar)
+            for i, result in zip(indices, group_results.values()):
+                results[i] = result
+        
+        return {f"item_{i}": result for i, result in enumerate(results)}
+    
+    async def get_batch_statistics(self, results: Dict[str, ValidationResult]) -> Dict[str, Any]:
+        """
+        Berechnet Statistiken für Batch-Validierung
+        Für Streams stattdessen BatchStatistics an validate_stream übergeben
+        """
+        statistics = BatchStatistics()
+        for result in results.values():
+            statistics.add(result)
+        return statistics.to_dict()
@@ -0,0 +1,102 @@
+"""
+MedTech Data Platform - Validation Result Cache
+Memoisierung von Validierungsergebnissen über einen Inhalts-Hash
+"""
+
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+import time
+
+if TYPE_CHECKING:
+    from app.core.validation import ValidationPlan, ValidationResult
+
+def _json_default(value: Any) -> Dict[str, str]:
+    # Typ mitkodieren, damit z.B. date(2024, 1, 1) und "2024-01-01" verschiedene Schlüssel ergeben
+    return {"__type__": type(value).__name__, "value": str(value)}
+
+class ValidationResultCache:
+    """
+    LRU/TTL-Cache für ValidationResult
+    Schlüssel ist ein stabiler Hash des normalisierten Datensatzes zusammen
+    mit dem Schlüssel des Validierungsplans (Regelstand und Validierungsstufe)
+    """
+    
+    def __init__(self, max_size: int = 100_000, ttl: Optional[float] = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, ValidationResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def make_key(self, data: Dict[str, Any], plan: "ValidationPlan") -> Optional[str]:
+        """Berechnet den Cache-Schlüssel; None, wenn der Datensatz nicht normalisierbar ist"""
+        try:
+            normalized = json.dumps(data, sort_keys=True, separators=(",", ":"), default=_json_default)
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{plan.key}:{digest}"
+    
+    def get(self, key: str) -> Optional["ValidationResult"]:
+        """Liefert eine Kopie des gespeicherten Ergebnisses oder None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry[1].model_copy(deep=True)
+    
+    def set(self, key: str, result: "ValidationResult") -> None:
+        """Speichert eine Kopie des Ergebnisses"""
+        entry = (time.monotonic(), result.model_copy(deep=True))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Leert den Cache und setzt die Zähler zurück"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Treffer-/Fehlzähler und Füllstand"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups > 0 else 0
+            }
+
+_validation_cache: Optional[ValidationResultCache] = None
+
+def get_validation_cache() -> ValidationResultCache:
+    """Prozessweiter Validierungs-Cache (Größe und TTL aus den Settings)"""
+    global _validation_cache
+    if _validation_cache is None:
+        from app.core.config import settings
+        _validation_cache = ValidationResultCache(
+            max_size=settings.VALIDATION_CACHE_SIZE,
+            ttl=settings.VALIDATION_CACHE_TTL
+        )
+    return _validation_cache
@@ -0,0 +1,333 @@
+"""
+MedTech Data Platform - Columnar Validation
+Vektorisierte Batch-Validierung auf Basis von pandas/NumPy
+"""
+
+from typing import List, Dict, Any, Callable, Optional
+from datetime import date, datetime
+from types import SimpleNamespace
+import json
+
+import numpy as np
+import pandas as pd
+
+from app.core.validation import DataValidator, ValidationCheck, ValidationPlan, ValidationResult, parse_date
+
+# Spaltentypen (pandas.api.types.infer_dtype), die keine Sonderbehandlung benötigen
+_STRING_DTYPES = frozenset({"string", "empty"})
+_DATE_DTYPES = frozenset({"string", "empty", "date"})
+
+def _is_unhashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return True
+    return False
+
+def _is_valid_date(value: Any) -> bool:
+    if isinstance(value, str):
+        try:
+            datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return False
+        return True
+    return isinstance(value, date)
+
+def _is_invalid_json(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        json.loads(value)
+    except json.JSONDecodeError:
+        return True
+    return False
+
+def _date_ordinal(value: Any) -> int:
+    parsed = parse_date(value)
+    return parsed.toordinal() if parsed else -1
+
+class BatchFrame:
+    """
+    Spaltenweise Sicht auf eine Batch von Datensätzen
+    Fehlende Schlüssel werden als None geführt (wie dict.get)
+    """
+    
+    def __init__(self, data_list: List[Dict[str, Any]], fields: List[str]):
+        self.size = len(data_list)
+        records = [data if isinstance(data, dict) else {} for data in data_list]
+        # dtype=object verhindert Typ-Inferenz (None bleibt None, int bleibt int)
+        self.frame = pd.DataFrame(records, columns=fields, dtype=object)
+        self._restore_missing(records)
+        self._truthy: Dict[str, np.ndarray] = {}
+    
+    def _restore_missing(self, records: List[Dict[str, Any]]) -> None:
+        """Fehlende Schlüssel füllt pandas mit NaN auf; hier wieder auf None setzen"""
+        for field in self.frame.columns:
+            values = self.frame[field].to_numpy()
+            nan_rows = np.flatnonzero(pd.isna(values) & (values != None))  # noqa: E711 - elementweiser Vergleich
+            missing = [i for i in nan_rows if field not in records[i]]
+            if missing:
+                values = values.copy()
+                values[missing] = None
+                self.frame[field] = values
+    
+    def column(self, field: str) -> pd.Series:
+        return self.frame[field]
+    
+    def values(self, field: str) -> np.ndarray:
+        return self.frame[field].to_numpy()
+    
+    def truthy(self, field: str) -> np.ndarray:
+        """Python-Wahrheitswert jeder Zelle (entspricht 'if value')"""
+        mask = self._truthy.get(field)
+        if mask is None:
+            mask = self.values(field).astype(bool)
+            self._truthy[field] = mask
+        return mask
+    
+    def infer_type(self, field: str) -> str:
+        return pd.api.types.infer_dtype(self.frame[field], skipna=True)
+    
+    def map_values(self, field: str, mask: np.ndarray, func: Callable[[Any], Any], dtype: Any) -> np.ndarray:
+        """
+        Wendet func auf die Zellen unter mask an, je eindeutigem Wert nur einmal
+        Nicht betroffene Zeilen erhalten den Standardwert von dtype
+        """
+        out = np.zeros(self.size, dtype=dtype)
+        if not mask.any():
+            return out
+        subset = self.frame[field][mask]
+        try:
+            codes, uniques = pd.factorize(subset, use_na_sentinel=False)
+            mapped = np.fromiter((func(value) for value in uniques), dtype=dtype, count=len(uniques))
+            out[mask] = mapped[codes]
+        except TypeError:
+            out[mask] = np.fromiter((func(value) for value in subset), dtype=dtype, count=len(subset))
+        return out
+
+class _Collector:
+    """Sammelt Fehler und Warnungen pro Zeile in Prüfreihenfolge"""
+    
+    def __init__(self, size: int):
+        # Listen werden erst beim ersten Eintrag einer Zeile angelegt
+        self.errors: Dict[int, List[str]] = {}
+        self.warnings: Dict[int, List[str]] = {}
+        self.error_count = np.zeros(size, dtype=np.int64)
+        self.warning_count = np.zeros(size, dtype=np.int64)
+    
+    def add(self, target: str, mask: np.ndarray, message: Any) -> None:
+        """message ist ein fester Text oder eine Funktion (Zeilenindex -> Text)"""
+        rows = np.flatnonzero(mask).tolist()
+        if not rows:
+            return
+        messages = self.errors if target == "error" else self.warnings
+        if callable(message):
+            for i in rows:
+                messages.setdefault(i, []).append(message(i))
+        else:
+            for i in rows:
+                messages.setdefault(i, []).append(message)
+        if target == "error":
+            self.error_count[rows] += 1
+        else:
+            self.warning_count[rows] += 1
+
+class ColumnarValidator:
+    """
+    Vektorisierte Ausführung eines kompilierten Validierungsplans
+    Liefert pro Eintrag dieselben Fehler, Warnungen und Scores wie
+    DataValidator.validate_approval_sync
+    """
+    
+    def __init__(self, validator: DataValidator):
+        self.validator = validator
+    
+    def validate(self, data_list: List[Dict[str, Any]]) -> List[ValidationResult]:
+        """
+        Validiert eine Batch spaltenweise
+        Zeilen mit Werten, die im skalaren Pfad Ausnahmen auslösen würden,
+        werden einzeln über den skalaren Validator geprüft
+        """
+        if not data_list:
+            return []
+        
+        plan = self.validator.get_plan("approval")
+        fields = sorted(set().union(*(check.fields for check in plan.checks), plan.IMPORTANT_FIELDS))
+        frame = BatchFrame(data_list, fields)
+        collector = _Collector(frame.size)
+        fallback = self._fallback_rows(plan, frame, data_list)
+        
+        for check in plan.checks:
+            handler = self._handlers.get(check.kind)
+            if handler is None:
+                self._run_scalar(check, data_list, collector, fallback)
+            else:
+                handler(self, check, frame, collector, fallback)
+        
+        # Qualitätsbewertung (gleiche Rechenreihenfolge wie ValidationPlan.calculate_score)
+        base_score = np.full(frame.size, 1.0)
+        base_score -= collector.error_count * 0.2
+        base_score -= collector.warning_count * 0.05
+        completeness_bonus = np.zeros(frame.size)
+        for field in plan.IMPORTANT_FIELDS:
+            completeness_bonus += frame.truthy(field) * 0.02
+        base_score += completeness_bonus
+        scores = np.clip(base_score, 0.0, 1.0)
+        is_valid = (collector.error_count == 0) & (scores >= plan.min_score)
+        
+        results = [
+            ValidationResult(
+                is_valid=bool(is_valid[i]),
+                errors=collector.errors.get(i, []),
+                warnings=collector.warnings.get(i, []),
+                score=float(scores[i]),
+                validated_fields={}
+            )
+            for i in range(frame.size)
+        ]
+        for i in np.flatnonzero(fallback):
+            results[i] = self.validator.validate_approval_sync(data_list[i], use_cache=False)
+        return results
+    
+    def _fallback_rows(self, plan: ValidationPlan, frame: BatchFrame, data_list: List[Dict[str, Any]]) -> np.ndarray:
+        """Zeilen, die nur der skalare Pfad exakt abbilden kann"""
+        fallback = np.fromiter((not isinstance(data, dict) for data in data_list), dtype=bool, count=frame.size)
+        hashed_fields = set()
+        for check in plan.checks:
+            if check.kind == "enum":
+                hashed_fields.add(check.params["field"])
+            elif check.kind == "region_authority":
+                hashed_fields.update(check.fields)
+            elif check.kind == "url":
+                field = check.params["field"]
+                if frame.infer_type(field) not in _STRING_DTYPES:
+                    truthy = frame.truthy(field)
+                    fallback |= truthy & frame.map_values(field, truthy, lambda value: not isinstance(value, str), bool)
+            elif check.kind == "date_order":
+                for field in check.fields:
+                    # datetime ist nicht mit date vergleichbar
+                    if frame.infer_type(field) not in _DATE_DTYPES:
+                        fallback |= np.fromiter(
+                            (isinstance(value, datetime) for value in frame.values(field)), dtype=bool, count=frame.size
+                        )
+        for field in hashed_fields:
+            if frame.infer_type(field) not in _STRING_DTYPES:
+                fallback |= np.fromiter(
+                    (_is_unhashable(value) for value in frame.values(field)), dtype=bool, count=frame.size
+                )
+        return fallback
+    
+    def _run_scalar(self, check: ValidationCheck, data_list: List[Dict[str, Any]], collector: _Collector, fallback: np.ndarray) -> None:
+        """Prüfungen ohne spaltenweise Implementierung zeilenweise ausführen"""
+        for i, data in enumerate(data_list):
+            if fallback[i]:
+                continue
+            target = SimpleNamespace(
+                errors=collector.errors.setdefault(i, []),
+                warnings=collector.warnings.setdefault(i, [])
+            )
+            errors_before, warnings_before = len(target.errors), len(target.warnings)
+            try:
+                check.run(data, target)
+            except Exception:
+                fallback[i] = True
+                continue
+            collector.error_count[i] += len(target.errors) - errors_before
+            collector.warning_count[i] += len(target.warnings) - warnings_before
+    
+    def _check_required(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        values = frame.values(check.params["field"])
+        missing = (values == None) | (values == "")  # noqa: E711 - elementweiser Vergleich
+        collector.add("error", missing, check.params["message"])
+    
+    def _check_pattern(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        field = check.params["field"]
+        truthy = frame.truthy(field)
+        matched = np.zeros(frame.size, dtype=bool)
+        if truthy.any():
+            matched[truthy] = frame.column(field)[truthy].astype(str).str.match(check.params["pattern"]).to_numpy(dtype=bool)
+        collector.add("error", truthy & ~matched, check.params["message"])
+    
+    def _check_length(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        field = check.params["field"]
+        truthy = frame.truthy(field)
+        lengths = np.zeros(frame.size, dtype=np.int64)
+        if truthy.any():
+            lengths[truthy] = frame.column(field)[truthy].astype(str).str.len().to_numpy()
+        if check.params["min"] is not None:
+            collector.add("error", truthy & (lengths < check.params["min"]), check.params["too_short"])
+        if check.params["max"] is not None:
+            collector.add("error", truthy & (lengths > check.params["max"]), check.params["too_long"])
+    
+    def _check_date(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        field = check.params["field"]
+        truthy = frame.truthy(field)
+        valid = frame.map_values(field, truthy, _is_valid_date, bool)
+        collector.add("error", truthy & ~valid, check.params["message"])
+    
+    def _check_date_order(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        submitted_truthy = frame.truthy("submitted_date")
+        decision_truthy = frame.truthy("decision_date")
+        both = submitted_truthy & decision_truthy & ~fallback
+        submitted = frame.map_values("submitted_date", both, _date_ordinal, np.int64)
+        decision = frame.map_values("decision_date", both, _date_ordinal, np.int64)
+        out_of_order = both & (submitted > 0) & (decision > 0) & (submitted > decision)
+        collector.add("warning", out_of_order, "Submitted date is after decision date")
+    
+    def _check_enum(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        field = check.params["field"]
+        truthy = frame.truthy(field) & ~fallback
+        if not truthy.any():
+            return
+        known = np.zeros(frame.size, dtype=bool)
+        known[truthy] = frame.column(field)[truthy].isin(check.params["values"]).to_numpy()
+        values = frame.values(field)
+        collector.add("error", truthy & ~known, lambda i: f"Invalid value for '{field}': {values[i]}")
+    
+    def _check_approved_decision_date(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        approved = frame.values("status") == "approved"
+        collector.add("warning", approved & ~frame.truthy("decision_date"), "Approved approval should have a decision date")
+    
+    def _check_region_authority(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        regions = frame.values("region")
+        authorities = frame.values("authority")
+        candidates = frame.truthy("region") & frame.truthy("authority") & ~fallback
+        if not candidates.any():
+            return
+        invalid = np.zeros(frame.size, dtype=bool)
+        for region, valid_authorities in check.params["region_authorities"].items():
+            if not valid_authorities:
+                continue
+            rows = candidates & (regions == region)
+            if rows.any():
+                invalid[rows] = ~frame.column("authority")[rows].isin(valid_authorities).to_numpy()
+        collector.add(
+            "warning", invalid,
+            lambda i: f"Authority '{authorities[i]}' may not be valid for region '{regions[i]}'"
+        )
+    
+    def _check_url(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        field = check.params["field"]
+        truthy = frame.truthy(field) & ~fallback
+        pattern = check.params["pattern"]
+        invalid = frame.map_values(field, truthy, lambda value: not pattern.match(value), bool)
+        collector.add("error", truthy & invalid, check.params["message"])
+    
+    def _check_json(self, check: ValidationCheck, frame: BatchFrame, collector: _Collector, fallback: np.ndarray) -> None:
+        field = check.params["field"]
+        truthy = frame.truthy(field)
+        invalid = frame.map_values(field, truthy, _is_invalid_json, bool)
+        collector.add("error", truthy & invalid, check.params["message"])
+    
+    _handlers: Dict[Optional[str], Callable[..., None]] = {
+        "required": _check_required,
+        "pattern": _check_pattern,
+        "length": _check_length,
+        "date": _check_date,
+        "date_order": _check_date_order,
+        "enum": _check_enum,
+        "approved_decision_date": _check_approved_decision_date,
+        "region_authority": _check_region_authority,
+        "url": _check_url,
+        "json": _check_json,
+    }
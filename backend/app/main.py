@@ -7,6 +7,7 @@ from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.security import HTTPBearer
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 import logging
@@ -18,6 +19,9 @@ from app.core.logging_config import setup_logging
 from app.api.v1.api import api_router
 from app.core.middleware import setup_middleware
 from app.core.exceptions import setup_exception_handlers
+from app.core.admission import AdmissionController, AdmissionControlMiddleware
+from app.core.compression import CompressionMiddleware, CompressedResponseCache
+from app.core.startup import StartupState, StartupStep, check_schema_version
 
 # Logging Setup
 setup_logging()
@@ -26,35 +30,41 @@ logger = logging.getLogger(__name__)
 # Security
 security = HTTPBearer()
 
+# Start- und Bereitschaftszustand dieses Worker-Prozesses
+startup_state = StartupState()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Application lifespan manager
-    - Startup: Database initialization, cache warming
+    - Startup: Schema version check and cache init (concurrently),
+      data source warm-up in the background after the worker is ready
     - Shutdown: Cleanup resources
     """
     # Startup
     logger.info("🚀 Starting MedTech Data Platform Backend...")
     
     try:
-        # Create database tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("✅ Database tables created successfully")
-        
-        # Initialize cache
         from app.core.cache import init_cache
-        await init_cache()
-        logger.info("✅ Cache initialized successfully")
-        
-        # Warm up data sources
         from app.services.data_source_service import DataSourceService
-        data_service = DataSourceService()
-        await data_service.warm_up_sources()
-        logger.info("✅ Data sources warmed up successfully")
         
-        logger.info("🎉 MedTech Data Platform Backend started successfully!")
+        async def prepare_schema():
+            async with engine.connect() as conn:
+                if settings.SCHEMA_CREATE_ON_STARTUP:
+                    await conn.run_sync(Base.metadata.create_all)
+                    await conn.commit()
+                else:
+                    await conn.run_sync(check_schema_version, Base.metadata, settings.ALEMBIC_CONFIG)
         
+        await startup_state.start([
+            StartupStep("database_schema", prepare_schema, settings.STARTUP_TIMEOUT),
+            StartupStep("cache", init_cache, settings.STARTUP_TIMEOUT),
+            StartupStep("data_sources", DataSourceService().warm_up_sources, settings.WARMUP_TIMEOUT, critical=False)
+        ])
+        logger.info("✅ Database schema and cache ready")
+        
+        logger.info("🎉 MedTech Data Platform Backend started successfully!")
+    
     except Exception as e:
         logger.error(f"❌ Startup failed: {e}")
         raise
@@ -65,17 +75,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("🛑 Shutting down MedTech Data Platform Backend...")
     
     try:
+        # Stop reporting ready and cancel pending warm-up
+        await startup_state.stop()
+        
         # Close database connections
         await engine.dispose()
         logger.info("✅ Database connections closed")
         
+        # Stop validation worker processes
+        from app.core.validation import shutdown_validation_pool
+        shutdown_validation_pool()
+        logger.info("✅ Validation workers stopped")
+        
         # Clear cache
         from app.core.cache import clear_cache
         await clear_cache()
         logger.info("✅ Cache cleared")
         
         logger.info("✅ MedTech Data Platform Backend shutdown complete")
-        
+    
     except Exception as e:
         logger.error(f"❌ Shutdown error: {e}")
 
@@ -114,6 +132,14 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Admission Control (innerhalb von CORS, damit auch 503-Antworten CORS-Header tragen)
+admission_controller = AdmissionController.from_limits(
+    settings.ADMISSION_LIMITS,
+    settings.ADMISSION_QUEUE_BUDGETS_MS
+)
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -129,6 +155,15 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS
 )
 
+# Response Compression (br/zstd/gzip; komprimierte Körper je Inhalts-Hash im Cache)
+compressed_response_cache = CompressedResponseCache(max_bytes=settings.COMPRESSION_CACHE_SIZE)
+if settings.ENABLE_COMPRESSION:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        cache=compressed_response_cache
+    )
+
 # Custom Middleware
 setup_middleware(app)
 
@@ -185,6 +220,34 @@ async def health_check():
             detail=f"Service unhealthy: {str(e)}"
         )
 
+@app.get("/health/live", tags=["Health"])
+async def liveness():
+    """
+    Liveness: der Prozess bedient Anfragen (ohne Abhängigkeiten zu prüfen)
+    """
+    return {"status": "alive"}
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness():
+    """
+    Readiness: Schema geprüft und Cache initialisiert; nicht-kritisches
+    Warm-up kann noch laufen (siehe steps)
+    """
+    readiness_status = startup_state.get_status()
+    if not readiness_status["ready"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=readiness_status)
+    return readiness_status
+
+@app.get("/health/admission", tags=["Health"])
+async def admission_health():
+    """
+    Auslastung der Admission-Control-Kontingente dieses Worker-Prozesses
+    """
+    return {
+        "enabled": settings.ADMISSION_CONTROL_ENABLED,
+        "pools": admission_controller.get_stats()
+    }
+
 @app.get("/stats", tags=["Statistics"])
 async def get_platform_stats():
     """
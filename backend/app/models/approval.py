@@ -3,14 +3,14 @@ MedTech Data Platform - Approval Models
 Modelle für MedTech-Zulassungen und Registrierungen
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, JSON, ForeignKey, Enum, Float, Date
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Boolean, Text, JSON, ForeignKey, Enum, Float, Date, DateTime, Index, select, func, inspect
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.dialects.postgresql import UUID
 from enum import Enum as PyEnum
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 
-from app.models.base import BaseModel
+from app.models.base import Base, BaseModel
 
 class ApprovalType(PyEnum):
     """Typen von Zulassungen"""
@@ -65,6 +65,25 @@ class Approval(BaseModel):
     Repräsentiert eine einzelne Zulassung oder Registrierung
     """
     __tablename__ = "approvals"
+    __table_args__ = (
+        # Keyset-Pagination über (Sortierfeld, id)
+        Index("ix_approvals_created_at_id", "created_at", "id"),
+        Index("ix_approvals_updated_at_id", "updated_at", "id"),
+        Index("ix_approvals_title_id", "title", "id"),
+        Index("ix_approvals_region_id", "region", "id"),
+        Index("ix_approvals_authority_id", "authority", "id"),
+        # Ablauf-Sweeper: status = 'approved' AND expiry_date < heute
+        Index("ix_approvals_status_expiry_date", "status", "expiry_date"),
+        # Trigramm-Indizes (pg_trgm) für die Ähnlichkeitssuche nach Firmennamen
+        Index(
+            "ix_approvals_applicant_name_trgm", "applicant_name",
+            postgresql_using="gin", postgresql_ops={"applicant_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_approvals_manufacturer_name_trgm", "manufacturer_name",
+            postgresql_using="gin", postgresql_ops={"manufacturer_name": "gin_trgm_ops"}
+        ),
+    )
     
     # Grundlegende Informationen
     title = Column(String(500), nullable=False, index=True)
@@ -123,6 +142,7 @@ class Approval(BaseModel):
     confidence_score = Column(Float, default=1.0, nullable=False)  # 0.0 - 1.0
     verification_status = Column(String(50), default="unverified", nullable=False)
     last_verified = Column(String(50), nullable=True)
+    created_by = Column(String(36), nullable=True, index=True)  # User-ID des Erstellers
     
     # Beziehung zur Datenquelle
     source_id = Column(String(36), ForeignKey("data_sources.id"), nullable=False, index=True)
@@ -164,16 +184,21 @@ class Approval(BaseModel):
         return delta.days
     
     def to_dict(self) -> Dict[str, Any]:
-        """Erweiterte Dictionary-Konvertierung mit berechneten Feldern"""
+        """
+        Erweiterte Dictionary-Konvertierung mit berechneten Feldern
+        Anzahlen zugehöriger Einträge nur, wenn sie per undefer mitgeladen wurden
+        """
         base_dict = super().to_dict()
         base_dict.update({
             "is_active": self.is_active,
             "is_expired": self.is_expired,
             "days_until_expiry": self.days_until_expiry,
-            "age_days": self.age_days,
-            "related_documents_count": len(self.related_documents) if self.related_documents else 0,
-            "compliance_checks_count": len(self.compliance_checks) if self.compliance_checks else 0
+            "age_days": self.age_days
         })
+        unloaded = inspect(self).unloaded
+        for name in ("related_documents_count", "compliance_checks_count"):
+            if name not in unloaded:
+                base_dict[name] = getattr(self, name)
         return base_dict
 
 class RelatedDocument(BaseModel):
@@ -231,3 +256,62 @@ class ComplianceCheck(BaseModel):
     
     def __repr__(self) -> str:
         return f"<ComplianceCheck(requirement={self.requirement}, status={self.status})>"
+
+# Anzahl zugehöriger Einträge als korrelierte Unterabfragen, ohne die Beziehungen
+# nachzuladen; deferred: nur Abfragen, die sie ausliefern, laden sie per undefer mit
+Approval.related_documents_count = column_property(
+    select(func.count(RelatedDocument.id))
+    .where(RelatedDocument.approval_id == Approval.id)
+    .correlate_except(RelatedDocument)
+    .scalar_subquery(),
+    deferred=True
+)
+Approval.compliance_checks_count = column_property(
+    select(func.count(ComplianceCheck.id))
+    .where(ComplianceCheck.approval_id == Approval.id)
+    .correlate_except(ComplianceCheck)
+    .scalar_subquery(),
+    deferred=True
+)
+
+class ApprovalStatsRollup(Base):
+    """
+    Vorberechnete Anzahl aktiver Zulassungen je Dimensionskombination
+    Wird bei Schreibzugriffen transaktional fortgeschrieben und periodisch abgeglichen
+    """
+    __tablename__ = "approval_stats_rollup"
+    
+    # Dimensionen (Enum-Werte als Text, "" = ohne Geräteklasse)
+    region = Column(String(100), primary_key=True)
+    authority = Column(String(100), primary_key=True)
+    status = Column(String(50), primary_key=True)
+    approval_type = Column(String(50), primary_key=True)
+    device_class = Column(String(50), primary_key=True, default="")
+    
+    approval_count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return f"<ApprovalStatsRollup(region={self.region}, authority={self.authority}, count={self.approval_count})>"
+
+class ApprovalTask(Base):
+    """
+    Dauerhafte Warteschlange nachgelagerter Aufgaben je Zulassung
+    Ein Eintrag je (Aufgabentyp, Zulassung); erneutes Einstellen fasst zusammen
+    """
+    __tablename__ = "approval_tasks"
+    
+    task_type = Column(String(50), primary_key=True)
+    approval_id = Column(String(36), primary_key=True)
+    payload = Column(JSON, nullable=True)
+    generation = Column(Integer, nullable=False, default=0)  # erhöht bei erneutem Einstellen
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime(timezone=True), nullable=False)  # frühester (nächster) Ausführungszeitpunkt
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_approval_tasks_available_at", "available_at"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<ApprovalTask(task_type={self.task_type}, approval_id={self.approval_id}, attempts={self.attempts})>"
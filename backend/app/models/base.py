@@ -7,6 +7,7 @@ from sqlalchemy import Column, Integer, DateTime, Boolean, String, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
+from enum import Enum
 from typing import Any, Dict, Optional
 import uuid
 
@@ -42,6 +43,13 @@ class BaseModel(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
             for column in self.__table__.columns
         }
     
+    def to_primitive_dict(self) -> Dict[str, Any]:
+        """Spaltenwerte mit Enum-Mitgliedern als deren Werte (z.B. für die Validierung)"""
+        return {
+            key: value.value if isinstance(value, Enum) else value
+            for key, value in BaseModel.to_dict(self).items()
+        }
+    
     def update_from_dict(self, data: Dict[str, Any]) -> None:
         """Aktualisiert das Modell aus einem Dictionary"""
         for key, value in data.items():
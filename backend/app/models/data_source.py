@@ -3,7 +3,7 @@ MedTech Data Platform - Data Source Models
 Modelle für Datenquellen und deren Metadaten
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, JSON, ForeignKey, Enum, Float
+from sqlalchemy import Column, String, Integer, Boolean, Text, JSON, ForeignKey, Enum, Float, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from enum import Enum as PyEnum
@@ -79,6 +79,11 @@ class DataSource(BaseModel):
     last_record_count = Column(Integer, default=0, nullable=False)
     average_response_time = Column(Float, default=0.0, nullable=False)  # Millisekunden
     
+    # Zähler aktiver Einträge (transaktional fortgeschrieben, periodisch nachgezählt)
+    approvals_count = Column(Integer, default=0, server_default="0", nullable=False)
+    updates_count = Column(Integer, default=0, server_default="0", nullable=False)
+    last_record_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Konfiguration
     parsing_config = Column(JSON, nullable=True)
     validation_rules = Column(JSON, nullable=True)
@@ -113,9 +118,7 @@ class DataSource(BaseModel):
         base_dict = super().to_dict()
         base_dict.update({
             "is_healthy": self.is_healthy,
-            "needs_update": self.needs_update,
-            "approvals_count": len(self.approvals) if self.approvals else 0,
-            "updates_count": len(self.regulatory_updates) if self.regulatory_updates else 0
+            "needs_update": self.needs_update
         })
         return base_dict
 
@@ -0,0 +1,46 @@
+"""
+MedTech Data Platform - Approval Bulk Schemas
+Anfragen und Antworten für Massenänderungen von Zulassungen
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date
+
+from app.models.approval import ApprovalType, ApprovalStatus, DeviceClass, Priority
+from app.services.approval_query_service import SearchMode
+
+# Höchstzahl von IDs je Anfrage (größere Mengen über filter)
+BULK_UPDATE_MAX_IDS = 10000
+
+class ApprovalBulkFilter(BaseModel):
+    """Auswahl wie beim Listenabruf"""
+    approval_type: Optional[ApprovalType] = None
+    status: Optional[ApprovalStatus] = None
+    region: Optional[str] = None
+    authority: Optional[str] = None
+    device_class: Optional[DeviceClass] = None
+    priority: Optional[Priority] = None
+    name_similar: Optional[str] = Field(None, min_length=3)
+    expires_before: Optional[date] = None
+    expires_within_days: Optional[int] = Field(None, ge=0)
+    search: Optional[str] = None
+    search_mode: SearchMode = SearchMode.SIMPLE
+
+class ApprovalBulkPatch(BaseModel):
+    """Per Massenänderung setzbare Felder; nur gesetzte Felder werden geändert"""
+    status: Optional[ApprovalStatus] = None
+    priority: Optional[Priority] = None
+    tags: Optional[List[str]] = None  # ersetzt die Tags, null entfernt sie
+
+class ApprovalBulkUpdateRequest(BaseModel):
+    """Massenänderung: entweder ids oder filter, dazu die Änderung"""
+    ids: Optional[List[str]] = Field(None, max_length=BULK_UPDATE_MAX_IDS)
+    filter: Optional[ApprovalBulkFilter] = None
+    patch: ApprovalBulkPatch
+
+class ApprovalBulkUpdateResponse(BaseModel):
+    """Ergebnis einer Massenänderung"""
+    updated_count: int
+    updated_ids: List[str] = []
+    not_found: List[str] = []  # nur bei ids: nicht vorhandene oder gelöschte Zulassungen
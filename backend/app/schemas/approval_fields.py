@@ -0,0 +1,83 @@
+"""
+MedTech Data Platform - Approval Field Sets
+Feldauswahl (fields=) für Zulassungsantworten
+"""
+
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Optional, Tuple, List, Type, Sequence
+from typing_extensions import Annotated, TypedDict
+from functools import lru_cache
+
+from app.models.approval import Approval
+from app.schemas.approval import ApprovalResponse
+from app.schemas.approval_pagination import ApprovalPageResponse
+
+# Große Text-/JSON-Spalten, die Listen standardmäßig nicht ausliefern
+HEAVY_FIELDS = frozenset({
+    "full_text", "detailed_analysis", "risk_assessment", "clinical_data",
+    "regulatory_pathway", "market_impact", "compliance_requirements"
+})
+
+# Felder, die immer geladen und ausgeliefert werden
+REQUIRED_FIELDS = ("id",)
+
+# Anzahl zugehöriger Einträge (column_property, ohne Nachladen der Beziehungen)
+RELATION_COUNT_FIELDS = ("related_documents_count", "compliance_checks_count")
+
+# Auswählbar sind Felder der Antwort, die direkt einer Spalte entsprechen
+SELECTABLE_FIELDS = tuple(
+    name for name in ApprovalResponse.model_fields
+    if name in Approval.__table__.columns or name in RELATION_COUNT_FIELDS
+)
+
+# Kompakte Standardprojektion für Listen
+DEFAULT_LIST_FIELDS = tuple(name for name in SELECTABLE_FIELDS if name not in HEAVY_FIELDS)
+
+def resolve_fields(fields: Optional[str], default: Optional[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+    """
+    Prüft eine kommagetrennte Feldliste; None bedeutet vollständige Antwort
+    fields="*" wählt alle Felder; ValueError bei unbekannten Feldern
+    """
+    if not fields:
+        return default
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    if names == ["*"]:
+        return None
+    unknown = [name for name in names if name not in SELECTABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys([*REQUIRED_FIELDS, *names]))
+
+def _field(model: Type[BaseModel], name: str) -> Any:
+    field = model.model_fields[name]
+    return Annotated[field.annotation, field]
+
+@lru_cache(maxsize=128)
+def _projection_type(fields: Tuple[str, ...]) -> Type:
+    return TypedDict("ApprovalProjection", {name: _field(ApprovalResponse, name) for name in fields})
+
+@lru_cache(maxsize=128)
+def projection_item_adapter(fields: Tuple[str, ...]) -> TypeAdapter:
+    """Vorkompilierter Serializer für Einträge mit den ausgewählten Feldern von ApprovalResponse"""
+    return TypeAdapter(_projection_type(fields))
+
+@lru_cache(maxsize=128)
+def projection_page_adapter(fields: Tuple[str, ...]) -> TypeAdapter:
+    """Vorkompilierter Serializer für Seitenantworten (Felder von ApprovalPageResponse)"""
+    page_fields = {name: _field(ApprovalPageResponse, name) for name in ApprovalPageResponse.model_fields}
+    page_fields["items"] = List[_projection_type(fields)]
+    return TypeAdapter(TypedDict("ApprovalProjectionPage", page_fields))
+
+def serialize_item(fields: Tuple[str, ...], row: Sequence[Any]) -> bytes:
+    """JSON eines Eintrags direkt aus einer Ergebniszeile (Spalten in Reihenfolge von fields)"""
+    return projection_item_adapter(fields).dump_json(dict(zip(fields, row)))
+
+def serialize_page(fields: Tuple[str, ...], rows: Sequence[Sequence[Any]], **page: Any) -> bytes:
+    """
+    JSON einer Seitenantwort direkt aus Ergebniszeilen
+    Ohne Validierung und ORM-Objekte; Ausgabe entspricht ApprovalPageResponse
+    """
+    # Flache Kopie: verschachtelte Modelle bleiben Instanzen für den Serializer
+    content = dict(ApprovalPageResponse(items=[], **page))
+    content["items"] = [dict(zip(fields, row)) for row in rows]
+    return projection_page_adapter(fields).dump_json(content)
@@ -0,0 +1,19 @@
+"""
+MedTech Data Platform - Approval Pagination Schemas
+Listenantworten mit Cursor, Zählstrategie, Trefferausschnitten und Beziehungen
+"""
+
+from typing import Optional, Dict, List
+
+from app.core.pagination import CountStrategy
+from app.schemas.approval import ApprovalListResponse
+from app.schemas.approval_relations import RelatedDocumentResponse, ComplianceCheckResponse
+
+class ApprovalPageResponse(ApprovalListResponse):
+    """Zulassungsliste mit Cursor auf die nächste Seite"""
+    next_cursor: Optional[str] = None
+    count_strategy: CountStrategy = CountStrategy.EXACT  # Herkunft von total
+    highlights: Optional[Dict[str, str]] = None  # Zulassungs-ID -> Trefferausschnitt (Volltextsuche)
+    # Nur mit include=: Zulassungs-ID -> zugehörige Einträge
+    related_documents: Optional[Dict[str, List[RelatedDocumentResponse]]] = None
+    compliance_checks: Optional[Dict[str, List[ComplianceCheckResponse]]] = None
@@ -0,0 +1,50 @@
+"""
+MedTech Data Platform - Approval Relation Schemas
+Zugehörige Dokumente und Compliance-Prüfungen einer Zulassung
+"""
+
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Any
+from datetime import datetime
+
+class RelatedDocumentResponse(BaseModel):
+    """Zugehöriges Dokument einer Zulassung"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: str
+    approval_id: str
+    title: str
+    document_type: str
+    url: Optional[str] = None
+    file_path: Optional[str] = None
+    file_size: Optional[int] = None
+    mime_type: Optional[str] = None
+    language: str
+    version: Optional[str] = None
+    checksum: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+class ComplianceCheckResponse(BaseModel):
+    """Compliance-Prüfung einer Zulassung"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: str
+    approval_id: str
+    requirement: str
+    requirement_type: str
+    status: str
+    description: Optional[str] = None
+    checked_by: Optional[str] = None
+    checked_at: Optional[str] = None
+    next_check_due: Optional[str] = None
+    severity: Optional[str] = None
+    evidence: Optional[Any] = None
+    created_at: datetime
+    updated_at: datetime
+
+# Über include= ladbare Beziehungen und ihre Antwortmodelle
+RELATION_SCHEMAS = {
+    "related_documents": RelatedDocumentResponse,
+    "compliance_checks": ComplianceCheckResponse
+}
@@ -0,0 +1,20 @@
+"""
+MedTech Data Platform - Approval Search Schemas
+Antworten der Ähnlichkeitssuche nach Firmennamen
+"""
+
+from pydantic import BaseModel
+from typing import List
+
+from app.schemas.approval import ApprovalResponse
+
+class ApprovalNameMatch(BaseModel):
+    """Zulassung mit Trigramm-Ähnlichkeit des besten Namensfelds"""
+    approval: ApprovalResponse
+    similarity: float  # 0.0 - 1.0
+
+class ApprovalNameMatchResponse(BaseModel):
+    """Treffer der Namenssuche, nach Ähnlichkeit absteigend"""
+    query: str
+    threshold: float
+    items: List[ApprovalNameMatch] = []
@@ -0,0 +1,268 @@
+"""
+MedTech Data Platform - Approval Bulk Service
+Massenimport über mehrzeilige INSERTs und mengenbasierte Massenänderungen
+"""
+
+from sqlalchemy import insert, update, select, func, Date, Enum as SAEnum
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime
+from collections import Counter
+import logging
+import uuid
+
+from app.models.approval import Approval
+from app.services.approval_statistics_service import ApprovalStatisticsService, rollup_key, ROLLUP_DIMENSIONS
+from app.services.approval_query_service import ApprovalQueryService, SearchMode
+from app.services.approval_task_queue import ApprovalTaskQueue, TASK_POST_CREATE, TASK_POST_UPDATE
+from app.services.source_counter_service import SourceCounterService, SOURCE_COUNTERS
+
+logger = logging.getLogger(__name__)
+
+# Per Massenänderung setzbare Spalten
+BULK_UPDATE_FIELDS = ("status", "priority", "tags")
+
+class BulkCreateResult(BaseModel):
+    """Ergebnis eines Massenimports"""
+    ids: List[Optional[str]] = []  # pro Eingabe-Index; None bei Fehler
+    failures: List[Dict[str, Any]] = []
+    
+    @property
+    def created_ids(self) -> List[str]:
+        """Erzeugte IDs in Eingabereihenfolge"""
+        return [approval_id for approval_id in self.ids if approval_id is not None]
+
+class BulkUpdateResult(BaseModel):
+    """Ergebnis einer Massenänderung"""
+    ids: List[str] = []  # geänderte Zulassungen
+    not_found: List[str] = []  # nur bei ids: nicht vorhanden oder gelöscht
+
+class ApprovalBulkService:
+    """
+    Service für den Massenimport von Zulassungen
+    Alle Zeilen werden in einer Transaktion als mehrzeilige INSERTs in Chunks
+    geschrieben; IDs werden vorab erzeugt und bleiben so in Eingabereihenfolge.
+    Nachgelagerte Aufgaben werden in derselben Transaktion eingestellt
+    """
+    
+    def __init__(self, db: AsyncSession, chunk_size: int = 1000):
+        self.db = db
+        self.chunk_size = max(1, chunk_size)
+        self.table = Approval.__table__
+        self._columns = {column.name: column for column in self.table.columns}
+    
+    def prepare_row(self, data: Dict[str, Any], user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Wandelt einen Datensatz in Spaltenwerte um
+        Unbekannte Felder und None werden ausgelassen (Spalten-Defaults greifen);
+        user_id wird als Ersteller gesetzt
+        """
+        row = {}
+        for key, value in data.items():
+            column = self._columns.get(key)
+            if column is None or value is None:
+                continue
+            column_type = column.type
+            if isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+                if not isinstance(value, column_type.enum_class):
+                    value = column_type.enum_class(value)
+            elif isinstance(column_type, Date) and isinstance(value, str):
+                value = date.fromisoformat(value)
+            elif isinstance(column_type, Date) and isinstance(value, datetime):
+                value = value.date()
+            row[key] = value
+        row.setdefault("id", str(uuid.uuid4()))
+        if user_id is not None:
+            row["created_by"] = str(user_id)
+        return row
+    
+    async def bulk_create(self, data_list: List[Dict[str, Any]], user_id: Optional[str] = None) -> BulkCreateResult:
+        """
+        Legt Zulassungen in einer Transaktion an
+        Schlägt ein Chunk fehl, wird er per Savepoint halbiert wiederholt, bis
+        die fehlerhaften Zeilen einzeln mit ihrem Index gemeldet werden können
+        """
+        result = BulkCreateResult(ids=[None] * len(data_list))
+        
+        prepared: List[Tuple[int, Dict[str, Any]]] = []
+        for index, data in enumerate(data_list):
+            try:
+                prepared.append((index, self.prepare_row(data, user_id)))
+            except (ValueError, TypeError) as e:
+                result.failures.append({"index": index, "error": str(e)})
+        
+        try:
+            for start in range(0, len(prepared), self.chunk_size):
+                await self._insert_chunk(prepared[start:start + self.chunk_size], result)
+            
+            # Statistik-Rollup und Quellen-Zähler in derselben Transaktion fortschreiben
+            created = [
+                row for index, row in prepared
+                if result.ids[index] is not None and not row.get("is_deleted")
+            ]
+            await ApprovalStatisticsService(self.db).apply_deltas(Counter(rollup_key(row) for row in created))
+            counter = SOURCE_COUNTERS[self.table.name]
+            await SourceCounterService(self.db).apply_deltas(
+                Counter((row["source_id"], counter) for row in created),
+                {row["source_id"] for row in created}
+            )
+            await ApprovalTaskQueue(self.db).enqueue(TASK_POST_CREATE, result.created_ids)
+            
+            await self.db.commit()
+        
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        result.failures.sort(key=lambda failure: failure["index"])
+        logger.info(f"Bulk insert created {len(result.created_ids)} approvals, {len(result.failures)} failed")
+        return result
+    
+    async def _insert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        # executemany erfordert gleiche Schlüssel je Parametersatz
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for group in groups.values():
+            await self.db.execute(insert(self.table), group)
+    
+    async def _insert_chunk(self, chunk: List[Tuple[int, Dict[str, Any]]], result: BulkCreateResult) -> None:
+        try:
+            async with self.db.begin_nested():
+                await self._insert_rows([row for _, row in chunk])
+        except SQLAlchemyError as e:
+            if len(chunk) == 1:
+                result.failures.append({"index": chunk[0][0], "error": str(getattr(e, "orig", None) or e)})
+                return
+            # Fehlerhafte Zeilen durch Halbieren eingrenzen
+            middle = len(chunk) // 2
+            await self._insert_chunk(chunk[:middle], result)
+            await self._insert_chunk(chunk[middle:], result)
+            return
+        for index, row in chunk:
+            result.ids[index] = row["id"]
+    
+    def prepare_changes(self, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wandelt eine Massenänderung in Spaltenwerte um
+        ValueError bei leeren Änderungen, nicht änderbaren Feldern oder None für Pflichtspalten
+        """
+        if not patch:
+            raise ValueError("Patch is empty")
+        changes = {}
+        for key, value in patch.items():
+            if key not in BULK_UPDATE_FIELDS:
+                raise ValueError(f"Field '{key}' cannot be changed in bulk")
+            column = self._columns[key]
+            if value is None:
+                if not column.nullable:
+                    raise ValueError(f"Field '{key}' cannot be null")
+            elif isinstance(column.type, SAEnum) and not isinstance(value, column.type.enum_class):
+                value = column.type.enum_class(value)
+            changes[key] = value
+        return changes
+    
+    def target_condition(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        search: Optional[str] = None,
+        search_mode: SearchMode = SearchMode.SIMPLE
+    ):
+        """
+        WHERE-Bedingung einer Auswahl mit Filtern wie beim Listenabruf
+        Ohne Filter nur der Ausschluss gelöschter Zulassungen (Auswahl per IDs)
+        """
+        query_service = ApprovalQueryService(self.db, search_mode=search_mode)
+        filters = ApprovalQueryService.normalize_filters(filters or {})
+        return query_service.build_filtered_query(select(self.table.c.id), filters, search).whereclause
+    
+    def _id_chunks(self, ids: List[str]) -> List[List[str]]:
+        unique_ids = list(dict.fromkeys(ids))
+        return [unique_ids[start:start + self.chunk_size] for start in range(0, len(unique_ids), self.chunk_size)]
+    
+    async def affected_sources(self, condition, ids: Optional[List[str]] = None) -> List[str]:
+        """Datenquellen der ausgewählten Zulassungen (für quellspezifische Validierung)"""
+        conditions = [condition] if ids is None else [condition & self.table.c.id.in_(chunk) for chunk in self._id_chunks(ids)]
+        sources = set()
+        for chunk_condition in conditions:
+            result = await self.db.execute(select(self.table.c.source_id).where(chunk_condition).distinct())
+            sources.update(result.scalars())
+        return sorted(sources)
+    
+    async def bulk_update(
+        self,
+        changes: Dict[str, Any],
+        condition,
+        ids: Optional[List[str]] = None,
+        task_payload: Optional[Dict[str, Any]] = None
+    ) -> BulkUpdateResult:
+        """
+        Ändert alle ausgewählten Zulassungen in einer Transaktion
+        Je Chunk werden die Zeilen gesperrt und per UPDATE ... WHERE id IN (...)
+        RETURNING id geändert; Filter-Auswahlen laufen per Keyset über die ID.
+        Statistik-Rollup, updated_at und die nachgelagerten Aufgaben werden mitgeschrieben
+        """
+        result = BulkUpdateResult()
+        deltas = Counter()
+        
+        try:
+            if ids is not None:
+                chunks = self._id_chunks(ids)
+                for chunk in chunks:
+                    await self._update_chunk(changes, condition & self.table.c.id.in_(chunk), None, result, deltas)
+                updated = set(result.ids)
+                result.not_found = [approval_id for chunk in chunks for approval_id in chunk if approval_id not in updated]
+            else:
+                last_id = None
+                while True:
+                    chunk_condition = condition if last_id is None else condition & (self.table.c.id > last_id)
+                    selected = await self._update_chunk(changes, chunk_condition, self.chunk_size, result, deltas)
+                    if len(selected) < self.chunk_size:
+                        break
+                    last_id = selected[-1]
+            
+            await ApprovalStatisticsService(self.db).apply_deltas(Counter({key: delta for key, delta in deltas.items() if delta}))
+            await ApprovalTaskQueue(self.db).enqueue(TASK_POST_UPDATE, result.ids, task_payload)
+            await self.db.commit()
+        
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        logger.info(f"Bulk update changed {len(result.ids)} approvals ({', '.join(changes)})")
+        return result
+    
+    async def _update_chunk(
+        self,
+        changes: Dict[str, Any],
+        condition,
+        limit: Optional[int],
+        result: BulkUpdateResult,
+        deltas: Counter
+    ) -> List[str]:
+        # Zeilen sperren und alte Rollup-Schlüssel lesen (RETURNING liefert nur neue Werte)
+        query = select(self.table.c.id, *(self.table.c[name] for name in ROLLUP_DIMENSIONS)).where(condition)
+        query = query.order_by(self.table.c.id).with_for_update()
+        if limit is not None:
+            query = query.limit(limit)
+        rows = (await self.db.execute(query)).mappings().all()
+        if not rows:
+            return []
+        
+        statement = (
+            update(self.table)
+            .where(self.table.c.id.in_([row["id"] for row in rows]))
+            .values(updated_at=func.now(), **changes)
+            .returning(self.table.c.id)
+        )
+        updated = set((await self.db.execute(statement)).scalars())
+        
+        for row in rows:
+            if row["id"] not in updated:
+                continue
+            result.ids.append(row["id"])
+            deltas[rollup_key(row)] -= 1
+            deltas[rollup_key({**row, **changes})] += 1
+        return [row["id"] for row in rows]
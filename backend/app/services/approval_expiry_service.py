@@ -0,0 +1,68 @@
+"""
+MedTech Data Platform - Approval Expiry Service
+Mengenbasierter Ablauf von Zulassungen über expiry_date
+"""
+
+from sqlalchemy import update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from collections import Counter
+import logging
+
+from app.core.pagination import approval_counts
+from app.models.approval import Approval, ApprovalStatus
+from app.services.approval_statistics_service import ApprovalStatisticsService, rollup_key, ROLLUP_DIMENSIONS
+
+logger = logging.getLogger(__name__)
+
+# Zulassungen in diesem Status laufen nach expiry_date ab
+EXPIRABLE_STATUS = ApprovalStatus.APPROVED
+
+class ApprovalExpiryService:
+    """
+    Service für den Ablauf von Zulassungen
+    Abgelaufene Zulassungen werden in einem UPDATE über den Index
+    (status, expiry_date) umgestellt, nicht einzeln in Python geprüft
+    """
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def sweep(self, today: Optional[date] = None) -> List[str]:
+        """
+        Setzt genehmigte Zulassungen mit expiry_date vor heute auf EXPIRED
+        Statistik-Rollup wird in derselben Transaktion fortgeschrieben
+        Rückgabe: IDs der abgelaufenen Zulassungen
+        """
+        table = Approval.__table__
+        statement = (
+            update(table)
+            .where(
+                table.c.status == EXPIRABLE_STATUS,
+                table.c.expiry_date < (today or date.today()),
+                table.c.is_deleted.is_(False)
+            )
+            .values(status=ApprovalStatus.EXPIRED, updated_at=func.now())
+            .returning(table.c.id, *(table.c[name] for name in ROLLUP_DIMENSIONS))
+        )
+        
+        try:
+            rows = (await self.db.execute(statement)).mappings().all()
+            
+            # Vorheriger Status ist für alle Zeilen EXPIRABLE_STATUS
+            deltas = Counter()
+            for row in rows:
+                deltas[rollup_key({**row, "status": EXPIRABLE_STATUS})] -= 1
+                deltas[rollup_key(row)] += 1
+            await ApprovalStatisticsService(self.db).apply_deltas(deltas)
+            
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        if rows:
+            approval_counts.invalidate()
+            logger.info(f"Expired {len(rows)} approvals past their expiry date")
+        return [row["id"] for row in rows]
@@ -0,0 +1,95 @@
+"""
+MedTech Data Platform - Approval Export Service
+Streaming-Export von Zulassungen als CSV
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict, Any, AsyncIterator, Sequence
+from datetime import date, datetime
+from enum import Enum
+import csv
+import io
+import json
+import zlib
+
+from app.models.approval import Approval
+
+# Standardspalten des CSV-Exports
+DEFAULT_EXPORT_COLUMNS = (
+    "id", "title", "approval_type", "status", "device_class", "priority",
+    "reference_number", "applicant_name", "manufacturer_name",
+    "submitted_date", "decision_date", "expiry_date",
+    "region", "country", "authority", "category", "source_url", "source_id"
+)
+
+def _format_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+class ApprovalExportService:
+    """
+    Service für den CSV-Export von Zulassungen
+    Zeilen werden über einen serverseitigen Cursor partitionsweise gelesen
+    und direkt als CSV-Chunks ausgegeben; der Speicherbedarf ist konstant
+    """
+    
+    def __init__(self, db: AsyncSession, chunk_rows: int = 1000):
+        self.db = db
+        self.chunk_rows = max(1, chunk_rows)
+        self._columns = Approval.__table__.columns
+    
+    def resolve_columns(self, columns: Optional[str]) -> List[str]:
+        """Kommagetrennte Spaltenliste prüfen; ValueError bei unbekannten Spalten"""
+        if not columns:
+            return list(DEFAULT_EXPORT_COLUMNS)
+        names = [name.strip() for name in columns.split(",") if name.strip()]
+        unknown = [name for name in names if name not in self._columns]
+        if unknown:
+            raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+        if not names:
+            raise ValueError("No export columns given")
+        return names
+    
+    def build_query(self, filters: Dict[str, Any], columns: Sequence[str]):
+        """Abfrage nur der exportierten Spalten, stabil nach ID sortiert"""
+        query = select(*(self._columns[name] for name in columns)).where(Approval.is_deleted.is_(False))
+        for key, value in filters.items():
+            query = query.where(self._columns[key] == value)
+        return query.order_by(Approval.id)
+    
+    async def iter_csv(self, filters: Dict[str, Any], columns: Sequence[str]) -> AsyncIterator[bytes]:
+        """Liefert die CSV-Datei als Folge von Byte-Chunks (Kopfzeile zuerst)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        
+        query = self.build_query(filters, columns).execution_options(yield_per=self.chunk_rows)
+        result = await self.db.stream(query)
+        try:
+            async for partition in result.partitions():
+                writer.writerows([_format_value(value) for value in row] for row in partition)
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        finally:
+            await result.close()
+        
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Komprimiert einen Byte-Stream fortlaufend im gzip-Format"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,446 @@
+"""
+MedTech Data Platform - Approval Query Service
+Listenabfragen für Zulassungen mit Keyset-Pagination, Volltext- und Namenssuche
+"""
+
+from sqlalchemy import select, func, or_, tuple_, text, literal_column, DateTime, Enum as SAEnum
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer
+from typing import List, Optional, Dict, Any, Tuple, Sequence
+from datetime import date, datetime, timedelta
+from enum import Enum
+import json
+import logging
+
+from app.core.pagination import encode_cursor, decode_cursor, CountStrategy, CountCache, approval_counts
+from app.models.approval import Approval, RelatedDocument, ComplianceCheck
+
+logger = logging.getLogger(__name__)
+
+# Sortierfelder mit Keyset-Unterstützung (NOT NULL, je ein Index auf (Feld, id) in Modell und init.sql)
+KEYSET_SORT_FIELDS = ("created_at", "updated_at", "title", "region", "authority")
+
+# Unterhalb dieser geschätzten Anzahl wird exakt gezählt
+ESTIMATE_EXACT_THRESHOLD = 10_000
+
+# Textsuchkonfiguration als Literal, damit die Ausdrücke den GIN-Indizes aus init.sql entsprechen
+FULLTEXT_CONFIG = literal_column("'english'::regconfig")
+# Gewichtung für das Ranking: Titel vor Zusammenfassung vor Volltext
+FULLTEXT_WEIGHTS = (("title", "A"), ("summary", "B"), ("full_text", "C"))
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=30, MinWords=10, StartSel=<mark>, StopSel=</mark>"
+
+# Trigramm-Ähnlichkeit (pg_trgm) für Firmennamen
+NAME_SIMILARITY_FIELDS = ("applicant_name", "manufacturer_name")
+NAME_SIMILAR_FILTER = "name_similar"  # Filter: Trigramm-Treffer auf einem der Namensfelder
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+# Bereichsfilter auf expiry_date (Index auf expiry_date)
+EXPIRES_BEFORE_FILTER = "expires_before"  # expiry_date < Datum
+EXPIRES_WITHIN_DAYS_FILTER = "expires_within_days"  # heute <= expiry_date <= heute + Tage
+
+# Über include= ladbare Beziehungen
+RELATION_MODELS = {"related_documents": RelatedDocument, "compliance_checks": ComplianceCheck}
+
+# Anzahlen je Beziehung (column_property, deferred); nur Abfragen für ApprovalResponse laden sie mit
+RELATION_COUNTS = tuple(f"{name}_count" for name in RELATION_MODELS)
+
+class SearchMode(str, Enum):
+    """Art der Suche über den search-Parameter"""
+    SIMPLE = "simple"      # ILIKE auf Titel und Beschreibung
+    FULLTEXT = "fulltext"  # websearch_to_tsquery über Titel, Zusammenfassung und Volltext, nach Relevanz sortiert
+
+class ApprovalQueryService:
+    """
+    Service für Listenabfragen von Zulassungen
+    Seiten werden über (Sortierfeld, id) adressiert; der Aufwand pro Seite
+    hängt nur von limit ab, nicht von der Position in der Ergebnismenge
+    """
+    
+    def __init__(
+        self,
+        db: AsyncSession,
+        counts: Optional[CountCache] = None,
+        search_mode: SearchMode = SearchMode.SIMPLE,
+        fields: Optional[Sequence[str]] = None,
+        include: Sequence[str] = ()
+    ):
+        self.db = db
+        self.counts = counts or approval_counts
+        self.search_mode = search_mode
+        self.fields = fields  # None = ORM-Objekte mit allen Spalten, sonst Zeilen mit den Feldern
+        self.include = tuple(include)  # Beziehungen, die je Seite gebündelt geladen werden
+    
+    @property
+    def is_postgresql(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+    
+    @property
+    def fulltext(self) -> bool:
+        """Volltextsuche aktiv (nur PostgreSQL, sonst einfache Suche)"""
+        return self.search_mode == SearchMode.FULLTEXT and self.is_postgresql
+    
+    def select_approvals(self, *required: str):
+        """
+        SELECT auf Zulassungen; bei Feldauswahl als Zeilen nur mit den benötigten
+        Spalten (ausgewählte Felder zuerst, in deren Reihenfolge). Vollständige
+        Objekte laden die zurückgestellten Anzahlen mit, da die Antwort sie enthält
+        """
+        if self.fields is None:
+            return select(Approval).options(
+                *(undefer(getattr(Approval, name)) for name in RELATION_COUNTS),
+                *(selectinload(getattr(Approval, name)) for name in self.include)
+            )
+        names = dict.fromkeys([*self.fields, *required, "id", "updated_at"])
+        return select(*(getattr(Approval, name) for name in names))
+    
+    @staticmethod
+    def resolve_include(include: Optional[str]) -> Tuple[str, ...]:
+        """Prüft eine kommagetrennte Liste von Beziehungen; ValueError bei unbekannten"""
+        names = tuple(dict.fromkeys(name.strip() for name in (include or "").split(",") if name.strip()))
+        unknown = [name for name in names if name not in RELATION_MODELS]
+        if unknown:
+            raise ValueError(f"Unknown relations: {', '.join(unknown)}")
+        return names
+    
+    async def get_relations(self, approvals: List[Any]) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Zugehörige Einträge der Seite je Beziehung (Zulassungs-ID -> Einträge)
+        ORM-Objekte wurden per selectinload geladen; für Zeilen wird je
+        Beziehung eine gebündelte IN-Abfrage ausgeführt
+        """
+        relations = {}
+        approval_ids = [approval.id for approval in approvals]
+        for name in self.include:
+            grouped = {approval_id: [] for approval_id in approval_ids}
+            if self.fields is None:
+                for approval in approvals:
+                    grouped[approval.id] = list(getattr(approval, name))
+            elif approval_ids:
+                model = RELATION_MODELS[name]
+                result = await self.db.execute(
+                    select(model).where(model.approval_id.in_(approval_ids)).order_by(model.created_at, model.id)
+                )
+                for item in result.scalars():
+                    grouped[item.approval_id].append(item)
+            relations[name] = grouped
+        return relations
+    
+    async def _fetch(self, query) -> List[Any]:
+        # ORM-Objekte oder bei Feldauswahl Zeilen (Attributzugriff über Spaltennamen)
+        result = await self.db.execute(query)
+        return list(result.scalars().all() if self.fields is None else result.all())
+    
+    @staticmethod
+    def supports_keyset(sort_by: str) -> bool:
+        """Prüft, ob nach dem Feld per Cursor paginiert werden kann"""
+        return sort_by in KEYSET_SORT_FIELDS
+    
+    @staticmethod
+    def normalize_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prüft Filter gegen die Spalten und wandelt Enum-Werte um
+        Listen werden als IN-Filter behandelt; ValueError bei unbekannten Feldern
+        """
+        columns = Approval.__table__.columns
+        normalized = {}
+        for key, value in filters.items():
+            if value is None:
+                continue
+            if key == NAME_SIMILAR_FILTER:
+                normalized[key] = str(value)
+                continue
+            if key == EXPIRES_BEFORE_FILTER:
+                normalized[key] = value if isinstance(value, date) else date.fromisoformat(str(value))
+                continue
+            if key == EXPIRES_WITHIN_DAYS_FILTER:
+                if int(value) < 0:
+                    raise ValueError(f"'{key}' must not be negative")
+                normalized[key] = int(value)
+                continue
+            if key not in columns:
+                raise ValueError(f"Unknown filter field '{key}'")
+            enum_class = getattr(columns[key].type, "enum_class", None) if isinstance(columns[key].type, SAEnum) else None
+            if enum_class is not None:
+                if isinstance(value, (list, tuple)):
+                    value = [item if isinstance(item, enum_class) else enum_class(item) for item in value]
+                elif not isinstance(value, enum_class):
+                    value = enum_class(value)
+            normalized[key] = value
+        return normalized
+    
+    def build_filtered_query(self, query, filters: Dict[str, Any], search: Optional[str] = None):
+        """Wendet Filter, Suche und Soft-Delete auf eine Abfrage an"""
+        query = query.where(Approval.is_deleted.is_(False))
+        for key, value in filters.items():
+            if key == NAME_SIMILAR_FILTER:
+                query = query.where(self._name_match(value))
+                continue
+            if key == EXPIRES_BEFORE_FILTER:
+                query = query.where(Approval.expiry_date < value)
+                continue
+            if key == EXPIRES_WITHIN_DAYS_FILTER:
+                today = date.today()
+                query = query.where(Approval.expiry_date.between(today, today + timedelta(days=value)))
+                continue
+            column = getattr(Approval, key)
+            query = query.where(column.in_(value) if isinstance(value, (list, tuple)) else column == value)
+        if search and self.fulltext:
+            query = query.where(self._fulltext_match(self._tsquery(search)))
+        elif search:
+            pattern = f"%{search}%"
+            query = query.where(or_(Approval.title.ilike(pattern), Approval.description.ilike(pattern)))
+        return query
+    
+    def _name_match(self, name: str, fields: Tuple[str, ...] = NAME_SIMILARITY_FIELDS):
+        # Operator % nutzt die Trigramm-GIN-Indizes (Schwelle: pg_trgm.similarity_threshold)
+        if self.is_postgresql:
+            return or_(*(getattr(Approval, field).op("%")(name) for field in fields))
+        pattern = f"%{name}%"
+        return or_(*(getattr(Approval, field).ilike(pattern) for field in fields))
+    
+    @staticmethod
+    def _tsquery(search: str):
+        return func.websearch_to_tsquery(FULLTEXT_CONFIG, search)
+    
+    @staticmethod
+    def _fulltext_match(tsquery):
+        # Je Spalte ein eigener Treffer-Ausdruck, damit jeder GIN-Index genutzt wird (BitmapOr)
+        return or_(*(
+            func.to_tsvector(FULLTEXT_CONFIG, getattr(Approval, field)).op("@@")(tsquery)
+            for field, _ in FULLTEXT_WEIGHTS
+        ))
+    
+    @staticmethod
+    def _fulltext_rank(tsquery):
+        vector = None
+        for field, weight in FULLTEXT_WEIGHTS:
+            weighted = func.setweight(
+                func.to_tsvector(FULLTEXT_CONFIG, func.coalesce(getattr(Approval, field), "")),
+                literal_column(f"'{weight}'::\"char\"")
+            )
+            vector = weighted if vector is None else vector.op("||")(weighted)
+        return func.ts_rank_cd(vector, tsquery)
+    
+    def encode_position(self, approval: Approval, sort_by: str, sort_order: str) -> str:
+        """Cursor auf die Position nach dieser Zulassung"""
+        return encode_cursor({
+            "s": sort_by,
+            "o": sort_order,
+            "v": getattr(approval, sort_by),
+            "id": approval.id
+        })
+    
+    def decode_position(self, cursor: str, sort_by: str, sort_order: str) -> Tuple[Any, str]:
+        """Liest (Sortwert, id) aus einem Cursor; ValueError bei ungültigem Cursor"""
+        payload = decode_cursor(cursor)
+        if payload.get("s") != sort_by or payload.get("o") != sort_order:
+            raise ValueError("Cursor does not match sort_by/sort_order")
+        value, approval_id = payload.get("v"), payload.get("id")
+        if not isinstance(value, str) or not isinstance(approval_id, str):
+            raise ValueError("Invalid cursor")
+        if isinstance(Approval.__table__.c[sort_by].type, DateTime):
+            value = datetime.fromisoformat(value)
+        return value, approval_id
+    
+    async def get_page(
+        self,
+        limit: int,
+        filters: Dict[str, Any],
+        search: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Approval], bool, Optional[str]]:
+        """
+        Liefert eine Seite ab dem Cursor (oder vom Anfang)
+        Rückgabe: (Zulassungen, has_more, next_cursor); has_more wird über
+        limit+1 gelesene Zeilen bestimmt
+        """
+        if not self.supports_keyset(sort_by):
+            raise ValueError(f"Cursor pagination is not supported for sort field '{sort_by}'")
+        
+        sort_column = getattr(Approval, sort_by)
+        descending = sort_order == "desc"
+        
+        query = self.build_filtered_query(self.select_approvals(sort_by), filters, search)
+        if cursor:
+            value, approval_id = self.decode_position(cursor, sort_by, sort_order)
+            position = tuple_(sort_column, Approval.id)
+            query = query.where(position < (value, approval_id) if descending else position > (value, approval_id))
+        
+        if descending:
+            query = query.order_by(sort_column.desc(), Approval.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), Approval.id.asc())
+        
+        approvals = await self._fetch(query.limit(limit + 1))
+        
+        has_more = len(approvals) > limit
+        approvals = approvals[:limit]
+        next_cursor = self.encode_position(approvals[-1], sort_by, sort_order) if has_more else None
+        return approvals, has_more, next_cursor
+    
+    async def get_offset_page(
+        self,
+        skip: int,
+        limit: int,
+        filters: Dict[str, Any],
+        search: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc"
+    ) -> Tuple[List[Approval], bool]:
+        """
+        Liefert eine Seite per OFFSET
+        Rückgabe: (Zulassungen, has_more); has_more über limit+1 gelesene Zeilen
+        """
+        if sort_by not in Approval.__table__.columns:
+            raise ValueError(f"Unknown sort field '{sort_by}'")
+        
+        sort_column = getattr(Approval, sort_by)
+        query = self.build_filtered_query(self.select_approvals(sort_by), filters, search)
+        if sort_order == "desc":
+            query = query.order_by(sort_column.desc(), Approval.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), Approval.id.asc())
+        
+        approvals = await self._fetch(query.offset(skip).limit(limit + 1))
+        return approvals[:limit], len(approvals) > limit
+    
+    async def get_ranked_page(
+        self,
+        skip: int,
+        limit: int,
+        filters: Dict[str, Any],
+        search: str
+    ) -> Tuple[List[Approval], bool]:
+        """
+        Volltextsuche nach Relevanz (ts_rank_cd) sortiert
+        Rückgabe: (Zulassungen, has_more); has_more über limit+1 gelesene Zeilen
+        """
+        rank = self._fulltext_rank(self._tsquery(search))
+        query = self.build_filtered_query(self.select_approvals(), filters, search)
+        query = query.order_by(rank.desc(), Approval.id.asc()).offset(skip).limit(limit + 1)
+        
+        approvals = await self._fetch(query)
+        return approvals[:limit], len(approvals) > limit
+    
+    async def get_highlights(self, approval_ids: List[str], search: str) -> Dict[str, str]:
+        """
+        Trefferausschnitte (ts_headline) aus Zusammenfassung und Volltext
+        Nur für die Zulassungen der aktuellen Seite berechnet
+        """
+        if not approval_ids or not search or not self.fulltext:
+            return {}
+        
+        document = func.concat_ws(" ", Approval.title, Approval.summary, Approval.full_text)
+        headline = func.ts_headline(FULLTEXT_CONFIG, document, self._tsquery(search), HEADLINE_OPTIONS)
+        result = await self.db.execute(
+            select(Approval.id, headline).where(Approval.id.in_(approval_ids))
+        )
+        return {approval_id: snippet for approval_id, snippet in result.all()}
+    
+    async def find_similar_names(
+        self,
+        name: str,
+        fields: Tuple[str, ...] = NAME_SIMILARITY_FIELDS,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Approval, float]]:
+        """
+        Zulassungen mit ähnlichem Antragsteller- oder Herstellernamen
+        Nach Trigramm-Ähnlichkeit absteigend sortiert, höchstens limit Treffer
+        """
+        if not self.is_postgresql:
+            raise ValueError("Similarity search requires PostgreSQL (pg_trgm)")
+        
+        # Schwelle nur für die aktuelle Transaktion setzen, damit % sie über den Index anwendet
+        await self.db.execute(
+            select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True))
+        )
+        
+        scores = [func.similarity(getattr(Approval, field), name) for field in fields]
+        score = scores[0] if len(scores) == 1 else func.greatest(*scores)
+        query = select(Approval, score.label("similarity")).options(*(undefer(getattr(Approval, name)) for name in RELATION_COUNTS))
+        query = self.build_filtered_query(query, filters or {})
+        query = query.where(self._name_match(name, fields)).order_by(score.desc(), Approval.id).limit(limit)
+        
+        result = await self.db.execute(query)
+        return [(approval, float(similarity)) for approval, similarity in result.all()]
+    
+    async def get_approval(self, approval_id: str) -> Optional[Any]:
+        """Einzelne Zulassung mit der gewählten Feldauswahl"""
+        approvals = await self._fetch(
+            self.build_filtered_query(self.select_approvals(), {}).where(Approval.id == approval_id)
+        )
+        return approvals[0] if approvals else None
+    
+    async def count(
+        self,
+        filters: Dict[str, Any],
+        search: Optional[str] = None,
+        strategy: CountStrategy = CountStrategy.EXACT
+    ) -> Tuple[int, CountStrategy]:
+        """
+        Gesamtanzahl der gefilterten Zulassungen nach Strategie
+        Rückgabe: (Anzahl, tatsächlich verwendete Strategie); ohne verwertbare
+        Schätzung wird exakt gezählt
+        """
+        if strategy == CountStrategy.CACHED:
+            key = self.counts.make_key("approvals", filters, search, self.search_mode if search else None)
+            total = self.counts.get(key)
+            if total is None:
+                total = await self.count_exact(filters, search)
+                self.counts.set(key, total)
+            return total, CountStrategy.CACHED
+        
+        if strategy == CountStrategy.ESTIMATED:
+            estimate = await self.count_estimated(filters, search)
+            if estimate is not None and estimate >= ESTIMATE_EXACT_THRESHOLD:
+                return estimate, CountStrategy.ESTIMATED
+        
+        return await self.count_exact(filters, search), CountStrategy.EXACT
+    
+    async def count_exact(self, filters: Dict[str, Any], search: Optional[str] = None) -> int:
+        """Exakte Anzahl der gefilterten Zulassungen"""
+        query = self.build_filtered_query(select(func.count()).select_from(Approval), filters, search)
+        return (await self.db.execute(query)).scalar_one()
+    
+    async def count_estimated(self, filters: Dict[str, Any], search: Optional[str] = None) -> Optional[int]:
+        """
+        Geschätzte Anzahl (nur PostgreSQL)
+        Ohne Filter und Suche aus pg_class.reltuples (enthält auch soft-gelöschte
+        Zeilen), sonst aus dem Ausführungsplan der gefilterten Abfrage;
+        None, wenn keine Schätzung verfügbar ist. Läuft in einem Savepoint,
+        damit ein Fehler die Transaktion für die exakte Zählung nicht abbricht
+        """
+        dialect = self.db.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+        
+        try:
+            async with self.db.begin_nested():
+                if not filters and not search:
+                    result = await self.db.execute(
+                        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                        {"table": Approval.__tablename__}
+                    )
+                    estimate = result.scalar()
+                else:
+                    query = self.build_filtered_query(select(Approval.id), filters, search)
+                    compiled = query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+                    # Direkt an den Treiber: ":wort" in Suchbegriffen ist kein Bind-Parameter
+                    connection = await self.db.connection()
+                    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+                    plan = result.scalar()
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    estimate = plan[0]["Plan"]["Plan Rows"]
+        except Exception as e:
+            logger.warning(f"Count estimation failed, falling back to exact count: {e}")
+            return None
+        
+        # reltuples ist -1 für nie analysierte Tabellen
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
@@ -0,0 +1,39 @@
+"""
+MedTech Data Platform - Approval Confidence Score
+Validierungs-Score wird mit dem Schreibzugriff gespeichert (Basis für revalidate_approval)
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.models.approval import Approval
+
+# Session.info: Score je Zulassungs-ID (None = die im nächsten Flush angelegte Zulassung)
+PENDING_SCORES = "approval_confidence_scores"
+
+def persist_score(db: AsyncSession, score: float, approval: Optional[Approval] = None) -> None:
+    """
+    Speichert den berechneten Score mit dem nächsten Flush dieser Session
+    Ohne approval für die dort angelegte Zulassung (ID steht erst beim Flush fest).
+    Für Schreibzugriffe, die selbst committen: Score und Daten werden gemeinsam
+    gespeichert, ein mitgelieferter confidence_score wird überschrieben
+    """
+    if approval is not None:
+        approval.confidence_score = score  # auch bei sonst unveränderter Zulassung schreiben
+    db.info.setdefault(PENDING_SCORES, {})[approval.id if approval is not None else None] = score
+
+@event.listens_for(Session, "before_flush")
+def _apply_pending_scores(session: Session, flush_context, instances) -> None:
+    pending = session.info.get(PENDING_SCORES)
+    if not pending:
+        return
+    for obj in [*session.new, *session.dirty]:
+        if not isinstance(obj, Approval):
+            continue
+        key = None if obj in session.new else obj.id
+        if key in pending:
+            obj.confidence_score = pending.pop(key)
+    if not pending:
+        del session.info[PENDING_SCORES]
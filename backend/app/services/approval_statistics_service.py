@@ -0,0 +1,213 @@
+"""
+MedTech Data Platform - Approval Statistics Service
+Statistiken über Zulassungen aus einer fortgeschriebenen Rollup-Tabelle
+"""
+
+from sqlalchemy import select, delete, func, event, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, Optional, Tuple
+from collections import Counter
+from collections.abc import Mapping
+from enum import Enum
+from datetime import datetime, timedelta, timezone
+import logging
+
+from app.models.approval import Approval, ApprovalStatsRollup
+
+logger = logging.getLogger(__name__)
+
+# Dimensionen der Rollup-Tabelle (Reihenfolge = Schlüssel)
+ROLLUP_DIMENSIONS = ("region", "authority", "status", "approval_type", "device_class")
+
+RollupKey = Tuple[str, ...]
+
+def _dimension_value(value: Any) -> str:
+    if value is None:
+        return ""
+    return value.value if isinstance(value, Enum) else str(value)
+
+def rollup_key(data: Any) -> RollupKey:
+    """Rollup-Schlüssel aus einer Zulassung oder einem Spalten-Dictionary"""
+    get = data.get if isinstance(data, Mapping) else lambda name: getattr(data, name)
+    return tuple(_dimension_value(get(name)) for name in ROLLUP_DIMENSIONS)
+
+def _previous_state(approval: Approval) -> Tuple[RollupKey, bool]:
+    # Werte vor den ungespeicherten Änderungen (Attribut-Historie)
+    attrs = inspect(approval).attrs
+    
+    def previous(name: str) -> Any:
+        history = attrs[name].history
+        return history.deleted[0] if history.deleted else getattr(approval, name)
+    
+    return tuple(_dimension_value(previous(name)) for name in ROLLUP_DIMENSIONS), not previous("is_deleted")
+
+def collect_rollup_deltas(session: Session) -> Counter:
+    """Änderungen der Zählerstände durch die anstehenden ORM-Änderungen"""
+    deltas = Counter()
+    for obj in session.new:
+        if isinstance(obj, Approval) and not obj.is_deleted:
+            deltas[rollup_key(obj)] += 1
+    for obj in session.dirty:
+        if not isinstance(obj, Approval) or not session.is_modified(obj):
+            continue
+        old_key, was_active = _previous_state(obj)
+        if was_active:
+            deltas[old_key] -= 1
+        if not obj.is_deleted:
+            deltas[rollup_key(obj)] += 1
+    for obj in session.deleted:
+        if isinstance(obj, Approval):
+            old_key, was_active = _previous_state(obj)
+            if was_active:
+                deltas[old_key] -= 1
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+def apply_rollup_deltas(connection, deltas: Counter) -> None:
+    """
+    Schreibt Zählerdifferenzen per Upsert in die Rollup-Tabelle
+    Schlüssel werden sortiert geschrieben, um Deadlocks zwischen Transaktionen zu vermeiden
+    """
+    if not deltas:
+        return
+    
+    table = ApprovalStatsRollup.__table__
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Statistics rollup not supported for dialect '{dialect}'")
+    
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(ROLLUP_DIMENSIONS),
+        set_={"approval_count": table.c.approval_count + stmt.excluded.approval_count}
+    )
+    rows = [
+        dict(zip(ROLLUP_DIMENSIONS, key), approval_count=delta)
+        for key, delta in sorted(deltas.items())
+    ]
+    connection.execute(stmt, rows)
+
+@event.listens_for(Session, "before_flush")
+def _track_approval_changes(session: Session, flush_context, instances) -> None:
+    # Rollup im selben Flush (und damit in derselben Transaktion) fortschreiben
+    deltas = collect_rollup_deltas(session)
+    if deltas:
+        apply_rollup_deltas(session.connection(), deltas)
+
+class ApprovalStatisticsService:
+    """
+    Service für Zulassungsstatistiken
+    Liest die Rollup-Tabelle (wenige hundert Zeilen) statt die Zulassungen zu aggregieren
+    """
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def apply_deltas(self, deltas: Counter) -> None:
+        """Zählerdifferenzen für Core-Schreibzugriffe (z.B. Massenimport) anwenden"""
+        if deltas:
+            await self.db.run_sync(lambda session: apply_rollup_deltas(session.connection(), deltas))
+    
+    async def get_overview(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Gesamtanzahl, Verteilungen nach Dimension und Neuzugänge der letzten Tage"""
+        filters = filters or {}
+        table = ApprovalStatsRollup.__table__
+        query = select(table).where(table.c.approval_count != 0)
+        for key, value in filters.items():
+            query = query.where(table.c[key] == _dimension_value(value))
+        
+        distributions = {name: Counter() for name in ROLLUP_DIMENSIONS}
+        total = 0
+        for row in (await self.db.execute(query)).mappings():
+            count = row["approval_count"]
+            total += count
+            for name in ROLLUP_DIMENSIONS:
+                distributions[name][row[name] or "none"] += count
+        
+        return {
+            "total_approvals": total,
+            "status_distribution": dict(distributions["status"]),
+            "region_distribution": dict(distributions["region"]),
+            "authority_distribution": dict(distributions["authority"]),
+            "type_distribution": dict(distributions["approval_type"]),
+            "device_class_distribution": dict(distributions["device_class"]),
+            "recent_activity": await self.get_recent_activity(filters)
+        }
+    
+    async def get_recent_activity(self, filters: Dict[str, Any], days: Tuple[int, ...] = (7, 30)) -> Dict[str, int]:
+        """Neu angelegte Zulassungen je Zeitraum (Bereichsabfrage über den created_at-Index)"""
+        now = datetime.now(timezone.utc)
+        oldest = now - timedelta(days=max(days))
+        query = select(Approval.created_at).where(
+            Approval.is_deleted.is_(False),
+            Approval.created_at >= oldest
+        )
+        for key, value in filters.items():
+            query = query.where(getattr(Approval, key) == value)
+        
+        recent = query.subquery()
+        buckets = select(*(
+            func.count().filter(recent.c.created_at >= now - timedelta(days=period)).label(f"last_{period}_days")
+            for period in days
+        ))
+        return dict((await self.db.execute(buckets)).mappings().one())
+    
+    async def measure_drift(self) -> Counter:
+        """
+        Abweichung der Rollup-Tabelle von den Zulassungen (nur lesend, ohne Sperren)
+        Rollup und Aggregat stammen aus demselben Snapshot: parallele Fortschreibungen
+        ändern beide in einer Transaktion und erscheinen daher nicht als Abweichung
+        """
+        table = ApprovalStatsRollup.__table__
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                await self.db.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"))
+            
+            current = {
+                rollup_key(row): row["approval_count"]
+                for row in (await self.db.execute(select(table))).mappings()
+            }
+            
+            dimensions = [Approval.__table__.c[name] for name in ROLLUP_DIMENSIONS]
+            result = await self.db.execute(
+                select(*dimensions, func.count().label("approval_count"))
+                .where(Approval.is_deleted.is_(False))
+                .group_by(*dimensions)
+            )
+            actual = Counter()
+            for row in result.mappings():
+                actual[rollup_key(row)] += row["approval_count"]
+        finally:
+            await self.db.rollback()  # Snapshot freigeben
+            
+        drift = Counter({
+            key: actual.get(key, 0) - current.get(key, 0)
+            for key in set(current) | set(actual)
+        })
+        return Counter({key: delta for key, delta in drift.items() if delta})
+            
+    async def reconcile(self) -> int:
+        """
+        Gleicht die Rollup-Tabelle mit den Zulassungen ab
+        Das Aggregat wird vorab berechnet; die Abweichung wird danach in einer kurzen
+        Transaktion als Differenz addiert, ohne parallele Schreibzugriffe zu blockieren
+        Rückgabe: Anzahl korrigierter Dimensionskombinationen
+        """
+        table = ApprovalStatsRollup.__table__
+        drift = await self.measure_drift()
+        try:
+            # Leere Kombinationen entfernen, Abweichungen korrigieren
+            await self.db.execute(delete(table).where(table.c.approval_count == 0))
+            await self.apply_deltas(drift)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        if drift:
+            logger.warning(f"Statistics rollup corrected {len(drift)} groups")
+        return len(drift)
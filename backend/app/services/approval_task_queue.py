@@ -0,0 +1,212 @@
+"""
+MedTech Data Platform - Approval Task Queue
+Dauerhafte Warteschlange für nachgelagerte Aufgaben (Tabelle approval_tasks)
+"""
+
+from sqlalchemy import select, update, delete, func, tuple_, event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+from typing import List, Optional, Dict, Any, Iterable
+from datetime import datetime, timedelta, timezone
+import logging
+
+from app.models.approval import Approval, ApprovalTask
+
+logger = logging.getLogger(__name__)
+
+# Aufgabentypen
+TASK_POST_CREATE = "post_create"
+TASK_POST_UPDATE = "post_update"
+
+# Session.info: Aufgaben für die im nächsten Flush angelegten Zulassungen
+PENDING_CREATE_TASKS = "approval_tasks_on_create"
+
+class ClaimedTask(BaseModel):
+    """Von einem Worker beanspruchte Aufgabe"""
+    task_type: str
+    approval_id: str
+    payload: Optional[Dict[str, Any]] = None
+    generation: int
+    attempts: int
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def enqueue_tasks(connection, task_type: str, approval_ids: Iterable[str], payload: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Stellt Aufgaben per Upsert ein (eine je Zulassung)
+    Ist die Aufgabe bereits eingestellt, werden payload und Fälligkeit
+    übernommen und generation erhöht; laufende Ausführungen entfernen
+    den Eintrag dann nicht und er wird erneut ausgeführt
+    """
+    ids = sorted(set(approval_ids))
+    if not ids:
+        return
+    
+    table = ApprovalTask.__table__
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Task queue not supported for dialect '{dialect}'")
+    
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["task_type", "approval_id"],
+        set_={
+            "payload": stmt.excluded.payload,
+            "generation": table.c.generation + 1,
+            "attempts": 0,
+            "available_at": stmt.excluded.available_at,
+            "last_error": None
+        }
+    )
+    now = _utcnow()
+    connection.execute(stmt, [
+        {
+            "task_type": task_type,
+            "approval_id": approval_id,
+            "payload": payload,
+            "generation": 0,
+            "attempts": 0,
+            "available_at": now
+        }
+        for approval_id in ids
+    ])
+
+@event.listens_for(Session, "after_flush")
+def _enqueue_for_created_approvals(session: Session, flush_context) -> None:
+    # Aufgaben im selben Flush (und damit in derselben Transaktion) wie die Anlage einstellen
+    pending = session.info.get(PENDING_CREATE_TASKS)
+    if not pending:
+        return
+    approval_ids = [obj.id for obj in session.new if isinstance(obj, Approval)]
+    if not approval_ids:
+        return
+    del session.info[PENDING_CREATE_TASKS]
+    for task_type, payload in pending:
+        enqueue_tasks(session.connection(), task_type, approval_ids, payload)
+
+class ApprovalTaskQueue:
+    """
+    Service für die Aufgaben-Warteschlange
+    Einstellen erfolgt in der Transaktion des Aufrufers (geht mit dem Schreibzugriff
+    verloren oder wird mit ihm gespeichert); Worker beanspruchen Aufgaben in
+    Batches per FOR UPDATE SKIP LOCKED und einer Sperrfrist (lease)
+    """
+    
+    def __init__(self, db: AsyncSession, lease_seconds: int = 300, max_attempts: int = 5):
+        self.db = db
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.table = ApprovalTask.__table__
+    
+    async def enqueue(self, task_type: str, approval_ids: Iterable[str], payload: Optional[Dict[str, Any]] = None) -> None:
+        """Aufgaben einstellen (ohne Commit)"""
+        approval_ids = list(approval_ids)
+        if approval_ids:
+            await self.db.run_sync(lambda session: enqueue_tasks(session.connection(), task_type, approval_ids, payload))
+    
+    def enqueue_on_create(self, task_type: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Aufgaben für die im nächsten Flush dieser Session angelegten Zulassungen
+        Für Schreibzugriffe, die selbst committen: die IDs stehen erst beim Flush fest
+        """
+        self.db.info.setdefault(PENDING_CREATE_TASKS, []).append((task_type, payload))
+    
+    async def claim(self, limit: int, task_type: Optional[str] = None) -> List[ClaimedTask]:
+        """
+        Beansprucht bis zu limit fällige Aufgaben und committet
+        Nicht abgeschlossene Aufgaben werden nach Ablauf der Sperrfrist erneut vergeben
+        """
+        now = _utcnow()
+        query = select(
+            self.table.c.task_type,
+            self.table.c.approval_id,
+            self.table.c.payload,
+            self.table.c.generation,
+            self.table.c.attempts
+        ).where(
+            self.table.c.available_at <= now,
+            self.table.c.attempts < self.max_attempts
+        )
+        if task_type is not None:
+            query = query.where(self.table.c.task_type == task_type)
+        query = query.order_by(self.table.c.available_at).limit(limit).with_for_update(skip_locked=True)
+        
+        try:
+            tasks = [ClaimedTask(**row) for row in (await self.db.execute(query)).mappings()]
+            if tasks:
+                await self.db.execute(
+                    update(self.table)
+                    .where(self._keys(tasks))
+                    .values(available_at=now + timedelta(seconds=self.lease_seconds), attempts=self.table.c.attempts + 1)
+                )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        for task in tasks:
+            task.attempts += 1
+        return tasks
+    
+    async def complete(self, tasks: List[ClaimedTask]) -> None:
+        """Entfernt erledigte Aufgaben, sofern sie nicht zwischenzeitlich neu eingestellt wurden"""
+        if not tasks:
+            return
+        try:
+            await self.db.execute(delete(self.table).where(self._keys(tasks, with_generation=True)))
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+    
+    async def fail(self, tasks: List[ClaimedTask], errors: Dict[str, str]) -> None:
+        """
+        Gibt fehlgeschlagene Aufgaben mit exponentiellem Backoff frei
+        Nach max_attempts Versuchen bleiben sie mit last_error liegen
+        """
+        if not tasks:
+            return
+        now = _utcnow()
+        try:
+            for task in tasks:
+                await self.db.execute(
+                    update(self.table)
+                    .where(self._keys([task], with_generation=True))
+                    .values(
+                        available_at=now + timedelta(seconds=min(2 ** task.attempts * 10, 3600)),
+                        last_error=errors.get(task.approval_id)
+                    )
+                )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        logger.warning(f"{len(tasks)} approval tasks failed and were rescheduled")
+    
+    async def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Anzahl offener und endgültig fehlgeschlagener Aufgaben je Aufgabentyp"""
+        failed = self.table.c.attempts >= self.max_attempts
+        result = await self.db.execute(
+            select(
+                self.table.c.task_type,
+                func.count().label("total"),
+                func.count().filter(failed).label("failed")
+            ).group_by(self.table.c.task_type)
+        )
+        return {
+            row.task_type: {"pending": row.total - row.failed, "failed": row.failed}
+            for row in result
+        }
+    
+    def _keys(self, tasks: List[ClaimedTask], with_generation: bool = False):
+        # (task_type, approval_id[, generation]) IN (...)
+        names = ("task_type", "approval_id", "generation") if with_generation else ("task_type", "approval_id")
+        return tuple_(*(self.table.c[name] for name in names)).in_(
+            [tuple(getattr(task, name) for name in names) for task in tasks]
+        )
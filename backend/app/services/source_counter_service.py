@@ -0,0 +1,179 @@
+"""
+MedTech Data Platform - Source Counter Service
+Denormalisierte Zähler je Datenquelle (Zulassungen, Updates, letzter Eintrag)
+"""
+
+from sqlalchemy import select, update, func, case, or_, union_all, event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+import logging
+
+from app.models.base import Base
+from app.models.data_source import DataSource
+
+logger = logging.getLogger(__name__)
+
+# Gezählte Tabellen (mit source_id und Soft-Delete) und ihr Zähler an der Datenquelle
+SOURCE_COUNTERS = {
+    "approvals": "approvals_count",
+    "regulatory_updates": "updates_count"
+}
+
+CounterKey = Tuple[str, str]  # (source_id, Zählerspalte)
+
+def _counter_for(obj: Any) -> Optional[str]:
+    return SOURCE_COUNTERS.get(getattr(obj, "__tablename__", None))
+
+def _previous(obj: Any, name: str) -> Any:
+    history = inspect(obj).attrs[name].history
+    return history.deleted[0] if history.deleted else getattr(obj, name)
+
+def collect_counter_deltas(session: Session) -> Tuple[Counter, set]:
+    """
+    Zählerdifferenzen und Quellen mit neuen Einträgen aus den anstehenden ORM-Änderungen
+    Berücksichtigt Anlage, Soft-Delete/Wiederherstellung, Löschung und Quellwechsel
+    """
+    deltas = Counter()
+    touched = set()
+    for obj in session.new:
+        counter = _counter_for(obj)
+        if counter and not obj.is_deleted:
+            deltas[(obj.source_id, counter)] += 1
+            touched.add(obj.source_id)
+    for obj in session.dirty:
+        counter = _counter_for(obj)
+        if not counter or not session.is_modified(obj):
+            continue
+        if not _previous(obj, "is_deleted"):
+            deltas[(_previous(obj, "source_id"), counter)] -= 1
+        if not obj.is_deleted:
+            deltas[(obj.source_id, counter)] += 1
+    for obj in session.deleted:
+        counter = _counter_for(obj)
+        if counter and not _previous(obj, "is_deleted"):
+            deltas[(_previous(obj, "source_id"), counter)] -= 1
+    return Counter({key: delta for key, delta in deltas.items() if delta}), touched
+
+def apply_counter_deltas(connection, deltas: Counter, touched: set = frozenset()) -> None:
+    """
+    Schreibt Zählerdifferenzen per UPDATE auf die Datenquellen
+    Quellen in fester Reihenfolge (Deadlock-Vermeidung); updated_at bleibt unverändert,
+    da es die Aktualität der Validierungsregeln anzeigt
+    """
+    table = DataSource.__table__
+    per_source: Dict[str, Counter] = {}
+    for (source_id, counter), delta in deltas.items():
+        per_source.setdefault(source_id, Counter())[counter] += delta
+    for source_id in touched:
+        per_source.setdefault(source_id, Counter())
+    
+    now = func.now()
+    for source_id in sorted(per_source):
+        values = {
+            counter: table.c[counter] + delta
+            for counter, delta in per_source[source_id].items() if delta
+        }
+        if source_id in touched:
+            last = table.c.last_record_at
+            values["last_record_at"] = case((or_(last.is_(None), last < now), now), else_=last)
+        if values:
+            values["updated_at"] = table.c.updated_at
+            connection.execute(update(table).where(table.c.id == source_id).values(**values))
+
+@event.listens_for(Session, "before_flush")
+def _track_source_records(session: Session, flush_context, instances) -> None:
+    # Zähler im selben Flush (und damit in derselben Transaktion) fortschreiben
+    deltas, touched = collect_counter_deltas(session)
+    if deltas or touched:
+        apply_counter_deltas(session.connection(), deltas, touched)
+
+class SourceCounterService:
+    """
+    Service für die Zähler der Datenquellen
+    Die Quellenübersicht liest nur die Datenquellen-Tabelle
+    """
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def apply_deltas(self, deltas: Counter, touched: set = frozenset()) -> None:
+        """Zählerdifferenzen für Core-Schreibzugriffe (z.B. Massenimport) anwenden"""
+        if deltas or touched:
+            await self.db.run_sync(lambda session: apply_counter_deltas(session.connection(), deltas, touched))
+    
+    async def get_overview(self) -> List[Dict[str, Any]]:
+        """Zähler aller Datenquellen"""
+        result = await self.db.execute(
+            select(
+                DataSource.id,
+                DataSource.name,
+                DataSource.status,
+                DataSource.approvals_count,
+                DataSource.updates_count,
+                DataSource.last_record_at
+            ).where(DataSource.is_deleted.is_(False)).order_by(DataSource.name)
+        )
+        return [dict(row) for row in result.mappings()]
+    
+    async def recount(self) -> int:
+        """
+        Zählt alle Zähler aus den Einträgen nach
+        Gespeicherte und tatsächliche Werte werden in einer Abfrage (ein Snapshot,
+        ohne Sperren) gelesen; korrigiert wird danach in einer kurzen Transaktion
+        unter Zeilensperre: Zähler um die Differenz (kommutiert mit parallelen
+        Fortschreibungen), last_record_at nur, wenn es seit dem Snapshot unverändert ist
+        Rückgabe: Anzahl korrigierter Datenquellen
+        """
+        sources = DataSource.__table__
+        values = {}
+        recent = []
+        for table_name, counter in SOURCE_COUNTERS.items():
+            table = Base.metadata.tables.get(table_name)
+            if table is None:
+                continue
+            active = (table.c.source_id == sources.c.id) & table.c.is_deleted.is_(False)
+            values[counter] = select(func.count()).select_from(table).where(active).scalar_subquery()
+            recent.append(select(table.c.created_at.label("created_at")).where(active))
+        records = union_all(*recent).subquery() if len(recent) > 1 else recent[0].subquery()
+        values["last_record_at"] = select(func.max(records.c.created_at)).scalar_subquery()
+        
+        drifted = or_(*(sources.c[name].is_distinct_from(value) for name, value in values.items()))
+        try:
+            rows = (await self.db.execute(
+                select(
+                    sources.c.id,
+                    *(sources.c[name] for name in values),
+                    *(value.label(f"actual_{name}") for name, value in values.items())
+                ).where(drifted).order_by(sources.c.id)
+            )).mappings().all()
+        finally:
+            await self.db.rollback()  # Snapshot freigeben
+        
+        try:
+            # Quellen in fester Reihenfolge (Deadlock-Vermeidung), updated_at unverändert
+            for row in rows:
+                corrections = {
+                    counter: sources.c[counter] + (row[f"actual_{counter}"] - row[counter])
+                    for counter in values if counter != "last_record_at" and row[f"actual_{counter}"] != row[counter]
+                }
+                if row["actual_last_record_at"] != row["last_record_at"]:
+                    last = sources.c.last_record_at
+                    corrections["last_record_at"] = case(
+                        (last.is_not_distinct_from(row["last_record_at"]), row["actual_last_record_at"]),
+                        else_=last
+                    )
+                await self.db.execute(
+                    update(sources)
+                    .where(sources.c.id == row["id"])
+                    .values(updated_at=sources.c.updated_at, **corrections)
+                )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        if rows:
+            logger.warning(f"Source counters corrected for {len(rows)} data sources")
+        return len(rows)
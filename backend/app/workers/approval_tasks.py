@@ -0,0 +1,143 @@
+"""
+MedTech Data Platform - Approval Task Worker
+Eigenständige Worker-Prozesse für die Aufgaben-Warteschlange (approval_tasks)
+
+Start: python -m app.workers.approval_tasks [--processes N]
+"""
+
+from itertools import groupby
+from typing import List, Dict
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+
+from app.core.config import settings
+from app.core.validation import ValidationResult
+from app.services.approval_task_queue import ApprovalTaskQueue, ClaimedTask, TASK_POST_CREATE, TASK_POST_UPDATE
+
+logger = logging.getLogger(__name__)
+
+# Aufgabentyp -> Methoden von ApprovalService: mengenbasiert ({approval_id: validation_result})
+# und je Zulassung (approval_id, validation_result)
+TASK_HANDLERS = {
+    TASK_POST_CREATE: ("post_create_tasks_batch", "post_create_tasks"),
+    TASK_POST_UPDATE: ("post_update_tasks_batch", "post_update_tasks")
+}
+
+async def run_tasks(db, task_type: str, tasks: List[ClaimedTask]) -> Dict[str, str]:
+    """
+    Führt einen Batch gleichartiger Aufgaben aus (ohne Commit)
+    Zuerst mengenbasiert in einem Savepoint; schlägt das fehl (oder fehlt die
+    Methode), wird jede Aufgabe in einem eigenen Savepoint ausgeführt, sodass ein
+    Fehler nur die Arbeit der betroffenen Zulassung verwirft
+    Rückgabe: Fehlermeldung je fehlgeschlagener Zulassung
+    """
+    from app.services.approval_service import ApprovalService
+    
+    if task_type not in TASK_HANDLERS:
+        return {task.approval_id: f"Unknown task type '{task_type}'" for task in tasks}
+    
+    batch_name, method_name = TASK_HANDLERS[task_type]
+    service = ApprovalService(db)
+    results = {
+        task.approval_id: ValidationResult(**task.payload) if task.payload else None
+        for task in tasks
+    }
+    
+    batch = getattr(service, batch_name, None)
+    if batch is not None:
+        try:
+            async with db.begin_nested():
+                await batch(results)
+            return {}
+        except Exception as e:
+            logger.warning(f"Task batch {task_type} of {len(tasks)} approvals failed, retrying per approval: {e}")
+    
+    method = getattr(service, method_name)
+    errors = {}
+    for task in tasks:
+        try:
+            async with db.begin_nested():
+                await method(task.approval_id, results[task.approval_id])
+        except Exception as e:
+            errors[task.approval_id] = str(e)
+            logger.error(f"Task {task_type} failed for approval {task.approval_id} (attempt {task.attempts}): {e}")
+    return errors
+
+async def process_batch(session_factory, batch_size: int) -> int:
+    """Beansprucht und bearbeitet einen Batch; Rückgabe: Anzahl beanspruchter Aufgaben"""
+    async with session_factory() as session:
+        queue = ApprovalTaskQueue(session, settings.TASK_LEASE_SECONDS, settings.TASK_MAX_ATTEMPTS)
+        tasks = await queue.claim(batch_size)
+        
+        for task_type, group in groupby(sorted(tasks, key=lambda task: task.task_type), key=lambda task: task.task_type):
+            group = list(group)
+            errors = await run_tasks(session, task_type, group)
+            # Commit der erfolgreichen Arbeit zusammen mit dem Entfernen ihrer Aufgaben
+            await queue.complete([task for task in group if task.approval_id not in errors])
+            await queue.fail([task for task in group if task.approval_id in errors], errors)
+        
+        return len(tasks)
+
+async def run_worker(session_factory, batch_size: int, poll_interval: float) -> None:
+    """Arbeitet die Warteschlange ab; wartet nur, wenn weniger als ein voller Batch anlag"""
+    while True:
+        try:
+            processed = await process_batch(session_factory, batch_size)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Approval task batch failed: {e}")
+            processed = 0
+        if processed < batch_size:
+            await asyncio.sleep(poll_interval)
+
+async def _serve() -> None:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from app.core.database import engine
+    
+    try:
+        await run_worker(
+            async_sessionmaker(engine, expire_on_commit=False),
+            settings.TASK_BATCH_SIZE,
+            settings.TASK_POLL_INTERVAL
+        )
+    finally:
+        await engine.dispose()
+
+def _worker_process() -> None:
+    from app.core.logging_config import setup_logging
+    
+    setup_logging()
+    logger.info(f"Approval task worker {multiprocessing.current_process().name} started")
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worker for queued approval post-processing tasks")
+    parser.add_argument("--processes", type=int, default=settings.TASK_WORKER_PROCESSES, help="Number of worker processes")
+    args = parser.parse_args()
+    
+    if args.processes <= 1:
+        _worker_process()
+        return
+    
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_worker_process, name=f"approval-task-worker-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    
+    # SIGTERM an die Worker weitergeben; beanspruchte Aufgaben werden nach der Sperrfrist neu vergeben
+    signal.signal(signal.SIGTERM, lambda signum, frame: [process.terminate() for process in processes])
+    for process in processes:
+        process.join()
+
+if __name__ == "__main__":
+    main()
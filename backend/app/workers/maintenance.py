@@ -0,0 +1,101 @@
+"""
+MedTech Data Platform - Maintenance Worker
+Eigenständiger Prozess für periodische Wartungsjobs (statt in jedem API-Worker)
+
+Start: python -m app.workers.maintenance [--once]
+"""
+
+from typing import Awaitable, Callable, Dict, Tuple
+import argparse
+import asyncio
+import logging
+
+from app.core.advisory_lock import exclusive_session, STATISTICS_RECONCILE_LOCK, SOURCE_RECOUNT_LOCK, EXPIRY_SWEEP_LOCK
+from app.core.config import settings
+from app.services.approval_expiry_service import ApprovalExpiryService
+from app.services.approval_statistics_service import ApprovalStatisticsService
+from app.services.source_counter_service import SourceCounterService
+
+logger = logging.getLogger(__name__)
+
+# Job -> (Intervall-Einstellung, Advisory-Lock, Ausführung mit Session)
+MAINTENANCE_JOBS: Dict[str, Tuple[str, int, Callable[..., Awaitable]]] = {
+    "statistics_reconcile": (
+        "STATISTICS_RECONCILE_INTERVAL",
+        STATISTICS_RECONCILE_LOCK,
+        lambda session: ApprovalStatisticsService(session).reconcile()
+    ),
+    "source_recount": (
+        "SOURCE_RECOUNT_INTERVAL",
+        SOURCE_RECOUNT_LOCK,
+        lambda session: SourceCounterService(session).recount()
+    ),
+    "expiry_sweep": (
+        "EXPIRY_SWEEP_INTERVAL",
+        EXPIRY_SWEEP_LOCK,
+        lambda session: ApprovalExpiryService(session).sweep()
+    )
+}
+
+async def run_job(engine, name: str) -> bool:
+    """Führt einen Job einmal unter seinem Advisory-Lock aus; False = läuft bereits anderswo"""
+    _, lock_key, job = MAINTENANCE_JOBS[name]
+    async with exclusive_session(engine, lock_key) as session:
+        if session is None:
+            logger.info(f"Maintenance job {name} skipped, already running in another process")
+            return False
+        await job(session)
+        return True
+
+async def run_periodically(engine, name: str, interval: int) -> None:
+    """Wiederholt einen Job; der erste Lauf folgt erst nach einem Intervall, nicht beim Start"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_job(engine, name)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Maintenance job {name} failed: {e}")
+
+def enabled_jobs() -> Dict[str, int]:
+    """Aktivierte Jobs und ihre Intervalle (Intervall 0 = deaktiviert)"""
+    intervals = {name: getattr(settings, setting) for name, (setting, _, _) in MAINTENANCE_JOBS.items()}
+    return {name: interval for name, interval in intervals.items() if interval > 0}
+
+async def _serve(once: bool) -> None:
+    from app.core.database import engine
+    
+    jobs = enabled_jobs()
+    try:
+        if once:
+            for name in jobs:
+                await run_job(engine, name)
+            return
+        if not jobs:
+            logger.warning("No maintenance jobs enabled")
+            return
+        await asyncio.gather(*(run_periodically(engine, name, interval) for name, interval in jobs.items()))
+    finally:
+        await engine.dispose()
+
+def main() -> None:
+    from app.core.logging_config import setup_logging
+    
+    parser = argparse.ArgumentParser(description="Worker for periodic maintenance jobs")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Run every enabled job once and exit (e.g. to fill the statistics rollup after a migration)"
+    )
+    args = parser.parse_args()
+    
+    setup_logging()
+    logger.info(f"Maintenance worker started: {', '.join(enabled_jobs()) or 'no jobs'}")
+    try:
+        asyncio.run(_serve(args.once))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -33,12 +33,15 @@ CREATE TABLE IF NOT EXISTS users (
 -- Create data_sources table
 CREATE TABLE IF NOT EXISTS data_sources (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    name VARCHAR(255) NOT NULL,
+    name VARCHAR(255) UNIQUE NOT NULL,
     url TEXT NOT NULL,
     type authority_type NOT NULL,
     status VARCHAR(50) DEFAULT 'active',
     last_synced TIMESTAMP WITH TIME ZONE,
     description TEXT,
+    approvals_count INTEGER NOT NULL DEFAULT 0,
+    updates_count INTEGER NOT NULL DEFAULT 0,
+    last_record_at TIMESTAMP WITH TIME ZONE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -67,6 +70,7 @@ CREATE TABLE IF NOT EXISTS approvals (
     detailed_analysis JSONB,
     metadata JSONB,
     data_source_id UUID REFERENCES data_sources(id),
+    created_by UUID REFERENCES users(id),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -116,6 +120,94 @@ CREATE TABLE IF NOT EXISTS audit_logs (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Create related_documents table
+CREATE TABLE IF NOT EXISTS related_documents (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    approval_id UUID NOT NULL REFERENCES approvals(id),
+    title VARCHAR(255) NOT NULL,
+    document_type VARCHAR(100) NOT NULL,
+    url VARCHAR(500),
+    file_path VARCHAR(500),
+    file_size INTEGER,
+    mime_type VARCHAR(100),
+    language VARCHAR(10) NOT NULL DEFAULT 'en',
+    version VARCHAR(20),
+    checksum VARCHAR(64),
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
+    deleted_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create compliance_checks table
+CREATE TABLE IF NOT EXISTS compliance_checks (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    approval_id UUID NOT NULL REFERENCES approvals(id),
+    requirement VARCHAR(255) NOT NULL,
+    requirement_type VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    description TEXT,
+    checked_by VARCHAR(100),
+    checked_at VARCHAR(50),
+    next_check_due VARCHAR(50),
+    severity VARCHAR(20),
+    evidence JSONB,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
+    deleted_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create sync_logs table
+CREATE TABLE IF NOT EXISTS sync_logs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    source_id UUID NOT NULL REFERENCES data_sources(id),
+    sync_type VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    started_at VARCHAR(50) NOT NULL,
+    completed_at VARCHAR(50),
+    duration DOUBLE PRECISION,
+    records_processed INTEGER NOT NULL DEFAULT 0,
+    records_added INTEGER NOT NULL DEFAULT 0,
+    records_updated INTEGER NOT NULL DEFAULT 0,
+    records_deleted INTEGER NOT NULL DEFAULT 0,
+    records_errors INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT,
+    warnings JSONB,
+    response_size INTEGER,
+    response_time DOUBLE PRECISION,
+    http_status INTEGER,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
+    deleted_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create statistics rollup table (maintained by the application, reconciled periodically)
+CREATE TABLE IF NOT EXISTS approval_stats_rollup (
+    region VARCHAR(100) NOT NULL,
+    authority VARCHAR(100) NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    approval_type VARCHAR(50) NOT NULL,
+    device_class VARCHAR(50) NOT NULL DEFAULT '',
+    approval_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (region, authority, status, approval_type, device_class)
+);
+
+-- Create task queue table for post-processing (one row per task type and approval)
+CREATE TABLE IF NOT EXISTS approval_tasks (
+    task_type VARCHAR(50) NOT NULL,
+    approval_id VARCHAR(36) NOT NULL,
+    payload JSONB,
+    generation INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (task_type, approval_id)
+);
+CREATE INDEX IF NOT EXISTS idx_approval_tasks_available_at ON approval_tasks(available_at);
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_approvals_status ON approvals(status);
 CREATE INDEX IF NOT EXISTS idx_approvals_approval_type ON approvals(approval_type);
@@ -124,9 +216,15 @@ CREATE INDEX IF NOT EXISTS idx_approvals_authority ON approvals(authority);
 CREATE INDEX IF NOT EXISTS idx_approvals_priority ON approvals(priority);
 CREATE INDEX IF NOT EXISTS idx_approvals_decision_date ON approvals(decision_date);
 CREATE INDEX IF NOT EXISTS idx_approvals_created_at ON approvals(created_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_created_at_id ON approvals(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_approvals_updated_at_id ON approvals(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_approvals_title_id ON approvals(title, id);
+CREATE INDEX IF NOT EXISTS idx_approvals_region_id ON approvals(region, id);
+CREATE INDEX IF NOT EXISTS idx_approvals_authority_id ON approvals(authority, id);
 CREATE INDEX IF NOT EXISTS idx_approvals_title_gin ON approvals USING gin(to_tsvector('english', title));
 CREATE INDEX IF NOT EXISTS idx_approvals_summary_gin ON approvals USING gin(to_tsvector('english', summary));
 CREATE INDEX IF NOT EXISTS idx_approvals_full_text_gin ON approvals USING gin(to_tsvector('english', full_text));
+CREATE INDEX IF NOT EXISTS idx_approvals_applicant_name_trgm ON approvals USING gin(applicant_name gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_approvals_tags_gin ON approvals USING gin(tags);
 CREATE INDEX IF NOT EXISTS idx_approvals_metadata_gin ON approvals USING gin(metadata);
 
@@ -141,6 +239,10 @@ CREATE INDEX IF NOT EXISTS idx_knowledge_articles_published ON knowledge_article
 CREATE INDEX IF NOT EXISTS idx_knowledge_articles_title_gin ON knowledge_articles USING gin(to_tsvector('english', title));
 CREATE INDEX IF NOT EXISTS idx_knowledge_articles_content_gin ON knowledge_articles USING gin(to_tsvector('english', content));
 
+CREATE INDEX IF NOT EXISTS idx_related_documents_approval_id ON related_documents(approval_id);
+CREATE INDEX IF NOT EXISTS idx_compliance_checks_approval_id ON compliance_checks(approval_id);
+CREATE INDEX IF NOT EXISTS idx_sync_logs_source_id ON sync_logs(source_id);
+
 CREATE INDEX IF NOT EXISTS idx_audit_logs_user_id ON audit_logs(user_id);
 CREATE INDEX IF NOT EXISTS idx_audit_logs_action ON audit_logs(action);
 CREATE INDEX IF NOT EXISTS idx_audit_logs_resource_type ON audit_logs(resource_type);
@@ -158,7 +260,8 @@ $$ language 'plpgsql';
 CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_data_sources_updated_at BEFORE UPDATE ON data_sources
+-- Counter updates (approvals_count, updates_count, last_record_at) do not touch updated_at
+CREATE TRIGGER update_data_sources_updated_at BEFORE UPDATE OF name, url, type, status, last_synced, description ON data_sources
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 CREATE TRIGGER update_approvals_updated_at BEFORE UPDATE ON approvals
@@ -170,6 +273,15 @@ CREATE TRIGGER update_regulatory_updates_updated_at BEFORE UPDATE ON regulatory_
 CREATE TRIGGER update_knowledge_articles_updated_at BEFORE UPDATE ON knowledge_articles
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+CREATE TRIGGER update_related_documents_updated_at BEFORE UPDATE ON related_documents
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TRIGGER update_compliance_checks_updated_at BEFORE UPDATE ON compliance_checks
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TRIGGER update_sync_logs_updated_at BEFORE UPDATE ON sync_logs
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
 -- Insert initial data sources
 INSERT INTO data_sources (name, url, type, status, description) VALUES
 ('FDA 510(k) Database', 'https://www.accessdata.fda.gov/scripts/cdrh/cfdocs/cfpmn/pmn.cfm', 'FDA', 'active', 'FDA 510(k) Premarket Notification Database'),
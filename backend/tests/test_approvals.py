@@ -104,6 +104,220 @@ class TestApprovalAPI:
         assert data["total"] >= 3
         assert len(data["items"]) >= 3
 
+    @pytest.mark.asyncio
+    async def test_get_approvals_cursor_pagination(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Keyset-Pagination über next_cursor liefert jede Zulassung genau einmal"""
+        created = [await ApprovalFactory.create(db, title=f"Cursor Zulassung {i}") for i in range(5)]
+        
+        seen = []
+        params = {"limit": 2, "search": "Cursor Zulassung"}
+        while True:
+            response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+            assert response.status_code == 200
+            data = response.json()
+            
+            seen.extend(item["id"] for item in data["items"])
+            if not data["has_more"]:
+                assert data["next_cursor"] is None
+                break
+            params["cursor"] = data["next_cursor"]
+        
+        assert len(seen) == len(set(seen))
+        assert set(seen) == {str(approval.id) for approval in created}
+        
+        # Ungültiger Cursor
+        response = await client.get("/api/v1/approvals/?cursor=invalid", headers=auth_headers)
+        assert response.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_get_approvals_count_strategies(self, client: AsyncClient, auth_headers: dict, db: AsyncSession, test_data_source: DataSource):
+        """Test: Gecachte Gesamtanzahl wird bei Schreibzugriffen verworfen"""
+        for i in range(3):
+            await ApprovalFactory.create(db, title=f"Count Zulassung {i}")
+        
+        params = {"search": "Count Zulassung", "limit": 2, "count": "cached"}
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count_strategy"] == "cached"
+        assert data["total"] == 3
+        assert data["has_more"] is True
+        
+        create_data = {
+            "title": "Count Zulassung 3",
+            "approval_type": "fda_510k",
+            "status": "approved",
+            "region": "US",
+            "authority": "FDA",
+            "source_id": str(test_data_source.id)
+        }
+        response = await client.post("/api/v1/approvals/", json=create_data, headers=auth_headers)
+        assert response.status_code == 201
+        
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.json()["total"] == 4
+        
+        # Ohne verwertbare Schätzung (kleine Tabelle) wird exakt gezählt
+        params["count"] = "estimated"
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        data = response.json()
+        assert data["count_strategy"] == "exact"
+        assert data["total"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_get_approvals_fulltext_search(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Volltextsuche sortiert Titeltreffer vor Treffern im Volltext"""
+        body_match = await ApprovalFactory.create(
+            db,
+            title="Herzschrittmacher Zulassung",
+            full_text="Infusion pump with wireless telemetry"
+        )
+        title_match = await ApprovalFactory.create(db, title="Infusion pump telemetry update")
+        await ApprovalFactory.create(db, title="Orthopedic implant")
+        
+        params = {"search": "infusion pump -orthopedic", "search_mode": "fulltext", "highlight": "true"}
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [title_match.id, body_match.id]
+        assert data["total"] == 2
+        assert data["next_cursor"] is None
+        assert "<mark>" in data["highlights"][body_match.id]
+        
+        # Relevanzsortierung ist nicht per Cursor pagierbar
+        params["cursor"] = "eyJ2IjogW119"
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_find_similar_names(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Ähnlichkeitssuche findet falsch geschriebene Firmennamen"""
+        medtronic = await ApprovalFactory.create(db, title="Pacemaker", applicant_name="Medtronic Inc")
+        manufacturer = await ApprovalFactory.create(db, title="Stent", manufacturer_name="Medtronic plc")
+        await ApprovalFactory.create(db, title="Pumpe", applicant_name="Baxter International")
+        
+        response = await client.get(
+            "/api/v1/approvals/names/similar",
+            params={"name": "Medtronik", "limit": 5},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        ids = [item["approval"]["id"] for item in data["items"]]
+        assert set(ids) == {medtronic.id, manufacturer.id}
+        similarities = [item["similarity"] for item in data["items"]]
+        assert similarities == sorted(similarities, reverse=True)
+        assert all(similarity >= data["threshold"] for similarity in similarities)
+        
+        # Nur Antragsteller
+        response = await client.get(
+            "/api/v1/approvals/names/similar",
+            params={"name": "Medtronik", "field": "applicant"},
+            headers=auth_headers
+        )
+        assert [item["approval"]["id"] for item in response.json()["items"]] == [medtronic.id]
+        
+        # Als Filter der Zulassungsliste
+        response = await client.get(
+            "/api/v1/approvals/",
+            params={"name_similar": "Medtronik"},
+            headers=auth_headers
+        )
+        assert response.json()["total"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_approvals_sparse_fields(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Feldauswahl und kompakte Standardprojektion ohne große Spalten"""
+        approval = await ApprovalFactory.create(
+            db,
+            title="Projektion Zulassung",
+            full_text="Sehr langer Volltext",
+            detailed_analysis={"summary": "Analyse"}
+        )
+        
+        response = await client.get("/api/v1/approvals/", params={"search": "Projektion"}, headers=auth_headers)
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert item["title"] == "Projektion Zulassung"
+        assert "full_text" not in item
+        assert "detailed_analysis" not in item
+        
+        params = {"search": "Projektion", "fields": "title,status"}
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.json()["items"] == [{"id": approval.id, "title": "Projektion Zulassung", "status": approval.status.value}]
+        
+        params["fields"] = "*"
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.json()["items"][0]["full_text"] == "Sehr langer Volltext"
+        
+        response = await client.get(
+            f"/api/v1/approvals/{approval.id}",
+            params={"fields": "full_text"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == {"id": approval.id, "full_text": "Sehr langer Volltext"}
+        
+        params["fields"] = "title,unknown_field"
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_get_approvals_fast_serialization_matches_schema(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Direkt serialisierte Listeneinträge entsprechen der ApprovalResponse-Ausgabe"""
+        for i in range(3):
+            await ApprovalFactory.create(db, title=f"Serialisierung {i}", device_class=DeviceClass.CLASS_II)
+        
+        params = {"search": "Serialisierung", "sort_by": "title", "sort_order": "asc"}
+        compact = (await client.get("/api/v1/approvals/", params=params, headers=auth_headers)).json()
+        full = (await client.get("/api/v1/approvals/", params={**params, "fields": "*"}, headers=auth_headers)).json()
+        
+        assert len(compact["items"]) == 3
+        for compact_item, full_item in zip(compact["items"], full["items"]):
+            assert compact_item == {key: full_item[key] for key in compact_item}
+        assert {key: value for key, value in compact.items() if key != "items"} == \
+            {key: value for key, value in full.items() if key != "items"}
+    
+    @pytest.mark.asyncio
+    async def test_get_approvals_include_relations(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Beziehungen per include gebündelt laden, Anzahlen ohne Nachladen"""
+        from sqlalchemy import select
+        from app.models.approval import RelatedDocument, ComplianceCheck
+        from app.services.approval_query_service import ApprovalQueryService
+        
+        with_children = await ApprovalFactory.create(db, title="Include Zulassung A")
+        without_children = await ApprovalFactory.create(db, title="Include Zulassung B")
+        db.add_all([
+            RelatedDocument(approval_id=with_children.id, title="Summary", document_type="summary"),
+            RelatedDocument(approval_id=with_children.id, title="Labeling", document_type="labeling"),
+            ComplianceCheck(approval_id=with_children.id, requirement="ISO 13485", requirement_type="quality", status="compliant")
+        ])
+        await db.commit()
+        
+        params = {"search": "Include Zulassung", "include": "related_documents,compliance_checks"}
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(doc["title"] for doc in data["related_documents"][with_children.id]) == ["Labeling", "Summary"]
+        assert data["related_documents"][without_children.id] == []
+        assert data["compliance_checks"][with_children.id][0]["requirement"] == "ISO 13485"
+        
+        params["include"] = "sync_logs"
+        response = await client.get("/api/v1/approvals/", params=params, headers=auth_headers)
+        assert response.status_code == 400
+        
+        # Anzahlen als column_property: to_dict ohne Laden der Beziehungen
+        db.expire_all()
+        approval = (await db.execute(select(Approval).where(Approval.id == with_children.id))).scalar_one()
+        assert "related_documents_count" not in approval.to_dict()
+        
+        approval = (await db.execute(
+            ApprovalQueryService(db).select_approvals().where(Approval.id == with_children.id)
+        )).scalar_one()
+        data = approval.to_dict()
+        assert data["related_documents_count"] == 2
+        assert data["compliance_checks_count"] == 1
+    
     @pytest.mark.asyncio
     async def test_get_approvals_with_filters(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
         """Test: Zulassungsliste mit Filtern"""
@@ -176,6 +390,49 @@ class TestApprovalAPI:
         assert data["title"] == approval.title
         assert "created_at" in data
         assert "updated_at" in data
+    
+    @pytest.mark.asyncio
+    async def test_get_approval_conditional_requests(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: ETag und If-None-Match liefern 304 bis zur nächsten Änderung"""
+        approval = await ApprovalFactory.create(db, title="ETag Zulassung")
+        
+        response = await client.get(f"/api/v1/approvals/{approval.id}", headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+        
+        conditional = {**auth_headers, "If-None-Match": etag}
+        response = await client.get(f"/api/v1/approvals/{approval.id}", headers=conditional)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        
+        list_response = await client.get("/api/v1/approvals/", params={"limit": 5}, headers=auth_headers)
+        list_etag = list_response.headers["etag"]
+        response = await client.get(
+            "/api/v1/approvals/",
+            params={"limit": 5},
+            headers={**auth_headers, "If-None-Match": list_etag}
+        )
+        assert response.status_code == 304
+        
+        # Nach einer Änderung passen weder Einzel- noch Listen-ETag
+        response = await client.put(
+            f"/api/v1/approvals/{approval.id}",
+            json={"title": "ETag Zulassung geändert"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        
+        response = await client.get(f"/api/v1/approvals/{approval.id}", headers=conditional)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        response = await client.get(
+            "/api/v1/approvals/",
+            params={"limit": 5},
+            headers={**auth_headers, "If-None-Match": list_etag}
+        )
+        assert response.status_code == 200
 
     @pytest.mark.asyncio
     async def test_get_approval_not_found(self, client: AsyncClient, auth_headers: dict):
@@ -303,6 +560,59 @@ class TestApprovalAPI:
         assert "recent_activity" in data
         assert data["total_approvals"] >= 4
 
+    @pytest.mark.asyncio
+    async def test_statistics_rollup_follows_writes(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Statistik-Rollup wird bei Anlage, Änderung und Soft-Delete fortgeschrieben"""
+        from app.services.approval_statistics_service import ApprovalStatisticsService
+        
+        params = {"region": "JP", "authority": "PMDA"}
+        first = await ApprovalFactory.create(db, region="JP", authority="PMDA", status=ApprovalStatus.PENDING)
+        second = await ApprovalFactory.create(db, region="JP", authority="PMDA", status=ApprovalStatus.PENDING)
+        
+        response = await client.get("/api/v1/approvals/statistics/overview", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_approvals"] == 2
+        assert data["status_distribution"] == {"pending": 2}
+        
+        response = await client.put(
+            f"/api/v1/approvals/{first.id}",
+            json={"status": "approved"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        response = await client.delete(f"/api/v1/approvals/{second.id}", headers=auth_headers)
+        assert response.status_code == 204
+        
+        response = await client.get("/api/v1/approvals/statistics/overview", params=params, headers=auth_headers)
+        data = response.json()
+        assert data["total_approvals"] == 1
+        assert data["status_distribution"] == {"approved": 1}
+        
+        # Abgleich findet keine Abweichungen
+        assert await ApprovalStatisticsService(db).reconcile() == 0
+    
+    @pytest.mark.asyncio
+    async def test_source_counters_follow_writes(self, client: AsyncClient, auth_headers: dict, db: AsyncSession, test_data_source: DataSource):
+        """Test: Zähler der Datenquelle werden bei Anlage und Soft-Delete fortgeschrieben"""
+        from app.services.source_counter_service import SourceCounterService
+        
+        first = await ApprovalFactory.create(db, source_id=test_data_source.id)
+        await ApprovalFactory.create(db, source_id=test_data_source.id)
+        
+        await db.refresh(test_data_source)
+        assert test_data_source.approvals_count == 2
+        assert test_data_source.last_record_at is not None
+        
+        response = await client.delete(f"/api/v1/approvals/{first.id}", headers=auth_headers)
+        assert response.status_code == 204
+        
+        await db.refresh(test_data_source)
+        assert test_data_source.approvals_count == 1
+        
+        # Nachzählung findet keine Abweichungen
+        assert await SourceCounterService(db).recount() == 0
+    
     @pytest.mark.asyncio
     async def test_create_approvals_batch(self, client: AsyncClient, auth_headers: dict, test_data_source: DataSource):
         """Test: Batch-Erstellung von Zulassungen"""
@@ -352,6 +662,155 @@ class TestApprovalAPI:
         assert data["created_count"] >= 2  # Mindestens 2 sollten erfolgreich sein
         assert data["failed_count"] >= 1   # Mindestens 1 sollte fehlschlagen
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_approvals(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Massenänderung per Filter und per ID-Liste"""
+        from app.services.approval_statistics_service import ApprovalStatisticsService
+        
+        approvals = [
+            await ApprovalFactory.create(db, region="Brazil", authority="ANVISA", status=ApprovalStatus.PENDING)
+            for _ in range(3)
+        ]
+        
+        response = await client.patch(
+            "/api/v1/approvals/bulk",
+            json={
+                "filter": {"region": "Brazil", "status": "pending"},
+                "patch": {"status": "approved", "priority": "high"}
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated_count"] == 3
+        assert sorted(data["updated_ids"]) == sorted(approval.id for approval in approvals)
+        
+        response = await client.get("/api/v1/approvals/", params={"region": "Brazil", "status": "approved"}, headers=auth_headers)
+        assert all(item["priority"] == "high" for item in response.json()["items"])
+        assert response.json()["total"] == 3
+        
+        # ID-Liste: unbekannte IDs werden gemeldet
+        response = await client.patch(
+            "/api/v1/approvals/bulk",
+            json={"ids": [approvals[0].id, "unknown-id"], "patch": {"tags": ["recall"]}},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["updated_ids"] == [approvals[0].id]
+        assert response.json()["not_found"] == ["unknown-id"]
+        
+        # Auswahl muss eindeutig sein, Änderung darf nicht leer sein
+        response = await client.patch(
+            "/api/v1/approvals/bulk",
+            json={"ids": [approvals[0].id], "filter": {"region": "Brazil"}, "patch": {"status": "approved"}},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+        response = await client.patch("/api/v1/approvals/bulk", json={"ids": [approvals[0].id], "patch": {}}, headers=auth_headers)
+        assert response.status_code == 400
+        
+        # Statistik-Rollup wurde mitgeschrieben
+        assert await ApprovalStatisticsService(db).reconcile() == 0
+    
+    @pytest.mark.asyncio
+    async def test_expiry_filters_and_sweep(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Ablauf-Filter in SQL und mengenbasierter Ablauf fälliger Zulassungen"""
+        from datetime import date, timedelta
+        from app.services.approval_expiry_service import ApprovalExpiryService
+        
+        today = date.today()
+        overdue = await ApprovalFactory.create(db, region="Canada", status=ApprovalStatus.APPROVED, expiry_date=today - timedelta(days=3))
+        soon = await ApprovalFactory.create(db, region="Canada", status=ApprovalStatus.APPROVED, expiry_date=today + timedelta(days=30))
+        await ApprovalFactory.create(db, region="Canada", status=ApprovalStatus.APPROVED, expiry_date=today + timedelta(days=200))
+        
+        response = await client.get(
+            "/api/v1/approvals/",
+            params={"region": "Canada", "expires_within_days": 90, "sort_by": "expiry_date", "sort_order": "asc"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [soon.id]
+        
+        response = await client.get(
+            "/api/v1/approvals/",
+            params={"region": "Canada", "expires_before": today.isoformat()},
+            headers=auth_headers
+        )
+        assert [item["id"] for item in response.json()["items"]] == [overdue.id]
+        
+        assert await ApprovalExpiryService(db).sweep() == [overdue.id]
+        response = await client.get(f"/api/v1/approvals/{overdue.id}", headers=auth_headers)
+        assert response.json()["status"] == "expired"
+        
+        # Zweiter Lauf ändert nichts
+        assert await ApprovalExpiryService(db).sweep() == []
+    
+    @pytest.mark.asyncio
+    async def test_post_processing_is_queued_and_deduplicated(self, client: AsyncClient, auth_headers: dict, db: AsyncSession, test_data_source: DataSource):
+        """Test: Nachgelagerte Aufgaben landen dedupliziert in der dauerhaften Warteschlange"""
+        from app.services.approval_task_queue import ApprovalTaskQueue, TASK_POST_CREATE, TASK_POST_UPDATE
+        
+        # Anlage: Aufgabe wird mit der Zulassung committet
+        response = await client.post("/api/v1/approvals/", json={
+            "title": "Warteschlange Zulassung",
+            "approval_type": "fda_510k",
+            "status": "approved",
+            "region": "US",
+            "authority": "FDA",
+            "source_id": str(test_data_source.id)
+        }, headers=auth_headers)
+        assert response.status_code == 201
+        created = [task for task in await ApprovalTaskQueue(db).claim(1000, TASK_POST_CREATE) if task.approval_id == response.json()["id"]]
+        assert len(created) == 1
+        
+        # Validierungs-Score wurde mit der Anlage gespeichert
+        stored = await db.get(Approval, response.json()["id"], populate_existing=True)
+        assert stored.confidence_score == created[0].payload["score"]
+        
+        approval = await ApprovalFactory.create(db)
+        for title in ("Erste Änderung der Zulassung", "Zweite Änderung der Zulassung"):
+            response = await client.put(f"/api/v1/approvals/{approval.id}", json={"title": title}, headers=auth_headers)
+            assert response.status_code == 200
+        
+        # Zwei Änderungen, eine Aufgabe
+        queue = ApprovalTaskQueue(db)
+        tasks = [task for task in await queue.claim(1000, TASK_POST_UPDATE) if task.approval_id == approval.id]
+        assert len(tasks) == 1
+        assert tasks[0].generation == 1
+        assert tasks[0].payload["is_valid"] is True
+        
+        await queue.complete(tasks)
+        response = await client.get("/api/v1/approvals/tasks/stats", headers=auth_headers)
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_reports_failures_by_index(self, db: AsyncSession, test_data_source: DataSource, test_user: User):
+        """Test: Massen-INSERT liefert IDs in Eingabereihenfolge und Fehler pro Index"""
+        from app.services.approval_bulk_service import ApprovalBulkService
+        
+        base_data = {
+            "title": "Bulk Zulassung",
+            "approval_type": "fda_510k",
+            "status": "approved",
+            "region": "US",
+            "authority": "FDA",
+            "decision_date": "2024-01-01",
+            "source_id": str(test_data_source.id)
+        }
+        records = [dict(base_data, reference_number=f"K{i:06d}") for i in range(25)]
+        records[3]["approval_type"] = "invalid_type"  # Fehler vor dem INSERT
+        records[17]["source_id"] = "00000000-0000-0000-0000-000000000000"  # Fremdschlüsselfehler
+        
+        result = await ApprovalBulkService(db, chunk_size=10).bulk_create(records, user_id=str(test_user.id))
+        
+        assert [failure["index"] for failure in result.failures] == [3, 17]
+        assert result.ids[3] is None and result.ids[17] is None
+        assert len(result.created_ids) == 23
+        
+        approval = await db.get(Approval, result.ids[5])
+        assert approval.reference_number == "K000005"
+        assert approval.created_by == str(test_user.id)
+    
     @pytest.mark.asyncio
     async def test_export_approvals_csv(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
         """Test: CSV-Export von Zulassungen"""
@@ -365,15 +824,36 @@ class TestApprovalAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
-        
-        assert "csv_data" in data
-        assert isinstance(data["csv_data"], str)
+        assert response.headers["content-type"].startswith("text/csv")
         
         # Überprüfe, dass CSV-Daten vorhanden sind
-        csv_content = data["csv_data"]
+        csv_content = response.text
         assert "title" in csv_content.lower()  # Header sollte enthalten sein
         assert "export test 1" in csv_content.lower()  # Daten sollten enthalten sein
+        assert "export test 2" not in csv_content.lower()  # Filter sollte greifen
+    
+    @pytest.mark.asyncio
+    async def test_export_approvals_csv_columns_and_gzip(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: CSV-Export mit Spaltenauswahl und gzip-Kompression"""
+        import gzip
+        
+        await ApprovalFactory.create(db, title="Export Test Gzip", region="US")
+        
+        response = await client.get(
+            "/api/v1/approvals/export/csv?columns=title,region&gzip=true",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        
+        lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+        assert lines[0] == "title,region"
+        assert "Export Test Gzip,US" in lines
+        
+        # Unbekannte Spalten werden abgelehnt
+        response = await client.get("/api/v1/approvals/export/csv?columns=title,unknown", headers=auth_headers)
+        assert response.status_code == 400
 
     @pytest.mark.asyncio
     async def test_unauthorized_access(self, client: AsyncClient):
@@ -396,6 +876,136 @@ class TestApprovalAPI:
         # Die meisten Anfragen sollten erfolgreich sein
         successful_responses = [r for r in responses if hasattr(r, 'status_code') and r.status_code == 200]
         assert len(successful_responses) >= 8  # Mindestens 80% sollten erfolgreich sein
+    
+    @pytest.mark.asyncio
+    async def test_admission_control_sheds_saturated_pool(self, client: AsyncClient, auth_headers: dict):
+        """Test: Ausgelastetes Export-Kontingent wird abgewiesen, Lesezugriffe nicht"""
+        from app.main import admission_controller
+        
+        pool = admission_controller.pools["export"]
+        queue_budget = pool.queue_budget
+        pool.queue_budget = 0.05
+        held = 0
+        try:
+            while pool.in_flight < pool.limit:
+                assert await pool.acquire()
+                held += 1
+            
+            response = await client.get("/api/v1/approvals/export/csv", headers=auth_headers)
+            assert response.status_code == 503
+            assert int(response.headers["retry-after"]) >= 1
+            
+            response = await client.get("/api/v1/approvals/", headers=auth_headers)
+            assert response.status_code == 200
+            
+            stats = (await client.get("/health/admission")).json()["pools"]["export"]
+            assert stats["saturation"] >= 1
+            assert stats["shed"] >= 1
+        finally:
+            for _ in range(held):
+                pool.release()
+            pool.queue_budget = queue_budget
+    
+    @pytest.mark.asyncio
+    async def test_list_response_compression(self, client: AsyncClient, auth_headers: dict, db: AsyncSession):
+        """Test: Ausgehandelte Kompression der Listenantwort mit gecachter Variante"""
+        from app.main import compressed_response_cache
+        
+        for i in range(30):
+            await ApprovalFactory.create(db, title=f"Compression Test {i}", description="Lorem ipsum " * 20)
+        
+        response = await client.get("/api/v1/approvals/", headers={**auth_headers, "Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert "accept-encoding" in response.headers["vary"].lower()
+        plain = response.json()
+        
+        hits = compressed_response_cache.hits
+        for _ in range(2):
+            response = await client.get("/api/v1/approvals/", headers={**auth_headers, "Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert response.headers["content-encoding"] == "gzip"
+            assert "accept-encoding" in response.headers["vary"].lower()
+            assert response.headers["etag"].startswith("W/")
+            assert response.json() == plain
+        
+        # Zweiter Abruf mit unverändertem Körper wird nicht erneut komprimiert
+        assert compressed_response_cache.hits == hits + 1
+        
+        # Bedingter Abruf mit dem schwachen ETag
+        response = await client.get(
+            "/api/v1/approvals/",
+            headers={**auth_headers, "Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]}
+        )
+        assert response.status_code == 304
+    
+    @pytest.mark.asyncio
+    async def test_readiness_before_background_warmup(self, client: AsyncClient):
+        """Test: Bereit nach kritischen Schritten, Warm-up läuft im Hintergrund weiter"""
+        from app.core.startup import StartupState, StartupStep
+        
+        warmup_release = asyncio.Event()
+        
+        async def critical_step():
+            await asyncio.sleep(0)
+        
+        state = StartupState()
+        await state.start([
+            StartupStep("database_schema", critical_step, timeout=1),
+            StartupStep("cache", critical_step, timeout=1),
+            StartupStep("data_sources", warmup_release.wait, timeout=5, critical=False)
+        ])
+        
+        status_before = state.get_status()
+        assert status_before["ready"] is True
+        assert status_before["warmup_complete"] is False
+        assert status_before["steps"]["database_schema"]["status"] == "ok"
+        
+        warmup_release.set()
+        await state.warmup
+        assert state.get_status()["warmup_complete"] is True
+        
+        await state.stop()
+        assert state.get_status()["ready"] is False
+        
+        # Liveness prüft keine Abhängigkeiten
+        response = await client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    @pytest.mark.asyncio
+    async def test_schema_check_accepts_init_sql(self):
+        """Test: Ein aus init.sql aufgebautes Schema besteht die Schema-Prüfung beim Start"""
+        from pathlib import Path
+        from sqlalchemy.engine import make_url
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from app.core.config import settings
+        from app.core.database import Base
+        from app.core.startup import check_schema_version
+        
+        url = make_url(settings.TEST_DATABASE_URL)
+        if url.get_backend_name() != "postgresql":
+            pytest.skip("init.sql requires PostgreSQL (TEST_DATABASE_URL)")
+        
+        # Nur der Schemateil; Stammdaten, Rollen und Rechte betreffen die Prüfung nicht
+        init_sql = (Path(__file__).resolve().parents[1] / "init.sql").read_text()
+        schema_sql = init_sql.split("-- Insert initial data sources")[0]
+        
+        engine = create_async_engine(url.set(drivername="postgresql+asyncpg"))
+        try:
+            async with engine.connect() as conn:
+                # Eigenes Schema, damit Typen und Tabellen der Testdatenbank unberührt bleiben
+                raw = (await conn.get_raw_connection()).driver_connection
+                await raw.execute("DROP SCHEMA IF EXISTS init_sql_check CASCADE; CREATE SCHEMA init_sql_check")
+                await raw.execute("SET search_path TO init_sql_check, public")
+                try:
+                    await raw.execute(schema_sql)
+                    await conn.run_sync(check_schema_version, Base.metadata, "missing-alembic.ini")
+                finally:
+                    await conn.rollback()
+                    await raw.execute("DROP SCHEMA IF EXISTS init_sql_check CASCADE")
+        finally:
+            await engine.dispose()
 
 class TestApprovalValidation:
     """Test-Klasse für Datenvalidierung"""
@@ -484,6 +1094,260 @@ class TestApprovalValidation:
         assert stats["invalid_items"] >= 1
         assert stats["success_rate"] >= 0.6
 
+    @pytest.mark.asyncio
+    async def test_validation_plan_shared_and_invalidated(self):
+        """Test: Kompilierte Validierungspläne werden geteilt und bei Regeländerung verworfen"""
+        from app.core.validation import DataValidator, ValidationLevel, ValidationPlanRegistry, default_validation_rules
+        
+        registry = ValidationPlanRegistry()
+        first = DataValidator(ValidationLevel.STRICT, plans=registry)
+        second = DataValidator(ValidationLevel.STRICT, plans=registry)
+        
+        assert first.get_plan() is second.get_plan()
+        assert first.get_plan() is not DataValidator(ValidationLevel.LENIENT, plans=registry).get_plan()
+        
+        rules = default_validation_rules()
+        rules["approval"]["enums"]["priority"].append("urgent")
+        registry.set_rules(rules)
+        
+        plan = first.get_plan()
+        assert plan.version == registry.version == 1
+        assert "urgent" in plan.enums["priority"]
+        
+        result = await first.validate_approval({
+            "title": "Valid Test Approval",
+            "approval_type": "fda_510k",
+            "status": "approved",
+            "region": "US",
+            "authority": "FDA",
+            "priority": "urgent",
+            "decision_date": "2024-02-01"
+        })
+        assert not any("priority" in error for error in result.errors)
+
+    @pytest.mark.asyncio
+    async def test_batch_validation_columnar_matches_row_wise(self):
+        """Test: Spaltenweise Batch-Validierung liefert dieselben Ergebnisse wie die zeilenweise"""
+        from app.core.validation import DataValidator, BatchValidator, ValidationLevel
+        
+        batch_validator = BatchValidator(DataValidator(ValidationLevel.STRICT))
+        
+        batch_data = [
+            {
+                "title": "Valid Approval 1",
+                "approval_type": "fda_510k",
+                "status": "approved",
+                "region": "US",
+                "authority": "FDA",
+                "reference_number": "K123456",
+                "submitted_date": "2024-03-01",
+                "decision_date": "2024-02-01"
+            },
+            {
+                "title": "Valid Approval 2",
+                "approval_type": "ce_mark",
+                "status": "pending",
+                "region": "EU",
+                "authority": "TGA",
+                "source_url": "not-a-url",
+                "tags": "{invalid json"
+            },
+            {
+                "title": "",
+                "approval_type": "invalid_type",
+                "status": "invalid_status",
+                "reference_number": "bad ref!"
+            },
+            {
+                "title": "Unhashable region value",
+                "approval_type": "mdr",
+                "status": "approved",
+                "region": ["EU"],
+                "authority": "EMA"
+            },
+            {}
+        ]
+        
+        row_wise = await batch_validator.validate_batch(batch_data, columnar=False)
+        columnar = await batch_validator.validate_batch(batch_data, columnar=True)
+        
+        assert list(columnar.keys()) == list(row_wise.keys())
+        for key, result in row_wise.items():
+            assert columnar[key].model_dump() == result.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_batch_validation_parallel_preserves_order(self):
+        """Test: Parallele Batch-Validierung liefert Ergebnisse in Eingabereihenfolge"""
+        from app.core.validation import DataValidator, BatchValidator, ValidationLevel, shutdown_validation_pool
+        
+        validator = DataValidator(ValidationLevel.STRICT)
+        batch_data = [
+            {
+                "title": f"Parallel Test Approval {i}",
+                "approval_type": "fda_510k" if i % 3 else "invalid_type",
+                "status": "approved",
+                "region": "US",
+                "authority": "FDA",
+                "decision_date": "2024-02-01"
+            }
+            for i in range(25)
+        ]
+        
+        sequential = await BatchValidator(validator).validate_batch(batch_data)
+        parallel_validator = BatchValidator(validator, parallel_threshold=10, chunk_size=4, max_workers=2)
+        try:
+            streamed = [index async for index, _ in parallel_validator.iter_batch_parallel(batch_data)]
+            parallel = await parallel_validator.validate_batch(batch_data)
+        finally:
+            shutdown_validation_pool()
+        
+        assert streamed == list(range(25))
+        assert list(parallel.keys()) == list(sequential.keys())
+        for key, result in sequential.items():
+            assert parallel[key].model_dump() == result.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_validate_stream_with_online_statistics(self):
+        """Test: Stream-Validierung mit inkrementell berechneter Statistik"""
+        from app.core.validation import DataValidator, BatchValidator, BatchStatistics, ValidationLevel
+        
+        batch_data = [
+            {
+                "title": f"Streamed Test Approval {i}",
+                "approval_type": "fda_510k" if i % 4 else "invalid_type",
+                "status": "pending",
+                "region": "US",
+                "authority": "FDA"
+            }
+            for i in range(10)
+        ]
+        
+        async def source():
+            for data in batch_data:
+                yield data
+        
+        batch_validator = BatchValidator(DataValidator(ValidationLevel.STRICT), chunk_size=3)
+        statistics = BatchStatistics()
+        streamed = [item async for item in batch_validator.validate_stream(source(), statistics=statistics)]
+        
+        assert [index for index, _ in streamed] == list(range(10))
+        
+        expected = await batch_validator.get_batch_statistics(await batch_validator.validate_batch(batch_data))
+        assert statistics.to_dict() == expected
+        assert statistics.to_dict()["invalid_items"] == 3
+        assert statistics.to_dict()["common_errors"][0] == ("Invalid value for 'approval_type': invalid_type", 3)
+
+    @pytest.mark.asyncio
+    async def test_validation_result_cache(self):
+        """Test: Unveränderte Datensätze werden aus dem Validierungs-Cache beantwortet"""
+        from app.core.validation import DataValidator, BatchValidator, ValidationLevel, ValidationPlanRegistry
+        from app.core.validation_cache import ValidationResultCache
+        
+        cache = ValidationResultCache(max_size=10, ttl=60)
+        plans = ValidationPlanRegistry()
+        validator = DataValidator(ValidationLevel.STRICT, plans=plans, cache=cache)
+        data = {
+            "title": "Cached Test Approval",
+            "approval_type": "fda_510k",
+            "status": "pending",
+            "region": "US",
+            "authority": "FDA"
+        }
+        
+        first = await validator.validate_approval(data)
+        first.errors.append("mutated by caller")
+        second = await validator.validate_approval(dict(data))
+        
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+        assert second.errors == []
+        
+        # Batch-Validierung nutzt denselben Cache (zeilen- und spaltenweise)
+        batch_validator = BatchValidator(validator)
+        await batch_validator.validate_batch([data, data], columnar=False)
+        await batch_validator.validate_batch([data, {**data, "status": "approved"}], columnar=True)
+        assert cache.get_stats()["hits"] == 4
+        
+        # Geänderte Regeln ergeben neue Schlüssel
+        plans.invalidate()
+        await validator.validate_approval(data)
+        assert cache.get_stats()["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_incremental_revalidation_uses_stored_values(self):
+        """Test: Teilaktualisierung wird gegen den gespeicherten Datensatz validiert"""
+        from app.core.validation import DataValidator, ValidationLevel
+        
+        validator = DataValidator(ValidationLevel.STRICT)
+        stored = {
+            "title": "Stored Test Approval",
+            "approval_type": "fda_510k",
+            "status": "submitted",
+            "region": "US",
+            "authority": "FDA",
+            "submitted_date": "2024-03-01"
+        }
+        stored_result = await validator.validate_approval(stored)
+        
+        # Datumsreihenfolge benötigt das gespeicherte submitted_date
+        result = validator.revalidate_approval(stored, {"decision_date": "2024-02-01"}, stored_result.score)
+        full = await validator.validate_approval({**stored, "decision_date": "2024-02-01"})
+        assert result.warnings == ["Submitted date is after decision date"]
+        assert result.score == pytest.approx(full.score)
+        
+        # Score der nicht betroffenen Prüfungen wird übernommen
+        result = validator.revalidate_approval(stored, {"status": "pending"}, stored_result.score)
+        assert result.is_valid
+        assert result.score == stored_result.score
+        
+        # Nur betroffene Prüfungen laufen
+        affected = validator.get_plan().affected_checks({"status"})
+        assert {check.name for check in affected} == {"required:status", "enum:status", "approved_decision_date"}
+        
+        result = validator.revalidate_approval(stored, {"status": "invalid_status"}, stored_result.score)
+        assert not result.is_valid
+        assert result.errors == ["Invalid value for 'status': invalid_status"]
+
+    @pytest.mark.asyncio
+    async def test_source_specific_validation_rules(self):
+        """Test: Quellspezifische Regeln werden pro (Quelle, updated_at) einmal kompiliert"""
+        from datetime import datetime, timezone
+        from app.core.source_rules import SourceRuleRegistry
+        from app.core.validation import DataValidator, BatchValidator, ValidationLevel, ValidationPlanRegistry
+        
+        plans = ValidationPlanRegistry()
+        registry = SourceRuleRegistry(plans)
+        updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        registry.register("source-1", updated_at, '{"required_fields": ["reference_number"], "enums": {"priority": null}}')
+        
+        plan = registry.get_plan("source-1", ValidationLevel.STRICT)
+        assert registry.get_plan("source-1", ValidationLevel.STRICT) is plan
+        assert registry.get_plan("unknown", ValidationLevel.STRICT) is plans.get_plan("approval", ValidationLevel.STRICT)
+        assert registry.is_current("source-1", updated_at)
+        assert not registry.is_current("source-1", datetime(2024, 2, 1, tzinfo=timezone.utc))
+        
+        base_data = {
+            "title": "Source Specific Approval",
+            "approval_type": "fda_510k",
+            "status": "submitted",
+            "region": "US",
+            "authority": "FDA",
+            "priority": "urgent"
+        }
+        batch_validator = BatchValidator(DataValidator(ValidationLevel.STRICT, plans=plans))
+        results = await batch_validator.validate_batch_per_plan(
+            [{**base_data, "source_id": "source-1"}, {**base_data, "source_id": "other"}],
+            {"source-1": plan}
+        )
+        
+        # Quelle 1: Referenznummer Pflicht, Priorität frei; andere Quellen: Standardregeln
+        assert results["item_0"].errors == ["Required field 'reference_number' is missing or empty"]
+        assert results["item_1"].errors == ["Invalid value for 'priority': urgent"]
+        
+        # Fehlerhafte Regeln fallen auf den Standardplan zurück
+        registry.register("source-2", updated_at, {"field_patterns": {"title": "("}})
+        assert registry.get_plan("source-2", ValidationLevel.STRICT) is plans.get_plan("approval", ValidationLevel.STRICT)
+
 class TestApprovalIntegration:
     """Integrationstests für Approval-Funktionalität"""
 